@@ -1,22 +1,48 @@
-"""Control subsystem package."""
-
-from .config import Sampling, Speeds, Thresholds, Waypoints
-from .gesture import GestureDecoder, Intent
-from .runner import run_controller
-from .state_machine import ControllerEvent, State, SterilizationController
-from .utils import clamp
-
-__all__ = [
-    "Sampling",
-    "Speeds",
-    "Thresholds",
-    "Waypoints",
-    "GestureDecoder",
-    "Intent",
-    "run_controller",
-    "ControllerEvent",
-    "State",
-    "SterilizationController",
-    "clamp",
-]
+"""Control subsystem package.
 
+Exports resolve on first attribute access (PEP 562), so importing a single
+submodule such as ``control.config`` does not load the state machine.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .batch import BatchReport
+    from .config import Sampling, Speeds, Thresholds, Waypoints
+    from .gesture import GestureDecoder, Intent
+    from .runner import run_controller
+    from .state_machine import ControllerEvent, State, SterilizationController
+    from .utils import clamp
+
+_EXPORTS = {
+    "BatchReport": "batch",
+    "Sampling": "config",
+    "Speeds": "config",
+    "Thresholds": "config",
+    "Waypoints": "config",
+    "GestureDecoder": "gesture",
+    "Intent": "gesture",
+    "run_controller": "runner",
+    "ControllerEvent": "state_machine",
+    "State": "state_machine",
+    "SterilizationController": "state_machine",
+    "clamp": "utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,190 @@
+"""
+Shared-resource arbitration between arms working one autoclave.
+
+Arms lease the autoclave door, the autoclave slot and the transit corridor
+through a ``ResourceArbiter``. Acquisition is non-blocking so a waiting
+controller keeps ticking (and can still abort). Deadlock is avoided by
+construction: a request is granted all-or-nothing, and an owner may only
+request resources ranked after everything it already holds in
+``RESOURCE_ORDER``. Waiting requests are served by priority, then FIFO, and
+leases and queued requests expire if their owner stops renewing or polling
+them (e.g. a crashed cell).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import asdict, dataclass, field
+from itertools import count
+from time import monotonic
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+DOOR = "autoclave_door"
+SLOT = "autoclave_slot"
+TRANSIT = "transit_corridor"
+
+RESOURCE_ORDER: Tuple[str, ...] = (DOOR, SLOT, TRANSIT)
+
+
+@dataclass
+class Lease:
+    owner: str
+    resources: Tuple[str, ...]
+    granted_at: float
+    expires_at: float
+
+
+@dataclass
+class WaitStats:
+    requests: int = 0
+    contended: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+@dataclass
+class _Request:
+    owner: str
+    resources: Tuple[str, ...]
+    priority: int
+    seq: int
+    since: float
+    polled: float = 0.0
+
+    def sort_key(self) -> Tuple[int, int]:
+        return (-self.priority, self.seq)
+
+
+@dataclass
+class ResourceArbiter:
+    """Lease table for shared cell resources."""
+
+    resources: Sequence[str] = RESOURCE_ORDER
+    lease_s: float = 60.0
+    _holders: Dict[str, str] = field(default_factory=dict)
+    _expires: Dict[str, float] = field(default_factory=dict)
+    _waiting: Dict[str, _Request] = field(default_factory=dict)
+    _stats: Dict[str, WaitStats] = field(default_factory=dict)
+    _resource_stats: Dict[str, WaitStats] = field(default_factory=dict)
+    _seq: Iterator[int] = field(default_factory=count)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._rank = {name: idx for idx, name in enumerate(self.resources)}
+
+    def try_acquire(
+        self, owner: str, resources: Iterable[str], priority: int = 0
+    ) -> Optional[Lease]:
+        """Grant ``resources`` to ``owner`` now, or queue the request and return None."""
+        wanted = tuple(sorted(set(resources), key=self._rank_of))
+        now = monotonic()
+        with self._lock:
+            self._expire(now)
+            held = [r for r in self.resources if self._holders.get(r) == owner]
+            missing = tuple(r for r in wanted if r not in held)
+            if not missing:
+                return Lease(owner, wanted, now, self._expires[owner])
+            if held and self._rank_of(missing[0]) < self._rank_of(held[-1]):
+                raise ValueError(
+                    f"{owner}: requesting {missing[0]} while holding {held} violates resource order"
+                )
+            req = self._waiting.get(owner)
+            if req is None or req.resources != missing:
+                req = _Request(owner, missing, priority, next(self._seq), now)
+                self._waiting[owner] = req
+                self._owner_stats(owner).requests += 1
+            req.polled = now
+            if not self._grantable(req):
+                return None
+            del self._waiting[owner]
+            self._record_wait(owner, missing, now - req.since)
+            for r in missing:
+                self._holders[r] = owner
+            self._expires[owner] = now + self.lease_s
+            return Lease(owner, wanted, now, self._expires[owner])
+
+    def release(self, owner: str, resources: Optional[Iterable[str]] = None) -> None:
+        """Release some (or, with ``resources=None``, all) of ``owner``'s leases."""
+        with self._lock:
+            drop = set(resources) if resources is not None else None
+            for r, o in list(self._holders.items()):
+                if o == owner and (drop is None or r in drop):
+                    del self._holders[r]
+            if drop is None:
+                self._waiting.pop(owner, None)
+            if owner not in self._holders.values():
+                self._expires.pop(owner, None)
+
+    def renew(self, owner: str) -> None:
+        with self._lock:
+            if owner in self._expires:
+                self._expires[owner] = monotonic() + self.lease_s
+
+    def holds(self, owner: str, resources: Iterable[str]) -> bool:
+        with self._lock:
+            return all(self._holders.get(r) == owner for r in resources)
+
+    def holder(self, resource: str) -> Optional[str]:
+        with self._lock:
+            return self._holders.get(resource)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "holders": dict(self._holders),
+                "waiting": sorted(self._waiting),
+                "owners": {o: asdict(s) for o, s in self._stats.items()},
+                "resources": {r: asdict(s) for r, s in self._resource_stats.items()},
+                "total_wait_s": sum(s.total_wait_s for s in self._stats.values()),
+            }
+
+    def _grantable(self, req: _Request) -> bool:
+        for r in req.resources:
+            if r in self._holders:
+                return False
+            for other in self._waiting.values():
+                if (
+                    other is not req
+                    and r in other.resources
+                    and other.sort_key() < req.sort_key()
+                    and not self._blocked_by(other, req.owner)
+                ):
+                    return False
+        return True
+
+    def _blocked_by(self, req: _Request, owner: str) -> bool:
+        # A waiter needing something ``owner`` holds cannot go first; letting it
+        # block ``owner`` would deadlock the two.
+        return any(self._holders.get(r) == owner for r in req.resources)
+
+    def _expire(self, now: float) -> None:
+        for owner, expires in list(self._expires.items()):
+            if expires <= now:
+                del self._expires[owner]
+                for r, o in list(self._holders.items()):
+                    if o == owner:
+                        del self._holders[r]
+        for owner, req in list(self._waiting.items()):
+            if now - req.polled > self.lease_s:
+                del self._waiting[owner]
+
+    def _record_wait(self, owner: str, resources: Tuple[str, ...], waited: float) -> None:
+        stats = [self._owner_stats(owner)]
+        for r in resources:
+            rs = self._resource_stats.setdefault(r, WaitStats())
+            rs.requests += 1
+            stats.append(rs)
+        for s in stats:
+            if waited > 0:
+                s.contended += 1
+            s.total_wait_s += waited
+            s.max_wait_s = max(s.max_wait_s, waited)
+
+    def _owner_stats(self, owner: str) -> WaitStats:
+        return self._stats.setdefault(owner, WaitStats())
+
+    def _rank_of(self, resource: str) -> int:
+        try:
+            return self._rank[resource]
+        except KeyError:
+            raise ValueError(f"unknown resource {resource!r}") from None
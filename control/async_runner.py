@@ -0,0 +1,204 @@
+"""
+asyncio-native control loop.
+
+EMG acquisition, controller ticking, safety monitoring and telemetry run as
+separate tasks connected by bounded latest-wins queues, so a slow trace sink
+or EMG driver never stalls the tick. ``SterilizationController.tick`` still
+runs synchronously, on a dedicated worker thread, which keeps the event loop
+free to service async EMG/arm drivers while an arm command or grip dwell is
+in flight. Cancelling the runner always ends with ``arm.home()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any, Dict, Optional, Tuple
+
+from .config import Sampling
+from .runner import EventSink
+from .state_machine import State, SterilizationController
+
+LOGGER = logging.getLogger("musclemate.async")
+
+
+@dataclass
+class TaskStats:
+    runs: int = 0
+    busy_s: float = 0.0
+    max_s: float = 0.0
+
+    def observe(self, elapsed: float) -> None:
+        self.runs += 1
+        self.busy_s += elapsed
+        if elapsed > self.max_s:
+            self.max_s = elapsed
+
+
+@dataclass
+class AsyncRunStats:
+    tasks: Dict[str, TaskStats] = field(default_factory=dict)
+    dropped_samples: int = 0
+    dropped_events: int = 0
+    safety_aborts: int = 0
+
+    def task(self, name: str) -> TaskStats:
+        return self.tasks.setdefault(name, TaskStats())
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class SyncArmBridge:
+    """Expose an async arm driver to the synchronous controller thread."""
+
+    def __init__(self, arm: Any, loop: asyncio.AbstractEventLoop, timeout_s: float = 10.0) -> None:
+        self._arm = arm
+        self._loop = loop
+        self._timeout_s = timeout_s
+
+    def _call(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(self._timeout_s)
+
+    def move_pose(self, x, y, z, yaw=0.0, pitch=0.0, roll=0.0, speed=0.5) -> None:
+        self._call(self._arm.move_pose(x, y, z, yaw=yaw, pitch=pitch, roll=roll, speed=speed))
+
+    def open_gripper(self) -> None:
+        self._call(self._arm.open_gripper())
+
+    def close_gripper(self) -> None:
+        self._call(self._arm.close_gripper())
+
+    def home(self) -> None:
+        self._call(self._arm.home())
+
+    def read_pose(self) -> Tuple[float, float, float, float, float, float]:
+        return self._call(self._arm.read_pose())
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> bool:
+    """Enqueue ``item``, dropping the oldest entry when full; True if dropped."""
+    dropped = False
+    if queue.full():
+        queue.get_nowait()
+        dropped = True
+    queue.put_nowait(item)
+    return dropped
+
+
+async def run_controller_async(
+    controller: SterilizationController,
+    sampling: Sampling,
+    *,
+    event_sink: Optional[EventSink] = None,
+    queue_size: int = 8,
+    safety_hz: float = 100.0,
+) -> AsyncRunStats:
+    """
+    Run the controller for ``sampling.runtime_s`` as cooperating tasks.
+
+    Args:
+        controller: Configured SterilizationController; its ``emg`` and
+            ``arm`` may be sync or async implementations.
+        sampling: Loop timing configuration (acquisition runs at loop_hz).
+        event_sink: Optional sink receiving ControllerEvent outputs.
+        queue_size: Bound for the sample and event queues.
+        safety_hz: Poll rate of the safety monitor task.
+    """
+
+    loop = asyncio.get_running_loop()
+    stats = AsyncRunStats()
+    dt = 1.0 / max(1.0, sampling.loop_hz)
+    samples: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    events: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    abort_requested = asyncio.Event()
+    worker = ThreadPoolExecutor(1, thread_name_prefix="control")
+
+    async_arm = inspect.iscoroutinefunction(getattr(controller.arm, "home", None))
+    raw_arm = controller.arm
+    if async_arm:
+        controller.arm = SyncArmBridge(raw_arm, loop)
+    emg = controller.emg
+    async_emg = inspect.iscoroutinefunction(emg.read)
+
+    async def acquire() -> None:
+        st = stats.task("acquire")
+        while True:
+            t0 = perf_counter()
+            value = await emg.read() if async_emg else emg.read()
+            if _put_latest(samples, value):
+                stats.dropped_samples += 1
+            st.observe(perf_counter() - t0)
+            await asyncio.sleep(dt)
+
+    async def control() -> None:
+        st = stats.task("control")
+        while True:
+            sample = await samples.get()
+            while not samples.empty():
+                sample = samples.get_nowait()
+            t0 = perf_counter()
+            if abort_requested.is_set():
+                abort_requested.clear()
+                controller.state = State.ABORT
+            event = await loop.run_in_executor(worker, controller.tick, sample)
+            st.observe(perf_counter() - t0)
+            if event_sink is not None and event is not None and _put_latest(events, event):
+                stats.dropped_events += 1
+
+    async def monitor() -> None:
+        st = stats.task("safety")
+        safety = controller.safety
+        period = 1.0 / max(1.0, safety_hz)
+        was_allowed = True
+        while True:
+            t0 = perf_counter()
+            allowed = safety.motion_allowed()
+            if was_allowed and not allowed and controller.state not in (State.IDLE, State.ABORT):
+                LOGGER.warning("Safety monitor: motion blocked in %s; aborting", controller.state.name)
+                stats.safety_aborts += 1
+                abort_requested.set()
+            was_allowed = allowed
+            st.observe(perf_counter() - t0)
+            await asyncio.sleep(period)
+
+    async def telemetry() -> None:
+        st = stats.task("telemetry")
+        while True:
+            event = await events.get()
+            t0 = perf_counter()
+            event_sink.append(event)
+            st.observe(perf_counter() - t0)
+
+    coros = [acquire(), control()]
+    if controller.safety is not None:
+        coros.append(monitor())
+    if event_sink is not None:
+        coros.append(telemetry())
+    tasks = [asyncio.ensure_future(c) for c in coros]
+
+    try:
+        done, _ = await asyncio.wait(
+            tasks, timeout=sampling.runtime_s, return_when=asyncio.FIRST_EXCEPTION
+        )
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError, Exception):
+                await task
+        while event_sink is not None and not events.empty():
+            event_sink.append(events.get_nowait())
+        try:
+            await loop.run_in_executor(worker, controller.arm.home)
+        finally:
+            controller.arm = raw_arm
+            worker.shutdown(wait=False)
+    return stats
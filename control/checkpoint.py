@@ -0,0 +1,196 @@
+"""
+Controller checkpoints for fast crash recovery.
+
+The control thread only builds a small dict snapshot (at most once per
+``interval_s``, or immediately on a state change); a background thread
+serializes it and replaces the checkpoint file atomically, so a crash never
+leaves a torn file and the tick never waits on disk I/O.
+
+Resuming maps the saved state to the nearest state that is safe to re-enter
+(``RESUME_STATE``): motion states re-issue their move, gesture presses in
+progress are dropped, duty-cycle history is carried across the downtime
+(which counts as a break: the continuous-runtime session restarts), a resume
+to IDLE drops any batch in progress, and a latched safety fault stays latched
+and resumes through ABORT (home). Only a normal end of the control loop is
+recorded as a clean shutdown.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from time import monotonic, time
+from typing import Any, Dict, Optional
+
+from .state_machine import State, SterilizationController
+
+LOGGER = logging.getLogger("musclemate.checkpoint")
+
+CHECKPOINT_VERSION = 1
+
+RESUME_STATE: Dict[State, State] = {
+    State.IDLE: State.IDLE,
+    State.SELECT_BIN: State.SELECT_BIN,
+    State.APPROACH: State.APPROACH,
+    State.GRIP: State.APPROACH,
+    State.LIFT: State.LIFT,
+    State.TRANSIT: State.TRANSIT,
+    State.OPEN_AUTOCLAVE: State.OPEN_AUTOCLAVE,
+    State.PLACE: State.OPEN_AUTOCLAVE,
+    State.CLOSE_AUTOCLAVE: State.CLOSE_AUTOCLAVE,
+    State.HOME: State.HOME,
+    State.ABORT: State.ABORT,
+}
+
+
+def capture(controller: SterilizationController, *, clean_shutdown: bool = False) -> Dict[str, Any]:
+    """Snapshot controller, decoder and supervisor state (control thread)."""
+    now = monotonic()
+    snap: Dict[str, Any] = {
+        "version": CHECKPOINT_VERSION,
+        "wall_ts": time(),
+        "clean_shutdown": clean_shutdown,
+        "controller": {
+            "state": controller.state.name,
+            "selected_bin": controller.selected_bin,
+            "door_open": controller.door_open,
+            "last_grip_closed": controller._last_grip_action_close,
+            "batch_queue": list(controller._batch_queue),
+            "batch_plan": list(controller._batch_plan),
+            "batch_order": list(controller._batch_order),
+            "door_cycles": controller._door_cycles,
+        },
+        "decoder": {"last_intent_time": controller.decoder._last_intent_time},
+    }
+    safety = controller.safety
+    if safety is not None:
+        snap["safety"] = {
+            "fault_latched": safety._fault_latched,
+            "last_fault": safety._last_fault,
+            "cycle_ages_s": [now - t for t in safety.duty._cycle_times],
+            "session_age_s": now - safety.duty._session_start,
+        }
+    return snap
+
+
+def write_atomic(path: Path, snapshot: Dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(snapshot, fh, separators=(",", ":"))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            snap = json.load(fh)
+    except FileNotFoundError:
+        return None
+    if snap.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {snap.get('version')!r}")
+    return snap
+
+
+def restore(controller: SterilizationController, snapshot: Dict[str, Any]) -> State:
+    """Apply ``snapshot`` to a freshly built controller; return the resume state."""
+    downtime = max(0.0, time() - snapshot["wall_ts"])
+    c = snapshot["controller"]
+    saved = State[c["state"]]
+    resume = State.IDLE if snapshot.get("clean_shutdown") else RESUME_STATE[saved]
+
+    controller.selected_bin = c["selected_bin"] % len(controller.waypoints.bins)
+    if resume is not State.IDLE:
+        controller.door_open = c["door_open"]
+        controller._batch_queue = list(c["batch_queue"])
+        controller._batch_plan = list(c["batch_plan"])
+        controller._batch_order = tuple(c["batch_order"])
+    controller._door_cycles = c["door_cycles"]
+    controller.decoder._last_intent_time = snapshot["decoder"]["last_intent_time"]
+
+    safety = controller.safety
+    if safety is not None and "safety" in snapshot:
+        s = snapshot["safety"]
+        now = monotonic()
+        safety.duty._cycle_times = [now - age - downtime for age in s["cycle_ages_s"]]
+        safety.duty.start_session()
+        if s["fault_latched"]:
+            safety._fault_latched = True
+            safety._last_fault = s["last_fault"]
+            resume = State.ABORT
+
+    carrying = c["last_grip_closed"] and resume not in (State.IDLE, State.ABORT)
+    if carrying:
+        # Still holding an instrument: re-assert the grip before moving on.
+        controller.grip(close=True)
+    controller._last_grip_action_close = carrying
+    controller.state = resume
+    LOGGER.info(
+        "Resumed checkpoint: saved %s -> %s after %.1f s downtime", saved.name, resume.name, downtime
+    )
+    return resume
+
+
+class Checkpointer:
+    """Periodic checkpoints written off the control thread."""
+
+    def __init__(self, path: Path, interval_s: float = 1.0) -> None:
+        self.path = Path(path)
+        self.interval_s = interval_s
+        self.writes = 0
+        self._pending: Optional[Dict[str, Any]] = None
+        self._last_capture = float("-inf")
+        self._last_state: Optional[State] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Checkpointer":
+        self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+        self._thread.start()
+        return self
+
+    def offer(self, controller: SterilizationController) -> None:
+        """Called after each tick; snapshots only when due or the state changed."""
+        now = monotonic()
+        if controller.state is self._last_state and now - self._last_capture < self.interval_s:
+            return
+        self._last_capture = now
+        self._last_state = controller.state
+        snap = capture(controller)
+        with self._lock:
+            self._pending = snap
+        self._wake.set()
+
+    def close(self, controller: Optional[SterilizationController] = None) -> None:
+        """Stop the writer; with ``controller``, write a final clean-shutdown checkpoint."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if controller is not None:
+            with self._lock:
+                self._pending = capture(controller, clean_shutdown=True)
+        self._flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            snap, self._pending = self._pending, None
+        if snap is None:
+            return
+        try:
+            write_atomic(self.path, snap)
+            self.writes += 1
+        except OSError as exc:
+            LOGGER.error("Checkpoint write failed: %s", exc)
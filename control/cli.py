@@ -1,27 +1,73 @@
 """
 Command line entry point for MuscleMate.
+
+Only argparse and the config dataclasses load at import time; the state
+machine, runner, adapters, ``sim`` and tracing are imported when ``main``
+needs them, so ``--help`` and service restarts after a fault stay fast.
 """
 
 from __future__ import annotations
 
+import sys
+from time import perf_counter, process_time
+
+# Taken before the remaining imports so the first StartupReport covers loading this module.
+_IMPORT_MARK: "Optional[Tuple[float, int]]" = (perf_counter(), len(sys.modules))
+
 import argparse
 import logging
 from contextlib import suppress
 from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from .config import Sampling, Speeds, Thresholds, Waypoints
-from .runner import run_controller
-from .state_machine import SterilizationController
-from .trace import TraceWriter
-from hardware.adapters import BenchRigAdapter, IntegrationRigAdapter
-from hardware.safeguarded_arm import SafeguardedArm
-from sim import scripted_cycle
+from .config import Sampling, Speeds, Thresholds, Waypoints, cycle_points
+
+if TYPE_CHECKING:
+    from .state_machine import SterilizationController
+    from .trace import TraceWriter
 
 LOGGER = logging.getLogger("musclemate")
 
 
+class StartupReport:
+    """
+    Wall time and newly imported modules per startup phase.
+
+    The first report in a process starts from when ``control.cli`` began
+    loading, so its ``import`` phase is the module's own import cost; later
+    reports (``main`` called again in-process) start at construction.
+    """
+
+    def __init__(self) -> None:
+        global _IMPORT_MARK
+        start, modules = _IMPORT_MARK or (perf_counter(), len(sys.modules))
+        _IMPORT_MARK = None
+        self.phases: List[Tuple[str, float, int]] = []
+        self._t0 = self._mark = start
+        self._modules = modules
+        self.phase("import")
+
+    def phase(self, name: str) -> None:
+        now = perf_counter()
+        modules = len(sys.modules)
+        self.phases.append((name, now - self._mark, modules - self._modules))
+        self._mark = now
+        self._modules = modules
+
+    @property
+    def total_s(self) -> float:
+        return self._mark - self._t0
+
+    def render(self) -> str:
+        lines = [f"{'phase':<12} {'ms':>8} {'modules':>8}"]
+        for name, seconds, modules in self.phases:
+            lines.append(f"{name:<12} {1e3 * seconds:8.1f} {modules:8d}")
+        lines.append(f"{'total':<12} {1e3 * self.total_s:8.1f} {len(sys.modules):8d} loaded")
+        lines.append(f"process CPU {1e3 * process_time():.1f} ms (interpreter, imports and init)")
+        return "\n".join(lines)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="musclemate",
@@ -29,6 +75,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--runtime", type=float, default=Sampling().runtime_s)
     parser.add_argument("--loop-rate", type=float, default=Sampling().loop_hz)
+    parser.add_argument(
+        "--idle-rate",
+        type=float,
+        default=Sampling().idle_hz,
+        help="Drop to this loop rate (Hz) while IDLE at rest; 0 keeps the full rate.",
+    )
     parser.add_argument("--emg-on", type=float, default=Thresholds().emg_on)
     parser.add_argument("--emg-off", type=float, default=Thresholds().emg_off)
     parser.add_argument("--deadband", type=float, default=Thresholds().deadband)
@@ -40,16 +92,54 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Use scripted EMG inputs to demonstrate a full cycle.",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Batch mode: co-contract in SELECT_BIN to queue bins for one autoclave load.",
+    )
+    parser.add_argument(
+        "--cells",
+        type=int,
+        default=1,
+        help="Run N independent cells concurrently (fleet soak testing).",
+    )
+    parser.add_argument(
+        "--shared-autoclave",
+        action="store_true",
+        help="Fleet cells share one autoclave door/slot and transit corridor.",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run acquisition, control, safety and telemetry as asyncio tasks.",
+    )
+    parser.add_argument(
+        "--emit-on-change",
+        action="store_true",
+        help="Only trace ticks where state, intent, bin, door or grip changed.",
+    )
     parser.add_argument(
         "--adapter",
-        choices=["stub", "bench", "integration"],
+        choices=["stub", "bench", "integration", "tcp"],
         default="stub",
-        help="Hardware adapter: bench commissioning or integration rig.",
+        help="Hardware adapter: bench commissioning, integration rig, or TCP rig (see --rig-address).",
+    )
+    parser.add_argument(
+        "--rig-address",
+        default="127.0.0.1:7700",
+        help="HOST:PORT of the TCP rig for --adapter tcp (scripts/rig_server.py stands in).",
     )
     parser.add_argument(
         "--signoff-id",
         default="",
-        help="Bench sign-off id (required for --adapter integration).",
+        help="Bench sign-off id (required for --adapter integration and tcp).",
+    )
+    parser.add_argument(
+        "--signoff-report",
+        type=Path,
+        default=None,
+        help="Signed report from scripts/bench_commission.py; verified before --adapter integration/tcp connects.",
     )
     parser.add_argument(
         "--trace",
@@ -57,6 +147,106 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Append JSONL digital-twin trace (state, safety, intents).",
     )
+    parser.add_argument(
+        "--motion-log",
+        type=Path,
+        default=None,
+        help="Stream the arm's motion audit log to this JSONL file (else into --trace as motion rows).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Write periodic crash-recovery checkpoints to this file.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Restore controller/safety state from --checkpoint before running.",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="Record every EMG sample and interlock change for deterministic replay.",
+    )
+    parser.add_argument(
+        "--watchdog",
+        action="store_true",
+        help="Monitor loop heartbeats; escalate log -> shed trace -> inhibit cycles -> fault + home.",
+    )
+    parser.add_argument(
+        "--shm-emg",
+        action="store_true",
+        help="Acquire EMG in a separate process over a shared-memory ring (trips safety if it stalls).",
+    )
+    parser.add_argument(
+        "--operator",
+        default="",
+        help="Load this operator's calibration profile (see scripts/calibrate_operator.py).",
+    )
+    parser.add_argument(
+        "--profiles-dir",
+        type=Path,
+        default=Path("operator_profiles"),
+        help="Directory of operator profiles for --operator.",
+    )
+    parser.add_argument(
+        "--sequence",
+        default="",
+        help="Run the library motion sequence name[@version] on the adapter instead of the EMG loop.",
+    )
+    parser.add_argument(
+        "--sequence-dir",
+        type=Path,
+        action="append",
+        default=[],
+        help="Additional sequence library directory for --sequence (repeatable).",
+    )
+    parser.add_argument(
+        "--workspace",
+        action="store_true",
+        help="Check waypoints at startup and every arm move against the cached reach/keep-out grid.",
+    )
+    parser.add_argument(
+        "--config-file",
+        type=Path,
+        default=None,
+        help="Watch this JSON file and apply threshold/speed/waypoint changes live (IDLE/SELECT_BIN only).",
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="Freeze startup objects, defer GC to IDLE gaps and count allocations per tick.",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        default="",
+        help="With --realtime, pin the process to these CPUs (comma-separated, Linux only).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Time each tick stage and dump the histograms (JSON) to this file at exit.",
+    )
+    parser.add_argument(
+        "--profile-sample",
+        type=int,
+        default=1,
+        help="With --profile, time only every Nth tick.",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print per-phase import/initialization timing before the loop starts.",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -65,20 +255,94 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def resolve_adapter(name: str, signoff_id: str):
+def resolve_adapter(name: str, signoff_id: str, rig_address: str = "", signoff_report: Optional[Path] = None):
     if name == "bench":
+        from hardware.adapters import BenchRigAdapter
+
         return BenchRigAdapter()
     if name == "integration":
+        from hardware.adapters import IntegrationRigAdapter
+
         adapter = IntegrationRigAdapter()
-        sid = signoff_id or "BENCH-UNSPECIFIED"
-        adapter.set_bench_signoff(sid)
-        return adapter
-    return None
+    elif name == "tcp":
+        from hardware.adapters import TcpRigAdapter
+
+        host, _, port = rig_address.rpartition(":")
+        adapter = TcpRigAdapter(host or "127.0.0.1", int(port))
+    else:
+        return None
+    if signoff_report is not None:
+        import json
+
+        report = json.loads(signoff_report.read_text(encoding="utf-8"))
+        adapter.set_bench_signoff(signoff_id or report.get("signoff_id", ""), report)
+    else:
+        adapter.set_bench_signoff(signoff_id or "BENCH-UNSPECIFIED")
+    return adapter
+
+
+# Options the fleet runner does not wire up; rejected rather than silently dropped.
+FLEET_UNSUPPORTED = (
+    "--async",
+    "--idle-rate",
+    "--record",
+    "--checkpoint",
+    "--resume",
+    "--metrics-port",
+    "--profile",
+    "--watchdog",
+    "--config-file",
+    "--realtime",
+    "--shm-emg",
+    "--startup-report",
+    "--operator",
+    "--motion-log",
+)
+
+
+# The asyncio runner has no adaptive idle rate, checkpoint, metrics, watchdog, live-config
+# or real-time hooks.
+ASYNC_UNSUPPORTED = (
+    "--idle-rate",
+    "--checkpoint",
+    "--metrics-port",
+    "--watchdog",
+    "--config-file",
+    "--realtime",
+    "--pin-cpus",
+)
+
+
+# Options whose ``dest`` is not argparse's default spelling of the flag.
+OPTION_DESTS = {"--async": "use_async"}
+
+
+def reject_options(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, mode: str, options: Tuple[str, ...]
+) -> None:
+    """``parser.error`` if any of ``options`` was given a non-default value in ``mode``."""
+    given = []
+    for option in options:
+        dest = OPTION_DESTS.get(option, option.lstrip("-").replace("-", "_"))
+        if getattr(args, dest) != parser.get_default(dest):
+            given.append(option)
+    if given:
+        parser.error(f"{', '.join(given)} not supported with {mode}")
 
 
 def main(argv: Optional[list[str]] = None) -> int:
+    startup = StartupReport()
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.cells > 1:
+        reject_options(parser, args, "--cells > 1", FLEET_UNSUPPORTED)
+    if args.use_async:
+        reject_options(parser, args, "--async", ASYNC_UNSUPPORTED)
+    if args.pin_cpus and not args.realtime:
+        parser.error("--pin-cpus requires --realtime")
+    startup.phase("parse")
 
     logging.basicConfig(level=getattr(logging, args.log_level.upper()))
 
@@ -91,15 +355,230 @@ def main(argv: Optional[list[str]] = None) -> int:
         cooldown_s=args.cooldown,
         longpress_s=args.longpress,
     )
-    sampling = replace(Sampling(), runtime_s=args.runtime, loop_hz=args.loop_rate)
+    sampling = replace(Sampling(), runtime_s=args.runtime, loop_hz=args.loop_rate, idle_hz=args.idle_rate)
+
+    if args.sequence:
+        return run_named_sequence(args, parser)
+
+    trace = None
+    if args.trace:
+        from .trace import TraceWriter
+
+        # Payloads are serialized on the loop thread; only encoding and I/O move off it.
+        trace = TraceWriter(args.trace, background=True)
+
+    if args.cells > 1:
+        return run_fleet(args, thresholds, trace)
+
+    from .runner import run_controller
+
+    controller = build_controller(args, thresholds)
+    if args.operator:
+        from .profiles import ProfileStore, switch_operator
+
+        try:
+            profile = switch_operator(controller, ProfileStore(args.profiles_dir), args.operator)
+        except KeyError:
+            parser.error(f"no profile for operator {args.operator!r} in {args.profiles_dir}")
+        thresholds = profile.thresholds if profile is not None else thresholds
+    startup.phase("controller")
+    arm = controller.arm
+    sink = TraceSink(trace, controller.safety) if trace else None
+    motion_log, motion_sink = attach_motion_sink(arm, args.motion_log, trace)
+    checkpointer = metrics = metrics_server = watchdog = config = realtime = None
+    producer = recorder = None
+    completed = False
+    try:
+        # Inside the try: a later setup failure must still stop every service started before it.
+        if args.checkpoint:
+            from .checkpoint import Checkpointer, load_checkpoint, restore
+
+            if args.resume:
+                # Restoring may re-grip a carried instrument: a SafetyFault here still homes.
+                snapshot = load_checkpoint(args.checkpoint)
+                if snapshot is None:
+                    LOGGER.warning("No checkpoint at %s; starting fresh.", args.checkpoint)
+                else:
+                    restore(controller, snapshot)
+            checkpointer = Checkpointer(args.checkpoint).start()
+        if args.profile:
+            from .instrumentation import TickProfiler
+
+            controller.profiler = TickProfiler(sample_every=args.profile_sample)
+        if args.metrics_port is not None:
+            from .metrics import ControllerMetrics, MetricsServer
+
+            metrics = ControllerMetrics(controller, trace=trace)
+            metrics_server = MetricsServer(metrics, port=args.metrics_port).start()
+        if args.watchdog:
+            from .watchdog import Watchdog
+
+            watchdog = Watchdog(controller, 1.0 / max(1.0, sampling.loop_hz)).start()
+        if args.config_file:
+            from .live_config import ConfigWatcher
+
+            config = ConfigWatcher(
+                args.config_file,
+                thresholds=thresholds,
+                speeds=controller.speeds,
+                waypoints=controller.waypoints,
+                workspace=getattr(controller.arm, "workspace", None),
+                trace=trace,
+            ).start()
+        if args.realtime:
+            from .realtime import RealtimeMode
+
+            cpus = [int(c) for c in args.pin_cpus.split(",") if c.strip()] or None
+            realtime = RealtimeMode(controller, cpus=cpus, track_allocations=True)
+        if args.shm_emg:
+            from hardware.shm_emg import EMGProducer, SharedMemoryEMGReader
+
+            producer = EMGProducer()
+            producer.start()
+            controller.emg = SharedMemoryEMGReader(producer.ring, safety=controller.safety)
+        if args.record:
+            from sim.replay import RecordingEMGReader, SessionRecorder
+
+            recorder = SessionRecorder(args.record)
+            controller.emg = RecordingEMGReader(controller.emg, recorder, controller.safety, controller=controller)
+        startup.phase("services")
+        if args.startup_report:
+            print(startup.render(), file=sys.stderr)
+
+        if args.use_async:
+            import asyncio
+
+            from .async_runner import run_controller_async
+
+            stats = asyncio.run(run_controller_async(controller, sampling, event_sink=sink))
+            for name, task in stats.tasks.items():
+                LOGGER.info(
+                    "Task %s: %d runs, %.3f ms mean, %.3f ms max",
+                    name,
+                    task.runs,
+                    1e3 * task.busy_s / max(1, task.runs),
+                    1e3 * task.max_s,
+                )
+        else:
+            if realtime is not None:
+                realtime.start()
+            loop = run_controller(
+                controller,
+                sampling,
+                event_sink=sink,
+                checkpointer=checkpointer,
+                metrics=metrics,
+                watchdog=watchdog,
+                realtime=realtime,
+                config=config,
+            )
+            if sampling.idle_hz > 0:
+                LOGGER.info(
+                    "Adaptive loop: %d ticks (%d idle), %.0f%% of full-rate ticks skipped, "
+                    "%.2f s CPU, %d wake(s), worst wake latency %.0f ms",
+                    loop.ticks,
+                    loop.idle_ticks,
+                    100 * loop.tick_savings,
+                    loop.cpu_s,
+                    loop.wakes,
+                    1e3 * loop.worst_wake_latency_s,
+                )
+        completed = True
+    except KeyboardInterrupt:
+        LOGGER.info("Interrupted by user.")
+    finally:
+        # Stopped first: teardown blocks (producer join, homing) are not loop stalls.
+        if watchdog is not None:
+            watchdog.stop()
+            if watchdog.overruns:
+                worst = max(watchdog.overruns, key=lambda o: o.duration_s)
+                LOGGER.warning(
+                    "Watchdog: %d overrun(s), worst %.0f ms in %s, escalations %s",
+                    len(watchdog.overruns),
+                    1e3 * worst.duration_s,
+                    worst.state,
+                    watchdog.escalations,
+                )
+        with suppress(Exception):
+            arm.home()
+        if motion_log is not None:
+            try:
+                motion_log.export(motion_log.spill)
+            except Exception as exc:
+                LOGGER.warning("Motion log: %d record(s) not exported: %s", len(motion_log), exc)
+            if motion_sink is not None:
+                motion_sink.close()
+            LOGGER.info(
+                "Motion log: %d record(s), %d dropped, %d failed spill(s)",
+                motion_log.total,
+                motion_log.dropped,
+                motion_log.spill_failures,
+            )
+        if checkpointer is not None:
+            # A fault or interrupt leaves the last mid-cycle checkpoint to resume from.
+            checkpointer.close(controller if completed else None)
+        if producer is not None:
+            producer.stop()
+        if config is not None:
+            config.stop()
+            LOGGER.info("Live config: %d applied, %d rejected", config.applied, len(config.rejected))
+        if realtime is not None:
+            realtime.stop()
+            rt = realtime.stats
+            LOGGER.info(
+                "Real-time: %d ticks, %d allocating (max %d blocks), %d idle + %d full + %d forced GC, "
+                "max pause %.2f ms",
+                rt.ticks,
+                rt.alloc_ticks,
+                rt.alloc_blocks_max,
+                rt.idle_collections,
+                rt.full_collections,
+                rt.forced_collections,
+                1e3 * rt.gc_max_s,
+            )
+        if metrics_server is not None:
+            metrics_server.close()
+        if recorder is not None:
+            recorder.close()
+            LOGGER.info("Recorded %d samples to %s", recorder.samples, args.record)
+        for report in controller.batch_reports:
+            LOGGER.info(
+                "Batch %s: %d picks, %d door cycle(s), %.2f m, %.1f picks/min",
+                report.bins,
+                report.picks,
+                report.door_cycles,
+                report.travel_m,
+                report.picks_per_min,
+            )
+        if controller.profiler is not None:
+            controller.profiler.dump(args.profile)
+            for stage, row in controller.profiler.snapshot().items():
+                LOGGER.info(
+                    "Stage %-8s n=%d mean %.1f us, p99 <%.0f us, max %.1f us",
+                    stage,
+                    row["count"],
+                    row["mean_us"],
+                    row["p99_us"],
+                    row["max_us"],
+                )
+        if trace:
+            trace.close()
+    return 0
+
+
+def build_controller(args: argparse.Namespace, thresholds: Thresholds) -> "SterilizationController":
+    from .state_machine import SterilizationController
 
-    adapter = resolve_adapter(args.adapter, args.signoff_id)
-    trace = TraceWriter(args.trace) if args.trace else None
+    adapter = resolve_adapter(args.adapter, args.signoff_id, args.rig_address, args.signoff_report)
+    if args.demo:
+        from sim import scripted_cycle
 
     if adapter is not None:
+        from hardware.safeguarded_arm import SafeguardedArm
+
         adapter.connect()
         safety = adapter.safety()
-        arm = SafeguardedArm(adapter.arm(), safety)
+        arm = SafeguardedArm(adapter.arm(), safety, workspace=load_workspace(args))
         emg = scripted_cycle() if args.demo else adapter.emg()
         LOGGER.info("Using adapter %s (%s)", adapter.name, adapter.phase.value)
     else:
@@ -108,38 +587,142 @@ def main(argv: Optional[list[str]] = None) -> int:
 
         safety = None
         arm = QArmStub()
+        workspace = load_workspace(args)
+        if workspace is not None or args.motion_log:
+            from hardware.safeguarded_arm import SafeguardedArm
+            from safety.interlocks import SafetySupervisor
+
+            # The stub has no interlock inputs: a nominal supervisor gates moves on the grid
+            # only and keeps the motion audit log.
+            arm = SafeguardedArm(arm, SafetySupervisor(), workspace=workspace)
         emg = scripted_cycle() if args.demo else StaticEMGSource()
         if not args.demo:
             LOGGER.warning("Using StaticEMGSource. Use --demo or --adapter bench.")
 
-    controller = SterilizationController(
+    return SterilizationController(
         arm=arm,
         emg=emg,
         thresholds=thresholds,
         waypoints=Waypoints(),
         speeds=Speeds(),
         safety=safety,
+        batch_mode=args.batch,
+        emit_on_change=args.emit_on_change,
+        # The synchronous sink serializes immediately, so one event object suffices.
+        reuse_event=not args.use_async and args.cells == 1,
     )
 
-    class Sink:
-        def append(self, event) -> None:
-            if trace:
-                payload = event
-                if safety:
-                    trace.emit("tick", {"event": payload, "safety": safety.snapshot()})
-                else:
-                    trace.emit("tick", payload)
 
+def attach_motion_sink(arm, path: Optional[Path], trace: Optional["TraceWriter"]):
+    """
+    Spill the arm's motion log to ``path`` (JSONL) or, failing that, ``trace``.
+
+    Returns ``(motion_log, jsonl_sink)``; ``motion_log`` is None when nothing
+    is attached, and ``jsonl_sink`` is the file sink the caller must close.
+    """
+    motion_log = getattr(arm, "motion_log", None)
+    if motion_log is None or (path is None and trace is None):
+        return None, None
+    from hardware.motion_log import JsonlMotionSink, trace_sink
+
+    jsonl = JsonlMotionSink(path) if path is not None else None
+    motion_log.spill = jsonl if jsonl is not None else trace_sink(trace)
+    return motion_log, jsonl
+
+
+def load_workspace(args: argparse.Namespace):
+    """With ``--workspace``: the cached grid, after checking the configured waypoints against it."""
+    if not args.workspace:
+        return None
+    from hardware.workspace import WorkspaceGrid, WorkspaceViolation
+
+    grid = WorkspaceGrid.load_or_build()
+    problems = grid.check_path(*cycle_points(Waypoints()))
+    if problems:
+        raise WorkspaceViolation("waypoints outside the workspace: " + "; ".join(problems))
+    return grid
+
+
+def run_named_sequence(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from sequences import run_sequence_on_arm
+    from sequences.registry import default_registry
+
+    workspace = load_workspace(args)
+    try:
+        sequence = default_registry(args.sequence_dir, workspace=workspace).get(args.sequence)
+    except (KeyError, ValueError) as exc:
+        parser.error(exc.args[0])
+    adapter = resolve_adapter(args.adapter, args.signoff_id, args.rig_address, args.signoff_report)
+    safety = None
+    if adapter is not None:
+        from hardware.safeguarded_arm import SafeguardedArm
+
+        adapter.connect()
+        safety = adapter.safety()
+        arm = SafeguardedArm(adapter.arm(), safety, workspace=workspace)
+    else:
+        from hardware.arm import QArmStub
+
+        arm = QArmStub()
+    log = run_sequence_on_arm(arm, sequence, safety, workspace=workspace)
+    LOGGER.info("Sequence %s@%s: %d steps", sequence.name, sequence.version, len(log))
+    return 0
+
+
+class TraceSink:
+    """Event sink writing controller ticks (plus safety snapshot) to a trace."""
+
+    def __init__(self, trace: "TraceWriter", safety=None, cell: str = "") -> None:
+        self.trace = trace
+        self.safety = safety
+        self.cell = cell
+
+    def append(self, event) -> None:
+        if self.safety is None and not self.cell:
+            self.trace.emit("tick", event)
+            return
+        payload = {"event": event}
+        if self.cell:
+            payload["cell"] = self.cell
+        if self.safety is not None:
+            payload["safety"] = self.safety.snapshot()
+        self.trace.emit("tick", payload)
+
+
+def run_fleet(args: argparse.Namespace, thresholds: Thresholds, trace: Optional["TraceWriter"]) -> int:
+    from .arbitration import ResourceArbiter
+    from .fleet import Cell, FleetRunner
+
+    arbiter = ResourceArbiter() if args.shared_autoclave else None
+    cells = []
+    for idx in range(args.cells):
+        controller = build_controller(args, thresholds)
+        name = f"cell-{idx:02d}"
+        controller.arbiter = arbiter
+        controller.cell_id = name
+        sink = TraceSink(trace, controller.safety, cell=name) if trace else None
+        cells.append(Cell(name, controller, loop_hz=args.loop_rate, event_sink=sink))
+
+    runner = FleetRunner(cells)
     try:
-        run_controller(controller, sampling, event_sink=Sink() if trace else None)
+        metrics = runner.run(args.runtime)
     except KeyboardInterrupt:
         LOGGER.info("Interrupted by user.")
+        metrics = runner.metrics()
     finally:
-        with suppress(Exception):
-            arm.home()
         if trace:
             trace.close()
-    return 0
+    LOGGER.info(
+        "Fleet: %d cells, %d ticks (%.0f/s), %d skipped, faulted=%s",
+        metrics["cells"],
+        metrics["ticks"],
+        metrics["ticks_per_s"],
+        metrics["skipped"],
+        metrics["faulted"] or "none",
+    )
+    if arbiter is not None:
+        LOGGER.info("Shared autoclave contention: %.2f s total wait", arbiter.metrics()["total_wait_s"])
+    return 1 if metrics["faulted"] else 0
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ Configuration dataclasses for MuscleMate.
 """
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,6 +24,7 @@ class Sampling:
 
     loop_hz: float = 50.0
     runtime_s: float = 180.0
+    idle_hz: float = 0.0  # >0: drop to this rate while IDLE at rest (see run_controller)
 
 
 @dataclass(frozen=True)
@@ -49,3 +50,17 @@ class Waypoints:
         (0.30, -0.18, 0.08),
     )
 
+
+LIFT_DZ = 0.10  # lift above the bin pick pose before transit
+PLACE_DZ = 0.05  # descend below the autoclave hover pose to place
+
+
+def cycle_points(waypoints: Waypoints) -> Tuple[List[Tuple[float, float, float]], List[str]]:
+    """Poses of one cycle through every bin, in the order the FSM visits them."""
+    ax, ay, az = waypoints.autoclave
+    points, labels = [waypoints.home], ["home"]
+    for idx, (x, y, z) in enumerate(waypoints.bins):
+        points += [(x, y, z), (x, y, z + LIFT_DZ), waypoints.autoclave, (ax, ay, az - PLACE_DZ), waypoints.home]
+        labels += [f"bin{idx}", f"bin{idx}_lift", "autoclave", "place", "home"]
+    return points, labels
+
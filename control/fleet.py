@@ -0,0 +1,157 @@
+"""
+Multi-cell fleet runner: many controllers driven from one process.
+
+A single scheduler thread keeps a deadline heap of cells, each with its own
+loop rate, and dispatches due ticks to a shared thread pool. A cell whose
+previous tick is still running (grip dwell, slow arm call) skips that
+deadline instead of delaying the others, and a cell whose tick raises is
+faulted, latched safe and homed while the rest of the fleet keeps running.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from threading import Event
+from time import monotonic, perf_counter
+from typing import Dict, List, Optional, Sequence
+
+from .runner import EventSink
+from .state_machine import SterilizationController
+
+LOGGER = logging.getLogger("musclemate.fleet")
+
+
+@dataclass
+class CellStats:
+    ticks: int = 0
+    skipped: int = 0
+    errors: int = 0
+    faulted: bool = False
+    last_error: str = ""
+    busy_s: float = 0.0
+    max_tick_s: float = 0.0
+
+    def as_dict(self) -> dict:
+        out = asdict(self)
+        out["mean_tick_s"] = self.busy_s / self.ticks if self.ticks else 0.0
+        return out
+
+
+@dataclass
+class Cell:
+    """One controller/adapter pair hosted by the fleet."""
+
+    name: str
+    controller: SterilizationController
+    loop_hz: float = 50.0
+    event_sink: Optional[EventSink] = None
+    stats: CellStats = field(default_factory=CellStats)
+
+    @property
+    def period_s(self) -> float:
+        return 1.0 / max(1.0, self.loop_hz)
+
+    def tick(self) -> None:
+        t0 = perf_counter()
+        try:
+            event = self.controller.tick()
+            if self.event_sink is not None and event is not None:
+                self.event_sink.append(event)
+        finally:
+            elapsed = perf_counter() - t0
+            self.stats.ticks += 1
+            self.stats.busy_s += elapsed
+            if elapsed > self.stats.max_tick_s:
+                self.stats.max_tick_s = elapsed
+
+    def fault(self, exc: BaseException) -> None:
+        self.stats.errors += 1
+        self.stats.faulted = True
+        self.stats.last_error = repr(exc)
+        ctl = self.controller
+        if ctl.safety is not None:
+            ctl.safety.latch_estop()
+        with suppress(Exception):
+            ctl.release()
+        with suppress(Exception):
+            ctl.arm.home()
+
+
+class FleetRunner:
+    """Drive ``cells`` concurrently for a fixed runtime."""
+
+    def __init__(self, cells: Sequence[Cell], *, workers: Optional[int] = None) -> None:
+        names = [c.name for c in cells]
+        if len(set(names)) != len(names):
+            raise ValueError("cell names must be unique")
+        self.cells: List[Cell] = list(cells)
+        self.workers = workers or max(1, min(32, len(self.cells)))
+        self._stop = Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run(self, runtime_s: float) -> dict:
+        self._stop.clear()
+        start = monotonic()
+        deadline = start + runtime_s
+        heap = [(start, idx) for idx in range(len(self.cells))]
+        heapq.heapify(heap)
+        inflight: Dict[int, Future] = {}
+
+        pool = ThreadPoolExecutor(self.workers, thread_name_prefix="cell")
+        try:
+            while heap and not self._stop.is_set():
+                due, idx = heapq.heappop(heap)
+                if due >= deadline:
+                    break
+                wait = due - monotonic()
+                if wait > 0 and self._stop.wait(wait):
+                    break
+                cell = self.cells[idx]
+                if cell.stats.faulted:
+                    continue
+                pending = inflight.get(idx)
+                if pending is not None and not pending.done():
+                    cell.stats.skipped += 1
+                else:
+                    inflight[idx] = pool.submit(self._tick_isolated, cell)
+                heapq.heappush(heap, (due + cell.period_s, idx))
+        finally:
+            # Also on Ctrl-C: let in-flight ticks finish, then home every arm.
+            pool.shutdown(wait=True, cancel_futures=True)
+            self.home_all()
+        return self.metrics(elapsed_s=monotonic() - start)
+
+    def home_all(self) -> None:
+        for cell in self.cells:
+            with suppress(Exception):
+                cell.controller.arm.home()
+            with suppress(Exception):
+                cell.controller.release()
+
+    def metrics(self, elapsed_s: float = 0.0) -> dict:
+        per_cell = {c.name: c.stats.as_dict() for c in self.cells}
+        ticks = sum(c.stats.ticks for c in self.cells)
+        return {
+            "cells": len(self.cells),
+            "faulted": sorted(c.name for c in self.cells if c.stats.faulted),
+            "ticks": ticks,
+            "skipped": sum(c.stats.skipped for c in self.cells),
+            "errors": sum(c.stats.errors for c in self.cells),
+            "ticks_per_s": ticks / elapsed_s if elapsed_s > 0 else 0.0,
+            "max_tick_s": max((c.stats.max_tick_s for c in self.cells), default=0.0),
+            "per_cell": per_cell,
+        }
+
+    @staticmethod
+    def _tick_isolated(cell: Cell) -> None:
+        try:
+            cell.tick()
+        except Exception as exc:  # isolate: one cell's fault never stops the fleet
+            LOGGER.error("Cell %s faulted: %r", cell.name, exc)
+            cell.fault(exc)
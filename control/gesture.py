@@ -7,7 +7,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum, auto
 from time import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .config import Thresholds
 
@@ -29,23 +29,38 @@ class GestureDecoder:
     """
     Decode two-channel EMG into Intent values with hysteresis, debounce,
     cooldown, and long-press detection.
+
+    Each channel is mapped to ``(value - offset) * gain`` before the
+    thresholds apply; an operator profile supplies its rest baseline as
+    ``offsets`` and per-channel ``gains``. ``quiet`` reports whether both
+    mapped channels were at or below ``emg_off`` at the last update.
     """
 
     thresholds: Thresholds
+    offsets: Tuple[float, float] = (0.0, 0.0)
+    gains: Tuple[float, float] = (1.0, 1.0)
     _active: List[bool] = None  # type: ignore[assignment]
     _t_change: List[float] = None  # type: ignore[assignment]
     _press_start: List[Optional[float]] = None  # type: ignore[assignment]
     _last_intent_time: float = 0.0
+    _quiet: bool = True
 
     def __post_init__(self) -> None:
         self._active = [False, False]
         self._t_change = [0.0, 0.0]
         self._press_start = [None, None]
 
+    @property
+    def quiet(self) -> bool:
+        return self._quiet
+
     def update(self, ch1: float, ch2: float) -> None:
         now = time()
+        quiet = True
         for idx, value in enumerate((ch1, ch2)):
+            value = (value - self.offsets[idx]) * self.gains[idx]
             value = 0.0 if abs(value) < self.thresholds.deadband else value
+            quiet = quiet and value <= self.thresholds.emg_off
             if not self._active[idx] and value >= self.thresholds.emg_on:
                 self._active[idx] = True
                 self._t_change[idx] = now
@@ -54,6 +69,7 @@ class GestureDecoder:
                 self._active[idx] = False
                 self._t_change[idx] = now
                 self._press_start[idx] = None
+        self._quiet = quiet
 
     def intent(self) -> Intent:
         now = time()
@@ -67,18 +83,18 @@ class GestureDecoder:
             self._last_intent_time = now
             return Intent.ABORT
 
-        active = [
-            self._active[i] and (now - self._t_change[i] >= self.thresholds.debounce_s)
-            for i in (0, 1)
-        ]
+        # Plain locals rather than a per-call list: this runs every tick.
+        debounce = self.thresholds.debounce_s
+        active1 = self._active[0] and now - self._t_change[0] >= debounce
+        active2 = self._active[1] and now - self._t_change[1] >= debounce
 
-        if active[0] and not active[1]:
+        if active1 and not active2:
             self._last_intent_time = now
             return Intent.START
-        if active[1] and not active[0]:
+        if active2 and not active1:
             self._last_intent_time = now
             return Intent.GRIP
-        if active[0] and active[1]:
+        if active1 and active2:
             self._last_intent_time = now
             return Intent.OPEN_DOOR
         return Intent.NONE
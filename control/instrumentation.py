@@ -0,0 +1,103 @@
+"""
+Low-overhead per-stage timing for the control tick.
+
+``TickProfiler`` keeps preallocated counters and log2-microsecond
+histograms per stage, fed from ``time.monotonic_ns`` spans, so recording a
+span allocates nothing. With ``sample_every=N`` only every Nth tick is
+timed; unsampled ticks, or ticks with no profiler attached, only pay an
+integer check per stage.
+
+Stages: ``emg_read``, ``decode`` (update + intent), ``fsm`` (transition
+dispatch, inclusive of the nested ``safety`` and ``arm`` spans), ``safety``
+(``require_motion``), ``arm`` (driver calls), ``sink`` (event sink in the
+runner) and ``tick`` (the whole ``SterilizationController.tick``).
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from pathlib import Path
+from time import monotonic_ns
+from typing import Dict, Optional, TextIO
+
+STAGES = ("emg_read", "decode", "fsm", "safety", "arm", "sink", "tick")
+EMG_READ, DECODE, FSM, SAFETY, ARM, SINK, TICK = range(len(STAGES))
+
+BUCKETS = 28  # bucket b holds spans < 2**b microseconds (last bucket: overflow)
+
+
+class TickProfiler:
+    """Preallocated stage histograms; safe to read from another thread."""
+
+    __slots__ = ("sample_every", "active", "_n", "_count", "_total_ns", "_max_ns", "_hist")
+
+    def __init__(self, sample_every: int = 1) -> None:
+        n = len(STAGES)
+        self.sample_every = max(1, sample_every)
+        self.active = False
+        self._n = 0
+        self._count = array("Q", bytes(8 * n))
+        self._total_ns = array("Q", bytes(8 * n))
+        self._max_ns = array("Q", bytes(8 * n))
+        self._hist = array("Q", bytes(8 * n * BUCKETS))
+
+    def begin_tick(self) -> bool:
+        """Decide whether this tick is sampled; sets and returns ``active``."""
+        self._n += 1
+        self.active = self._n % self.sample_every == 0
+        return self.active
+
+    def record(self, stage: int, t0_ns: int) -> int:
+        """Close a span opened at ``t0_ns``; returns the current timestamp."""
+        now = monotonic_ns()
+        elapsed = now - t0_ns
+        self._count[stage] += 1
+        self._total_ns[stage] += elapsed
+        if elapsed > self._max_ns[stage]:
+            self._max_ns[stage] = elapsed
+        bucket = min((elapsed // 1000).bit_length(), BUCKETS - 1)
+        self._hist[stage * BUCKETS + bucket] += 1
+        return now
+
+    def reset(self) -> None:
+        for arr in (self._count, self._total_ns, self._max_ns, self._hist):
+            for i in range(len(arr)):
+                arr[i] = 0
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Per-stage count, mean/max and histogram-bound p50/p99 (microseconds)."""
+        out: Dict[str, dict] = {}
+        for stage, name in enumerate(STAGES):
+            count = self._count[stage]
+            if not count:
+                continue
+            hist = self._hist[stage * BUCKETS : (stage + 1) * BUCKETS]
+            out[name] = {
+                "count": count,
+                "mean_us": self._total_ns[stage] / count / 1000.0,
+                "max_us": self._max_ns[stage] / 1000.0,
+                "p50_us": _quantile_bound(hist, count, 0.50),
+                "p99_us": _quantile_bound(hist, count, 0.99),
+                "histogram_log2_us": list(hist),
+            }
+        return out
+
+    def dump(self, target: Optional[Path] = None, stream: Optional[TextIO] = None) -> str:
+        text = json.dumps({"sample_every": self.sample_every, "stages": self.snapshot()}, indent=2)
+        if target is not None:
+            Path(target).write_text(text + "\n", encoding="utf-8")
+        if stream is not None:
+            stream.write(text + "\n")
+        return text
+
+
+def _quantile_bound(hist: array, count: int, q: float) -> float:
+    """Upper bucket bound (us) below which at least ``q`` of spans fall."""
+    need = q * count
+    seen = 0
+    for bucket, n in enumerate(hist):
+        seen += n
+        if seen >= need:
+            return float(2**bucket)
+    return float(2 ** (len(hist) - 1))
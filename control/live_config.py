@@ -0,0 +1,255 @@
+"""
+Live reconfiguration of thresholds, speeds and waypoints from a JSON file.
+
+``ConfigWatcher`` polls the file on its own thread. A changed file is parsed
+and validated there, against the startup configuration it overlays, and the
+resulting ``ConfigUpdate`` is parked as pending. The control loop calls
+``apply`` at each tick boundary; the update is swapped into the controller
+(and its ``GestureDecoder``) only while ``SterilizationController.apply_config``
+accepts it, otherwise it stays pending until the FSM is back in a safe state.
+Applied and rejected files are written to the trace.
+
+File format (every section and field optional)::
+
+    {"thresholds": {"emg_on": 0.7, "debounce_s": 0.2},
+     "speeds": {"move": 0.5},
+     "waypoints": {"bins": [[0.30, 0.18, 0.08], [0.32, 0.0, 0.08]]}}
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .config import Speeds, Thresholds, Waypoints, cycle_points
+
+if TYPE_CHECKING:
+    from hardware.workspace import WorkspaceGrid
+
+    from .state_machine import SterilizationController
+    from .trace import TraceWriter
+
+LOGGER = logging.getLogger("musclemate.live_config")
+
+_SPEED_FIELDS = ("move", "approach", "retract", "door")
+
+
+@dataclass(frozen=True)
+class ConfigUpdate:
+    """One validated configuration file revision; ``changes`` is relative to startup."""
+
+    version: int
+    source: str
+    thresholds: Thresholds
+    speeds: Speeds
+    waypoints: Waypoints
+    changes: Dict[str, Any]
+
+
+def _number(section: str, name: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{section}.{name} must be a number, got {value!r}")
+    return float(value)
+
+
+def _point(section: str, name: str, value: Any) -> Tuple[float, float, float]:
+    if not isinstance(value, (list, tuple)) or len(value) != 3:
+        raise ValueError(f"{section}.{name} must be [x, y, z], got {value!r}")
+    x, y, z = (_number(section, name, v) for v in value)
+    return (x, y, z)
+
+
+def _overlay(section: str, base: Any, values: Any) -> Dict[str, Any]:
+    if not isinstance(values, dict):
+        raise ValueError(f"{section} must be an object")
+    known = {f.name for f in fields(base)}
+    unknown = sorted(set(values) - known)
+    if unknown:
+        raise ValueError(f"unknown {section} field(s): {', '.join(unknown)}")
+    return dict(values)
+
+
+def validate_thresholds(th: Thresholds) -> None:
+    if not 0.0 <= th.deadband < th.emg_off < th.emg_on:
+        raise ValueError(
+            f"thresholds need 0 <= deadband < emg_off < emg_on "
+            f"(got {th.deadband}, {th.emg_off}, {th.emg_on})"
+        )
+    for name in ("debounce_s", "cooldown_s", "longpress_s"):
+        if getattr(th, name) < 0.0:
+            raise ValueError(f"thresholds.{name} must be >= 0")
+    if th.longpress_s <= th.debounce_s:
+        raise ValueError("thresholds.longpress_s must exceed debounce_s")
+
+
+def validate_speeds(sp: Speeds) -> None:
+    for name in _SPEED_FIELDS:
+        if not 0.0 < getattr(sp, name) <= 1.0:
+            raise ValueError(f"speeds.{name} must be in (0, 1]")
+    if not 0.0 <= sp.grip_time_s <= 5.0:
+        raise ValueError("speeds.grip_time_s must be in [0, 5] s")
+
+
+def parse_config(
+    doc: Any,
+    thresholds: Thresholds,
+    speeds: Speeds,
+    waypoints: Waypoints,
+    *,
+    version: int = 0,
+    source: str = "",
+    workspace: Optional["WorkspaceGrid"] = None,
+) -> ConfigUpdate:
+    """Overlay ``doc`` on the given configuration; raises ValueError if invalid.
+
+    With a ``workspace`` grid, changed waypoints must also keep the whole cycle inside it.
+    """
+    if not isinstance(doc, dict):
+        raise ValueError("config must be a JSON object")
+    unknown = sorted(set(doc) - {"thresholds", "speeds", "waypoints"})
+    if unknown:
+        raise ValueError(f"unknown config section(s): {', '.join(unknown)}")
+
+    changes: Dict[str, Any] = {}
+    th_values = _overlay("thresholds", thresholds, doc.get("thresholds", {}))
+    th = replace(thresholds, **{k: _number("thresholds", k, v) for k, v in th_values.items()})
+    validate_thresholds(th)
+    sp_values = _overlay("speeds", speeds, doc.get("speeds", {}))
+    sp = replace(speeds, **{k: _number("speeds", k, v) for k, v in sp_values.items()})
+    validate_speeds(sp)
+    wp_values = _overlay("waypoints", waypoints, doc.get("waypoints", {}))
+    if "bins" in wp_values:
+        bins = wp_values["bins"]
+        if not isinstance(bins, list) or not bins:
+            raise ValueError("waypoints.bins must be a non-empty list")
+        wp_values["bins"] = tuple(_point("waypoints", f"bins[{i}]", b) for i, b in enumerate(bins))
+    for name in ("home", "autoclave"):
+        if name in wp_values:
+            wp_values[name] = _point("waypoints", name, wp_values[name])
+    wp = replace(waypoints, **wp_values)
+    if workspace is not None and wp != waypoints:
+        problems = workspace.check_path(*cycle_points(wp))
+        if problems:
+            raise ValueError("waypoints outside the workspace: " + "; ".join(problems))
+
+    for section, old, new in (("thresholds", thresholds, th), ("speeds", speeds, sp), ("waypoints", waypoints, wp)):
+        diff = {f.name: getattr(new, f.name) for f in fields(new) if getattr(new, f.name) != getattr(old, f.name)}
+        if diff:
+            changes[section] = diff
+    return ConfigUpdate(version, source, th, sp, wp, changes)
+
+
+class ConfigWatcher:
+    """Watch ``path`` and feed validated updates to the control loop."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        thresholds: Thresholds = Thresholds(),
+        speeds: Speeds = Speeds(),
+        waypoints: Waypoints = Waypoints(),
+        poll_s: float = 0.5,
+        workspace: Optional["WorkspaceGrid"] = None,
+        trace: Optional["TraceWriter"] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.base = (thresholds, speeds, waypoints)
+        self.workspace = workspace
+        self.poll_s = poll_s
+        self.trace = trace
+        self.version = 0
+        self.applied = 0
+        self.rejected: List[str] = []
+        self.current: Optional[ConfigUpdate] = None
+        self._pending: Optional[ConfigUpdate] = None
+        self._deferred = False
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> Optional[ConfigUpdate]:
+        return self._pending
+
+    def start(self) -> "ConfigWatcher":
+        self.poll()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            self.poll()
+
+    def poll(self) -> Optional[ConfigUpdate]:
+        """Load and validate the file if it changed; returns the new pending update."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return None
+        self._signature = signature
+        self.version += 1
+        try:
+            doc = json.loads(self.path.read_text(encoding="utf-8"))
+            update = parse_config(
+                doc, *self.base, version=self.version, source=str(self.path), workspace=self.workspace
+            )
+        except (OSError, ValueError) as exc:  # JSONDecodeError is a ValueError
+            reason = f"v{self.version}: {exc}"
+            self.rejected.append(reason)
+            LOGGER.error("Rejected config %s %s", self.path, reason)
+            if self.trace is not None:
+                self.trace.emit("config_rejected", {"version": self.version, "error": str(exc)})
+            return None
+        with self._lock:
+            self._pending = update
+            self._deferred = False
+        LOGGER.info("Config v%d validated: %s", update.version, update.changes or "no changes")
+        return update
+
+    def apply(self, controller: "SterilizationController") -> Optional[ConfigUpdate]:
+        """Called between ticks: swap in the pending update if the FSM allows it."""
+        if self._pending is None:
+            return None
+        with self._lock:
+            update = self._pending
+            if update is None:
+                return None
+            waypoints = update.waypoints if update.waypoints != controller.waypoints else None
+            if not controller.apply_config(update.thresholds, update.speeds, waypoints):
+                if not self._deferred:
+                    self._deferred = True
+                    LOGGER.info("Config v%d deferred until IDLE/SELECT_BIN", update.version)
+                return None
+            self._pending = None
+        self.current = update
+        self.applied += 1
+        LOGGER.info("Config v%d applied in %s", update.version, controller.state.name)
+        if self.trace is not None:
+            self.trace.emit(
+                "config",
+                {
+                    "version": update.version,
+                    "source": update.source,
+                    "state": controller.state.name,
+                    "changes": update.changes,
+                    "thresholds": asdict(update.thresholds),
+                    "speeds": asdict(update.speeds),
+                },
+            )
+        return update
@@ -0,0 +1,180 @@
+"""
+Prometheus text-format metrics over a localhost HTTP endpoint.
+
+``ControllerMetrics.observe`` runs on the control thread after every tick
+and only bumps preallocated ints and lists (no locks, no allocation per
+tick). ``MetricsServer`` renders the exposition text on its own thread when
+scraped; reads there may be one tick stale, which is fine for monitoring.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import monotonic
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from .gesture import Intent
+from .state_machine import ControllerEvent, State, SterilizationController
+
+if TYPE_CHECKING:
+    from .trace import TraceWriter
+
+LOGGER = logging.getLogger("musclemate.metrics")
+
+LATENCY_BUCKETS_S = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class ControllerMetrics:
+    """Counters for one controller; written by the control thread only."""
+
+    def __init__(
+        self,
+        controller: SterilizationController,
+        *,
+        trace: Optional["TraceWriter"] = None,
+        buckets: Sequence[float] = LATENCY_BUCKETS_S,
+    ) -> None:
+        self.controller = controller
+        self.trace = trace
+        self.buckets = tuple(buckets)
+        self.ticks = 0
+        self.cycles_completed = 0
+        self.latency_sum_s = 0.0
+        self._latency = [0] * (len(self.buckets) + 1)
+        self._intents = [0] * (max(i.value for i in Intent) + 1)
+        self._dwell = [0.0] * (max(s.value for s in State) + 1)
+        self._state = controller.state
+        self._state_since = monotonic()
+        self._started = self._state_since
+        self._last_scrape = (self._started, 0)
+
+    def observe(self, event: Optional[ControllerEvent], tick_s: float) -> None:
+        """Record one tick; ``event`` may be None under ``emit_on_change``."""
+        self.ticks += 1
+        self.latency_sum_s += tick_s
+        self._latency[bisect_left(self.buckets, tick_s)] += 1
+        if event is None:
+            # Suppressed ticks repeat the last emitted intent by definition.
+            event = self.controller._last_event
+        intent = event.intent if event is not None else Intent.NONE
+        self._intents[intent.value] += 1
+        state = self.controller.state
+        if state is not self._state:
+            now = monotonic()
+            self._dwell[self._state.value] += now - self._state_since
+            if self._state is State.HOME and state is State.IDLE and intent is not Intent.ABORT:
+                self.cycles_completed += 1
+            self._state = state
+            self._state_since = now
+
+    def render(self) -> str:
+        """Prometheus text exposition (server thread)."""
+        now = monotonic()
+        ticks = self.ticks
+        last_t, last_ticks = self._last_scrape
+        self._last_scrape = (now, ticks)
+        rate = (ticks - last_ticks) / (now - last_t) if now > last_t else 0.0
+
+        lines: List[str] = []
+        _header(lines, "musclemate_ticks_total", "counter", "Controller ticks executed.")
+        lines.append(f"musclemate_ticks_total {ticks}")
+        _header(lines, "musclemate_tick_rate_hz", "gauge", "Tick rate since the previous scrape.")
+        lines.append(f"musclemate_tick_rate_hz {rate:.3f}")
+
+        _header(lines, "musclemate_tick_latency_seconds", "histogram", "Controller tick latency.")
+        cumulative = 0
+        counts = list(self._latency)
+        for bound, n in zip(self.buckets, counts):
+            cumulative += n
+            lines.append(f'musclemate_tick_latency_seconds_bucket{{le="{bound}"}} {cumulative}')
+        cumulative += counts[-1]
+        lines.append(f'musclemate_tick_latency_seconds_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"musclemate_tick_latency_seconds_sum {self.latency_sum_s:.9f}")
+        lines.append(f"musclemate_tick_latency_seconds_count {cumulative}")
+
+        _header(lines, "musclemate_intents_total", "counter", "Decoded intents by type.")
+        intents = list(self._intents)
+        for intent in Intent:
+            lines.append(f'musclemate_intents_total{{intent="{intent.name}"}} {intents[intent.value]}')
+
+        _header(lines, "musclemate_state_dwell_seconds_total", "counter", "Time spent in each state.")
+        dwell = list(self._dwell)
+        current, since = self._state, self._state_since
+        for state in State:
+            value = dwell[state.value] + (now - since if state is current else 0.0)
+            lines.append(f'musclemate_state_dwell_seconds_total{{state="{state.name}"}} {value:.3f}')
+        _header(lines, "musclemate_state", "gauge", "1 for the controller's current state.")
+        for state in State:
+            lines.append(f'musclemate_state{{state="{state.name}"}} {int(state is current)}')
+
+        _header(lines, "musclemate_cycles_completed_total", "counter", "Cycles returned HOME -> IDLE.")
+        lines.append(f"musclemate_cycles_completed_total {self.cycles_completed}")
+
+        safety = self.controller.safety
+        if safety is not None:
+            _header(lines, "musclemate_safety_faults_total", "counter", "Safety faults raised by kind.")
+            for kind, n in sorted(dict(safety.fault_counts).items()):
+                lines.append(f'musclemate_safety_faults_total{{kind="{kind}"}} {n}')
+            _header(lines, "musclemate_safety_fault_latched", "gauge", "1 while a safety fault is latched.")
+            lines.append(f"musclemate_safety_fault_latched {int(safety._fault_latched)}")
+
+        if self.trace is not None:
+            _header(lines, "musclemate_trace_queue_depth", "gauge", "Trace rows awaiting the writer thread.")
+            lines.append(f"musclemate_trace_queue_depth {self.trace.queue_depth}")
+
+        _header(lines, "musclemate_uptime_seconds", "gauge", "Seconds since metrics started.")
+        lines.append(f"musclemate_uptime_seconds {now - self._started:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+def _header(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+class MetricsServer:
+    """Serve ``/metrics`` from a daemon thread; ``port=0`` picks a free port."""
+
+    def __init__(self, metrics: ControllerMetrics, port: int = 9464, host: str = "127.0.0.1") -> None:
+        self.metrics = metrics
+        handler = type("_Handler", (_MetricsHandler,), {"metrics": metrics})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+        LOGGER.info("Serving metrics on http://127.0.0.1:%d/metrics", self.port)
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    metrics: ControllerMetrics
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        LOGGER.debug("metrics %s", format % args)
@@ -0,0 +1,187 @@
+"""
+Per-operator calibration profiles.
+
+An ``OperatorProfile`` holds what a rest calibration produces for one
+operator: decoder thresholds, the per-channel rest baseline (mean and
+standard deviation, applied as decoder offsets) and per-channel gains.
+``ProfileStore`` keeps one JSON file per operator under a directory and an
+LRU cache of parsed profiles, so a shift change is a dictionary lookup plus
+``SterilizationController.switch_operator`` rather than a recalibration and
+restart.
+
+``calibrate_rest`` follows docs/signal_chain.md: baseline from the rest
+capture, ``emg_on`` at the 95th percentile of the baseline-subtracted rest
+envelope plus a margin, ``emg_off`` at half of ``emg_on``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import Thresholds
+from .live_config import validate_thresholds
+
+if TYPE_CHECKING:
+    from hardware.capture import CaptureReader
+
+LOGGER = logging.getLogger("musclemate.profiles")
+
+_OPERATOR_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+@dataclass(frozen=True)
+class OperatorProfile:
+    operator_id: str
+    thresholds: Thresholds
+    baseline_mean: Tuple[float, float] = (0.0, 0.0)
+    baseline_std: Tuple[float, float] = (0.0, 0.0)
+    gains: Tuple[float, float] = (1.0, 1.0)
+    calibrated_at: float = 0.0
+    rest_samples: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "OperatorProfile":
+        thresholds = Thresholds(**doc["thresholds"])
+        validate_thresholds(thresholds)
+        return cls(
+            operator_id=doc["operator_id"],
+            thresholds=thresholds,
+            baseline_mean=_pair(doc.get("baseline_mean", (0.0, 0.0))),
+            baseline_std=_pair(doc.get("baseline_std", (0.0, 0.0))),
+            gains=_pair(doc.get("gains", (1.0, 1.0))),
+            calibrated_at=float(doc.get("calibrated_at", 0.0)),
+            rest_samples=int(doc.get("rest_samples", 0)),
+        )
+
+
+def _pair(values: Sequence[float]) -> Tuple[float, float]:
+    a, b = values
+    return (float(a), float(b))
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def calibrate_rest(
+    operator_id: str,
+    rest: Sequence[Sequence[float]],
+    *,
+    base: Thresholds = Thresholds(),
+    margin: float = 0.5,
+    gains: Tuple[float, float] = (1.0, 1.0),
+) -> OperatorProfile:
+    """Build a profile from two channels of rest EMG (``rest[0]``, ``rest[1]``)."""
+    if len(rest) < 2 or not len(rest[0]) or not len(rest[1]):
+        raise ValueError("rest calibration needs samples on both channels")
+    means: List[float] = []
+    stds: List[float] = []
+    p95 = 0.0
+    for ch in (0, 1):
+        values = rest[ch]
+        n = len(values)
+        mean = sum(values) / n
+        means.append(mean)
+        stds.append((sum((v - mean) ** 2 for v in values) / n) ** 0.5)
+        residual = sorted(abs(v - mean) * gains[ch] for v in values)
+        p95 = max(p95, _percentile(residual, 0.95))
+    emg_on = min(0.95, p95 + margin)
+    thresholds = replace(base, emg_on=emg_on, emg_off=0.5 * emg_on, deadband=min(base.deadband, 0.25 * emg_on))
+    validate_thresholds(thresholds)
+    return OperatorProfile(
+        operator_id=operator_id,
+        thresholds=thresholds,
+        baseline_mean=_pair(means),
+        baseline_std=_pair(stds),
+        gains=gains,
+        calibrated_at=time(),
+        rest_samples=len(rest[0]),
+    )
+
+
+def calibrate_from_capture(operator_id: str, reader: "CaptureReader", **kwargs: Any) -> OperatorProfile:
+    """``calibrate_rest`` on channels 0 and 1 of a rest capture (.mmcap)."""
+    return calibrate_rest(operator_id, [reader.read(0), reader.read(1)], **kwargs)
+
+
+class ProfileStore:
+    """Operator profiles as ``<root>/<operator_id>.json`` with an LRU cache."""
+
+    def __init__(self, root: Path, *, capacity: int = 16) -> None:
+        self.root = Path(root)
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, OperatorProfile]" = OrderedDict()
+
+    def path_for(self, operator_id: str) -> Path:
+        if not _OPERATOR_ID.match(operator_id):
+            raise ValueError(f"invalid operator id {operator_id!r}")
+        return self.root / f"{operator_id}.json"
+
+    def ids(self) -> List[str]:
+        return sorted(p.stem for p in self.root.glob("*.json")) if self.root.is_dir() else []
+
+    def get(self, operator_id: str) -> OperatorProfile:
+        """Cached profile for ``operator_id``; raises KeyError if none is stored."""
+        profile = self._cache.get(operator_id)
+        if profile is not None:
+            self.hits += 1
+            self._cache.move_to_end(operator_id)
+            return profile
+        self.misses += 1
+        path = self.path_for(operator_id)
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise KeyError(operator_id) from None
+        profile = OperatorProfile.from_dict(doc)
+        self._remember(profile)
+        return profile
+
+    def put(self, profile: OperatorProfile) -> Path:
+        """Write ``profile`` atomically and refresh the cache."""
+        path = self.path_for(profile.operator_id)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(profile.to_dict(), indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+        self._remember(profile)
+        return path
+
+    def warm(self, operator_ids: Sequence[str]) -> None:
+        """Preload the shift roster so the first switch is a cache hit."""
+        for operator_id in operator_ids:
+            try:
+                self.get(operator_id)
+            except KeyError:
+                LOGGER.warning("No profile for operator %s", operator_id)
+
+    def _remember(self, profile: OperatorProfile) -> None:
+        self._cache[profile.operator_id] = profile
+        self._cache.move_to_end(profile.operator_id)
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+
+
+def switch_operator(controller: Any, store: ProfileStore, operator_id: str) -> Optional[OperatorProfile]:
+    """Look up ``operator_id`` and load it; None if the FSM is mid-cycle."""
+    profile = store.get(operator_id)
+    if not controller.switch_operator(profile):
+        LOGGER.warning("Operator switch to %s refused in %s", operator_id, controller.state.name)
+        return None
+    LOGGER.info("Operator %s active (emg_on %.2f)", operator_id, profile.thresholds.emg_on)
+    return profile
@@ -4,11 +4,20 @@ High-level orchestration for MuscleMate controller.
 
 from __future__ import annotations
 
-from time import sleep, time
-from typing import Optional, Protocol
+from dataclasses import dataclass
+from time import monotonic_ns, perf_counter, process_time, sleep, time
+from typing import TYPE_CHECKING, Optional, Protocol
 
 from .config import Sampling
-from .state_machine import ControllerEvent, SterilizationController
+from .instrumentation import SINK
+from .state_machine import ControllerEvent, State, SterilizationController
+
+if TYPE_CHECKING:
+    from .checkpoint import Checkpointer
+    from .live_config import ConfigWatcher
+    from .metrics import ControllerMetrics
+    from .realtime import RealtimeMode
+    from .watchdog import Watchdog
 
 
 class EventSink(Protocol):
@@ -16,26 +25,120 @@ class EventSink(Protocol):
         ...
 
 
+@dataclass
+class LoopStats:
+    """Loop accounting; the idle fields stay zero unless ``Sampling.idle_hz`` is set."""
+
+    ticks: int = 0
+    idle_ticks: int = 0
+    wakes: int = 0
+    elapsed_s: float = 0.0
+    cpu_s: float = 0.0
+    full_rate_ticks: int = 0
+    worst_wake_latency_s: float = 0.0
+
+    @property
+    def tick_savings(self) -> float:
+        """Fraction of full-rate ticks skipped while idle."""
+        if not self.full_rate_ticks:
+            return 0.0
+        return max(0.0, 1.0 - self.ticks / self.full_rate_ticks)
+
+
 def run_controller(
     controller: SterilizationController,
     sampling: Sampling,
     *,
     event_sink: Optional[EventSink] = None,
-) -> None:
+    checkpointer: Optional["Checkpointer"] = None,
+    metrics: Optional["ControllerMetrics"] = None,
+    watchdog: Optional["Watchdog"] = None,
+    realtime: Optional["RealtimeMode"] = None,
+    config: Optional["ConfigWatcher"] = None,
+) -> LoopStats:
     """
     Execute the main control loop.
 
     Args:
         controller: Configured SterilizationController instance.
         sampling: Loop timing configuration.
-        event_sink: Optional iterable to collect ControllerEvent outputs.
+        event_sink: Optional iterable to collect ControllerEvent outputs
+            (ticks returning None under ``emit_on_change`` are skipped).
+        checkpointer: Optional Checkpointer offered the controller after each tick.
+        metrics: Optional ControllerMetrics updated with each tick's latency.
+        watchdog: Optional started Watchdog; beaten once per iteration. While it
+            is shedding load, the event sink and metrics are skipped.
+        realtime: Optional started RealtimeMode; told about every tick so it
+            can count allocations and run deferred GC while IDLE.
+        config: Optional ConfigWatcher; pending tuning is applied before a
+            tick, never mid-tick, and only in states the controller allows.
+
+    With ``controller.profiler`` set, sampled ticks also time the sink stage.
+
+    With ``sampling.idle_hz`` set, the loop drops to that rate while the
+    controller is IDLE, the decoder sees both EMG channels at or below
+    ``emg_off`` (after the operator profile's offsets and gains) and the
+    interlock inputs are unchanged; the first sample showing activity (or an
+    interlock change) restores the full rate for the next tick. Active states
+    always run at ``loop_hz``. Worst-case wake latency is one idle period.
     """
 
     start = time()
+    cpu_start = process_time()
     dt = 1.0 / max(1.0, sampling.loop_hz)
+    idle_dt = 1.0 / sampling.idle_hz if sampling.idle_hz > 0 else 0.0
+    safety = controller.safety
+    inputs = safety.inputs if safety is not None else None
+    idle = False
+    last_tick = start
+    stats = LoopStats()
+    prof = controller.profiler
     while time() - start < sampling.runtime_s:
-        event = controller.tick()
-        if event_sink is not None:
-            event_sink.append(event)
+        shed = watchdog is not None and watchdog.shedding
+        if config is not None and config.pending is not None:
+            config.apply(controller)
+        if realtime is not None:
+            realtime.begin_tick()
+        if metrics is not None and not shed:
+            t_tick = perf_counter()
+            event = controller.tick()
+            metrics.observe(event, perf_counter() - t_tick)
+        else:
+            event = controller.tick()
+        if realtime is not None:
+            realtime.end_tick()
+        if event_sink is not None and event is not None and not shed:
+            if prof is not None and prof.active:
+                t0 = monotonic_ns()
+                event_sink.append(event)
+                prof.record(SINK, t0)
+            else:
+                event_sink.append(event)
+        if checkpointer is not None:
+            checkpointer.offer(controller)
+        stats.ticks += 1
+        if idle_dt:
+            now = time()
+            current = safety.inputs if safety is not None else None
+            quiet = controller.state is State.IDLE and controller.decoder.quiet and current is inputs
+            inputs = current
+            if idle and not quiet:
+                stats.wakes += 1
+                stats.worst_wake_latency_s = max(stats.worst_wake_latency_s, now - last_tick)
+            idle = quiet
+            last_tick = now
+            if idle:
+                stats.idle_ticks += 1
+                if watchdog is not None:
+                    watchdog.beat(idle_dt)
+                sleep(idle_dt)
+                continue
+        if watchdog is not None:
+            watchdog.beat()
         sleep(dt)
 
+    stats.elapsed_s = time() - start
+    stats.cpu_s = process_time() - cpu_start
+    stats.full_rate_ticks = int(stats.elapsed_s / dt)
+    return stats
+
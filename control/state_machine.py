@@ -4,22 +4,28 @@ Finite state machine for the sterilization workflow.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from time import sleep
-from typing import Optional, Tuple
+from time import monotonic, monotonic_ns, sleep
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from typing import TYPE_CHECKING
 
-from .config import Speeds, Thresholds, Waypoints
+from .arbitration import DOOR, SLOT, TRANSIT, ResourceArbiter
+from .batch import BatchReport, plan_picks, route_length
+from .config import LIFT_DZ, PLACE_DZ, Speeds, Thresholds, Waypoints
 from hardware.arm import ArmInterface
 from hardware.emg import EMGReader
 from .utils import clamp
 from .gesture import GestureDecoder, Intent
+from .instrumentation import ARM, DECODE, EMG_READ, FSM, SAFETY, TICK, TickProfiler
+from .transitions import Table, Transition, compile_table, validate_table
 
 if TYPE_CHECKING:
     from safety.interlocks import SafetySupervisor
 
+    from .profiles import OperatorProfile
+
 
 class State(Enum):
     """Controller states."""
@@ -37,10 +43,20 @@ class State(Enum):
     ABORT = auto()
 
 
+_MOTION_CONTEXT = {s: f"state:{s.name}" for s in State}
+# Designed door travel times; the loop blocks for these inside a tick.
+DOOR_OPEN_S = 0.4
+DOOR_CLOSE_S = 0.3
+# No motion in flight and nothing gripped: live tuning may be swapped in.
+_RECONFIGURABLE = frozenset({State.IDLE, State.SELECT_BIN})
+
+
 @dataclass
 class ControllerEvent:
     """Event log emitted after each tick."""
 
+    __slots__ = ("state", "intent", "selected_bin", "door_open", "last_grip_closed")
+
     state: State
     intent: Intent
     selected_bin: int
@@ -52,6 +68,12 @@ class ControllerEvent:
 class SterilizationController:
     """
     Core controller that advances the workflow based on decoded intents.
+
+    The workflow itself is the ``TRANSITIONS`` table below. With
+    ``emit_on_change`` the tick returns None unless state, intent, bin, door
+    or grip changed; with ``reuse_event`` one ControllerEvent is updated in
+    place instead of allocating a new one per tick. Attaching a
+    ``profiler`` times each stage of sampled ticks.
     """
 
     arm: ArmInterface
@@ -65,6 +87,25 @@ class SterilizationController:
     _last_grip_action_close: bool = False
     _decoder: Optional[GestureDecoder] = None
     safety: Optional["SafetySupervisor"] = None
+    batch_mode: bool = False
+    batch_reports: List[BatchReport] = field(default_factory=list)
+    _batch_queue: List[int] = field(default_factory=list)
+    _batch_plan: List[int] = field(default_factory=list)
+    _batch_order: Tuple[int, ...] = ()
+    _batch_travel_m: float = 0.0
+    _batch_started: float = 0.0
+    _door_cycles: int = 0
+    arbiter: Optional[ResourceArbiter] = None
+    cell_id: str = "cell"
+    arbiter_priority: int = 0
+    emit_on_change: bool = False
+    reuse_event: bool = False
+    _last_event: Optional[ControllerEvent] = None
+    profiler: Optional[TickProfiler] = None
+    last_sample: Tuple[float, float] = (0.0, 0.0)
+    operator_id: str = ""
+    block_hook: Optional[Callable[[float], None]] = None
+    _abort_request: str = ""
 
     def __post_init__(self) -> None:
         self._decoder = GestureDecoder(self.thresholds)
@@ -75,103 +116,331 @@ class SterilizationController:
         return self._decoder
 
     def move_to(self, xyz: Tuple[float, float, float], speed: float) -> None:
+        prof = self.profiler
+        t0 = monotonic_ns() if prof is not None and prof.active else 0
         if self.safety is not None:
-            self.safety.require_motion(f"state:{self.state.name}")
+            self.safety.require_motion(_MOTION_CONTEXT[self.state])
+        if t0:
+            t0 = prof.record(SAFETY, t0)
         x, y, z = xyz
         self.arm.move_pose(x, y, z, speed=clamp(speed, 0.1, 1.0))
+        if t0:
+            prof.record(ARM, t0)
 
     def grip(self, close: bool) -> None:
+        prof = self.profiler
+        t0 = monotonic_ns() if prof is not None and prof.active else 0
         if self.safety is not None:
             self.safety.require_motion("grip")
+        if t0:
+            t0 = prof.record(SAFETY, t0)
         (self.arm.close_gripper if close else self.arm.open_gripper)()
-        sleep(self.speeds.grip_time_s)
+        if t0:
+            prof.record(ARM, t0)
+        self._block(self.speeds.grip_time_s)
         self._last_grip_action_close = close
 
     def toggle_door(self) -> None:
-        sleep(0.4 if not self.door_open else 0.3)
+        self._block(DOOR_OPEN_S if not self.door_open else DOOR_CLOSE_S)
         self.door_open = not self.door_open
+        if self.door_open:
+            self._door_cycles += 1
+
+    def _block(self, seconds: float) -> None:
+        if self.block_hook is not None:
+            self.block_hook(seconds)
+        sleep(seconds)
+
+    def request_abort(self, reason: str) -> None:
+        """Abort and home at the start of the next tick; safe to call from another thread."""
+        self._abort_request = reason
+
+    def acquire(self, *resources: str) -> bool:
+        """Lease shared resources; without an arbiter the cell owns everything."""
+        if self.arbiter is None:
+            return True
+        return self.arbiter.try_acquire(self.cell_id, resources, self.arbiter_priority) is not None
+
+    def release(self, *resources: str) -> None:
+        if self.arbiter is not None:
+            self.arbiter.release(self.cell_id, resources or None)
+
+    def apply_config(
+        self,
+        thresholds: Optional[Thresholds] = None,
+        speeds: Optional[Speeds] = None,
+        waypoints: Optional[Waypoints] = None,
+    ) -> bool:
+        """
+        Swap in new tuning between ticks; returns False (nothing applied) if
+        the FSM is not in a reconfigurable state.
+
+        Thresholds and speeds change in IDLE or SELECT_BIN; waypoints only in
+        IDLE with no bins queued, since bin indices refer to them.
+        """
+        if self.state not in _RECONFIGURABLE:
+            return False
+        if waypoints is not None and (self.state is not State.IDLE or self._batch_queue):
+            return False
+        if thresholds is not None:
+            self.thresholds = thresholds
+            self.decoder.thresholds = thresholds
+        if speeds is not None:
+            self.speeds = speeds
+        if waypoints is not None:
+            self.waypoints = waypoints
+            self.selected_bin = min(self.selected_bin, len(waypoints.bins) - 1)
+        return True
+
+    def switch_operator(self, profile: "OperatorProfile") -> bool:
+        """
+        Load an operator's calibration (thresholds, rest baseline, gains).
+
+        Same states as ``apply_config``; the decoder is replaced, so no press
+        or cooldown carries over from the previous operator.
+        """
+        if self.state not in _RECONFIGURABLE:
+            return False
+        self.thresholds = profile.thresholds
+        self._decoder = GestureDecoder(profile.thresholds, profile.baseline_mean, profile.gains)
+        self.operator_id = profile.operator_id
+        return True
+
+    def queue_bins(self, indices: Sequence[int]) -> None:
+        """Queue bins for the next autoclave load (batch mode)."""
+        for idx in indices:
+            if not 0 <= idx < len(self.waypoints.bins):
+                raise ValueError(f"bin index {idx} out of range")
+            self._batch_queue.append(idx)
 
-    def tick(self) -> ControllerEvent:
-        ch1, ch2 = self.emg.read()
+    @property
+    def batch_pending(self) -> Tuple[int, ...]:
+        return tuple(self._batch_queue) + tuple(self._batch_plan)
+
+    def _start_batch(self) -> None:
+        order = plan_picks(
+            self._batch_queue, self.waypoints.bins, self.waypoints.home, self.waypoints.autoclave
+        )
+        self._batch_queue.clear()
+        self._batch_order = tuple(order)
+        self._batch_travel_m = route_length(
+            order, self.waypoints.bins, self.waypoints.home, self.waypoints.autoclave
+        )
+        self._batch_started = monotonic()
+        self._door_cycles = 0
+        self.selected_bin = order[0]
+        self._batch_plan = order[1:]
+
+    def _finish_batch(self) -> None:
+        if not self._batch_order:
+            return
+        self.batch_reports.append(
+            BatchReport(
+                bins=self._batch_order,
+                picks=len(self._batch_order),
+                door_cycles=self._door_cycles,
+                travel_m=self._batch_travel_m,
+                duration_s=monotonic() - self._batch_started,
+            )
+        )
+        self._batch_order = ()
+
+    def _clear_batch(self) -> None:
+        self._batch_queue.clear()
+        self._batch_plan.clear()
+        self._batch_order = ()
+
+    def tick(self, sample: Optional[Tuple[float, float]] = None) -> Optional[ControllerEvent]:
+        """Advance one step; ``sample`` overrides reading ``emg`` (async acquisition)."""
+        prof = self.profiler
+        start = t0 = monotonic_ns() if prof is not None and prof.begin_tick() else 0
+        sample = self.emg.read() if sample is None else sample
+        self.last_sample = sample
+        ch1, ch2 = sample
+        if t0:
+            t0 = prof.record(EMG_READ, t0)
         self.decoder.update(ch1, ch2)
         intent = self.decoder.intent()
-
-        if intent == Intent.ABORT:
-            if self.safety is not None:
-                self.safety.latch_estop()
+        if t0:
+            t0 = prof.record(DECODE, t0)
+        if self.arbiter is not None:
+            # Keep held leases alive however long a pick or placement takes.
+            self.arbiter.renew(self.cell_id)
+        if self._abort_request:
+            # Requested off-thread (watchdog); the arm is only ever driven from here.
+            self._abort_request = ""
             self.state = State.ABORT
 
-        if self.state == State.IDLE:
-            if intent == Intent.START:
-                if self.safety is not None:
-                    try:
-                        self.safety.require_cycle_start()
-                    except Exception:
-                        self.state = State.ABORT
-                        return self._event(intent)
-                self.state = State.SELECT_BIN
-
-        elif self.state == State.SELECT_BIN:
-            if intent == Intent.START:
-                self.selected_bin = (self.selected_bin + 1) % len(self.waypoints.bins)
-            elif intent == Intent.GRIP:
-                self.state = State.APPROACH
-
-        elif self.state == State.APPROACH:
-            self.move_to(self.waypoints.bins[self.selected_bin], self.speeds.approach)
-            self.state = State.GRIP
-
-        elif self.state == State.GRIP:
-            if intent == Intent.GRIP:
-                self.grip(close=True)
-                self.state = State.LIFT
-
-        elif self.state == State.LIFT:
-            x, y, z = self.waypoints.bins[self.selected_bin]
-            self.move_to((x, y, z + 0.10), self.speeds.retract)
-            self.state = State.TRANSIT
-
-        elif self.state == State.TRANSIT:
+        for row in _DISPATCH[self.state.value][intent.value]:
+            if row.guard is None or row.guard(self):
+                if row.action is not None:
+                    row.action(self)
+                self.state = row.target
+                break
+        if t0:
+            prof.record(FSM, t0)
+        event = self._event(intent)
+        if start:
+            prof.record(TICK, start)
+        return event
+
+    # -- guards -----------------------------------------------------------
+
+    def _cycle_start_ok(self) -> bool:
+        if self.safety is None:
+            return True
+        try:
+            self.safety.require_cycle_start()
+        except Exception:
+            return False
+        return True
+
+    def _batch_enabled(self) -> bool:
+        return self.batch_mode
+
+    def _autoclave_zone_clear(self) -> bool:
+        # The autoclave pose is inside the door/slot zone: lease it before moving there.
+        return self.acquire(DOOR, SLOT, TRANSIT)
+
+    def _door_free(self) -> bool:
+        return not self.door_open and self.acquire(DOOR, SLOT)
+
+    def _door_held_open(self) -> bool:
+        # Mid-batch: the door stays open between picks.
+        return self.door_open and self.acquire(DOOR, SLOT)
+
+    def _release_next_pick(self) -> bool:
+        return self._last_grip_action_close and bool(self._batch_plan)
+
+    def _release_last_pick(self) -> bool:
+        return self._last_grip_action_close
+
+    def _door_is_open(self) -> bool:
+        return self.door_open
+
+    # -- actions ----------------------------------------------------------
+
+    def _next_bin(self) -> None:
+        self.selected_bin = (self.selected_bin + 1) % len(self.waypoints.bins)
+
+    def _queue_selected(self) -> None:
+        self.queue_bins((self.selected_bin,))
+
+    def _begin_pick(self) -> None:
+        if self.batch_mode and self._batch_queue:
+            self._start_batch()
+
+    def _approach(self) -> None:
+        self.move_to(self.waypoints.bins[self.selected_bin], self.speeds.approach)
+
+    def _close_grip(self) -> None:
+        self.grip(close=True)
+
+    def _lift(self) -> None:
+        x, y, z = self.waypoints.bins[self.selected_bin]
+        self.move_to((x, y, z + LIFT_DZ), self.speeds.retract)
+
+    def _transit(self) -> None:
+        try:
             self.move_to(self.waypoints.autoclave, self.speeds.move)
-            self.state = State.OPEN_AUTOCLAVE
-
-        elif self.state == State.OPEN_AUTOCLAVE:
-            if intent == Intent.OPEN_DOOR:
-                self.toggle_door()
-                self.state = State.PLACE
-
-        elif self.state == State.PLACE:
-            ax, ay, az = self.waypoints.autoclave
-            self.move_to((ax, ay, az - 0.05), self.speeds.approach)
-            if intent == Intent.GRIP and self._last_grip_action_close:
-                self.grip(close=False)
-                self.state = State.CLOSE_AUTOCLAVE
-
-        elif self.state == State.CLOSE_AUTOCLAVE:
-            if self.door_open and intent == Intent.OPEN_DOOR:
-                self.toggle_door()
-                self.state = State.HOME
-
-        elif self.state == State.HOME:
-            self.move_to(self.waypoints.home, self.speeds.move)
-            if self.safety is not None:
-                self.safety.duty.record_cycle_complete()
-            self.state = State.IDLE
+        finally:
+            self.release(TRANSIT)
+
+    def _hover_place(self) -> None:
+        ax, ay, az = self.waypoints.autoclave
+        self.move_to((ax, ay, az - PLACE_DZ), self.speeds.approach)
 
-        elif self.state == State.ABORT:
-            try:
-                self.arm.home()
-            finally:
-                self.state = State.IDLE
+    def _place(self) -> None:
+        self._hover_place()
+        self.grip(close=False)
 
-        return self._event(intent)
+    def _place_and_continue(self) -> None:
+        self._place()
+        self.selected_bin = self._batch_plan.pop(0)
 
-    def _event(self, intent: Intent) -> ControllerEvent:
-        return ControllerEvent(
+    def _close_door(self) -> None:
+        self.toggle_door()
+
+    def _return_home(self) -> None:
+        # Door and slot stay leased until the arm has left the autoclave zone.
+        self.move_to(self.waypoints.home, self.speeds.move)
+        self.release(DOOR, SLOT)
+        if self.safety is not None:
+            self.safety.duty.record_cycle_complete()
+        self._finish_batch()
+
+    def _abort_home(self) -> None:
+        self._clear_batch()
+        try:
+            self.arm.home()
+        finally:
+            self.release()
+            self.state = State.IDLE
+
+    def _estop_abort(self) -> None:
+        if self.safety is not None:
+            self.safety.latch_estop()
+        self.state = State.ABORT
+        self._abort_home()
+
+    def _event(self, intent: Intent) -> Optional[ControllerEvent]:
+        ev = self._last_event
+        if ev is not None and self.emit_on_change and (
+            ev.state is self.state
+            and ev.intent is intent
+            and ev.selected_bin == self.selected_bin
+            and ev.door_open == self.door_open
+            and ev.last_grip_closed == self._last_grip_action_close
+        ):
+            return None
+        if ev is not None and self.reuse_event:
+            ev.state = self.state
+            ev.intent = intent
+            ev.selected_bin = self.selected_bin
+            ev.door_open = self.door_open
+            ev.last_grip_closed = self._last_grip_action_close
+            return ev
+        ev = ControllerEvent(
             state=self.state,
             intent=intent,
             selected_bin=self.selected_bin,
             door_open=self.door_open,
             last_grip_closed=self._last_grip_action_close,
         )
-
+        self._last_event = ev
+        return ev
+
+
+def _build_transitions() -> Tuple[Transition, ...]:
+    ctl = SterilizationController
+    return (
+        Transition(State.IDLE, Intent.START, State.SELECT_BIN, guard=ctl._cycle_start_ok),
+        Transition(State.IDLE, Intent.START, State.ABORT),
+        Transition(State.SELECT_BIN, Intent.START, State.SELECT_BIN, ctl._next_bin),
+        Transition(
+            State.SELECT_BIN, Intent.OPEN_DOOR, State.SELECT_BIN, ctl._queue_selected, ctl._batch_enabled
+        ),
+        Transition(State.SELECT_BIN, Intent.GRIP, State.APPROACH, ctl._begin_pick),
+        Transition(State.APPROACH, None, State.GRIP, ctl._approach),
+        Transition(State.GRIP, Intent.GRIP, State.LIFT, ctl._close_grip),
+        Transition(State.LIFT, None, State.TRANSIT, ctl._lift),
+        Transition(State.TRANSIT, None, State.OPEN_AUTOCLAVE, ctl._transit, ctl._autoclave_zone_clear),
+        Transition(State.OPEN_AUTOCLAVE, Intent.OPEN_DOOR, State.PLACE, ctl.toggle_door, ctl._door_free),
+        Transition(State.OPEN_AUTOCLAVE, None, State.PLACE, guard=ctl._door_held_open),
+        Transition(State.PLACE, Intent.GRIP, State.APPROACH, ctl._place_and_continue, ctl._release_next_pick),
+        Transition(State.PLACE, Intent.GRIP, State.CLOSE_AUTOCLAVE, ctl._place, ctl._release_last_pick),
+        Transition(State.PLACE, None, State.PLACE, ctl._hover_place),
+        Transition(State.CLOSE_AUTOCLAVE, Intent.OPEN_DOOR, State.HOME, ctl._close_door, ctl._door_is_open),
+        Transition(State.HOME, None, State.IDLE, ctl._return_home),
+        Transition(State.ABORT, None, State.IDLE, ctl._abort_home),
+    ) + tuple(Transition(s, Intent.ABORT, State.IDLE, ctl._estop_abort) for s in State)
+
+
+TRANSITIONS: Tuple[Transition, ...] = _build_transitions()
+
+_DISPATCH: Table = compile_table(TRANSITIONS, State, Intent)
+
+
+def validate_transitions() -> List[str]:
+    """Static check of ``TRANSITIONS``; returns a list of problems (empty if sound)."""
+    return validate_table(TRANSITIONS, State, initial=State.IDLE, abort_intent=Intent.ABORT)
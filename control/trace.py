@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import queue
+import threading
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from time import time
@@ -12,21 +14,60 @@ from .state_machine import ControllerEvent
 
 
 class TraceWriter:
-    def __init__(self, path: Optional[Path] = None) -> None:
+    """
+    Append JSONL rows to ``path``.
+
+    With ``background=True`` the caller only serializes the payload to plain
+    data; JSON encoding and file writes happen on a writer thread, and
+    ``queue_depth`` reports how many rows are waiting.
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, background: bool = False) -> None:
         self.path = path
         self._fh = open(path, "a", encoding="utf-8") if path else None
+        self._lock = threading.Lock()
+        self._queue: Optional["queue.SimpleQueue[Optional[dict]]"] = None
+        self._thread: Optional[threading.Thread] = None
+        if background and self._fh is not None:
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(target=self._drain, name="trace-writer", daemon=True)
+            self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
 
     def emit(self, event_type: str, payload: Any) -> None:
         row = {"ts": time(), "type": event_type, "payload": self._serialize(payload)}
-        line = json.dumps(row, separators=(",", ":"))
-        if self._fh:
-            self._fh.write(line + "\n")
-            self._fh.flush()
+        if self._queue is not None:
+            self._queue.put(row)
+            return
+        self._write(row)
 
     def close(self) -> None:
-        if self._fh:
-            self._fh.close()
-            self._fh = None
+        if self._queue is not None and self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue = None
+        with self._lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
+
+    def _write(self, row: dict) -> None:
+        line = json.dumps(row, separators=(",", ":"))
+        with self._lock:
+            if self._fh:
+                self._fh.write(line + "\n")
+                self._fh.flush()
+
+    def _drain(self) -> None:
+        assert self._queue is not None
+        while True:
+            row = self._queue.get()
+            if row is None:
+                return
+            self._write(row)
 
     @staticmethod
     def _serialize(obj: Any) -> Any:
@@ -38,6 +79,10 @@ class TraceWriter:
                 "door_open": obj.door_open,
                 "last_grip_closed": obj.last_grip_closed,
             }
+        if isinstance(obj, dict):
+            return {k: TraceWriter._serialize(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [TraceWriter._serialize(v) for v in obj]
         if is_dataclass(obj):
             return asdict(obj)
         if hasattr(obj, "name"):
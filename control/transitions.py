@@ -0,0 +1,95 @@
+"""
+Declarative transition tables for enum-driven state machines.
+
+A table is a sequence of ``Transition`` rows (state x intent -> guard /
+action / next state). ``compile_table`` flattens it into a dense
+``[state.value][intent.value]`` lookup of candidate rows so dispatch is two
+list indexes per tick, and ``validate_table`` checks a table statically for
+unreachable states, dead ends and missing abort paths.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+Guard = Callable[[Any], bool]
+Action = Callable[[Any], None]
+
+
+@dataclass(frozen=True)
+class Transition:
+    """One row: in ``source`` on ``intent`` (None = any), if ``guard``, run ``action``."""
+
+    source: Enum
+    intent: Optional[Enum]
+    target: Enum
+    action: Optional[Action] = None
+    guard: Optional[Guard] = None
+
+
+Table = List[List[Tuple[Transition, ...]]]
+
+
+def compile_table(
+    transitions: Sequence[Transition], states: Type[Enum], intents: Type[Enum]
+) -> Table:
+    """Dense dispatch table; intent-specific rows precede wildcard rows."""
+    width = max(i.value for i in intents) + 1
+    height = max(s.value for s in states) + 1
+    table: Table = [[() for _ in range(width)] for _ in range(height)]
+    for state in states:
+        wildcard = tuple(t for t in transitions if t.source is state and t.intent is None)
+        for intent in intents:
+            specific = tuple(t for t in transitions if t.source is state and t.intent is intent)
+            table[state.value][intent.value] = specific + wildcard
+    return table
+
+
+def validate_table(
+    transitions: Sequence[Transition],
+    states: Type[Enum],
+    *,
+    initial: Enum,
+    abort_intent: Enum,
+) -> List[str]:
+    """Return human-readable problems; an empty list means the table is sound."""
+    problems: List[str] = []
+    edges: Dict[Enum, Set[Enum]] = {s: set() for s in states}
+    for t in transitions:
+        edges[t.source].add(t.target)
+
+    reachable = _closure(initial, edges)
+    for state in states:
+        if state not in reachable:
+            problems.append(f"{state.name}: unreachable from {initial.name}")
+
+    reverse: Dict[Enum, Set[Enum]] = {s: set() for s in states}
+    for src, targets in edges.items():
+        for dst in targets:
+            reverse[dst].add(src)
+    returns = _closure(initial, reverse)
+    for state in states:
+        if state not in returns:
+            problems.append(f"{state.name}: no path back to {initial.name}")
+
+    for state in states:
+        aborts = [t for t in transitions if t.source is state and t.intent is abort_intent]
+        if not aborts:
+            problems.append(f"{state.name}: missing {abort_intent.name} transition")
+        elif all(t.guard is not None for t in aborts):
+            problems.append(f"{state.name}: {abort_intent.name} transition is guarded")
+    return problems
+
+
+def _closure(start: Enum, edges: Dict[Enum, Set[Enum]]) -> Set[Enum]:
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for nxt in edges[queue.popleft()]:
+            if nxt not in seen:
+                seen.add(nxt)
+                queue.append(nxt)
+    return seen
@@ -0,0 +1,190 @@
+"""
+Loop watchdog: heartbeat monitoring with escalating responses.
+
+The control loop calls ``Watchdog.beat()`` once per iteration (a clock read
+and two stores). A watchdog thread polls how late the next beat is, in loop
+periods, and escalates through ``Escalation`` levels as configured in
+``WatchdogPolicy``:
+
+LOG      warn once per stall
+SHED     set ``shedding`` so the runner skips trace/telemetry sinks
+INHIBIT  ``SafetySupervisor.inhibit_new_cycles`` (in-flight cycle continues)
+FAULT    latch a supervisor fault and request an abort; the loop thread
+         releases shared resources and homes the arm at its next tick
+
+Designed blocking inside a tick (grip settle, door travel) is announced
+through ``SterilizationController.block_hook`` while the watchdog runs and
+extends that iteration's allowance, so a normal cycle never escalates. The
+watchdog never drives the arm itself. When beats resume, SHED and INHIBIT are lifted; a FAULT stays latched until a
+technician clears it. Every late beat is kept in a bounded overrun history.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from time import monotonic
+from typing import Deque, Dict, List, Optional
+
+from .state_machine import SterilizationController
+
+LOGGER = logging.getLogger("musclemate.watchdog")
+
+
+class Escalation(IntEnum):
+    NONE = 0
+    LOG = 1
+    SHED = 2
+    INHIBIT = 3
+    FAULT = 4
+
+
+@dataclass(frozen=True)
+class WatchdogPolicy:
+    """Escalation thresholds in loop periods late; 0 disables a level."""
+
+    log_periods: float = 3.0
+    shed_periods: float = 10.0
+    inhibit_periods: float = 25.0
+    fault_periods: float = 100.0
+    overrun_periods: float = 1.5
+    history: int = 256
+
+    def level_for(self, periods_late: float) -> Escalation:
+        for level, limit in (
+            (Escalation.FAULT, self.fault_periods),
+            (Escalation.INHIBIT, self.inhibit_periods),
+            (Escalation.SHED, self.shed_periods),
+            (Escalation.LOG, self.log_periods),
+        ):
+            if limit and periods_late >= limit:
+                return level
+        return Escalation.NONE
+
+
+@dataclass(frozen=True)
+class Overrun:
+    """One loop iteration that took longer than ``overrun_periods``."""
+
+    at: float
+    duration_s: float
+    periods: float
+    state: str
+
+
+class Watchdog:
+    """Heartbeat watchdog for one controller loop."""
+
+    def __init__(
+        self,
+        controller: SterilizationController,
+        period_s: float,
+        policy: WatchdogPolicy = WatchdogPolicy(),
+        *,
+        poll_s: Optional[float] = None,
+    ) -> None:
+        self.controller = controller
+        self.period_s = period_s
+        self.policy = policy
+        self.poll_s = poll_s if poll_s is not None else max(0.001, period_s / 2)
+        self.level = Escalation.NONE
+        self.shedding = False
+        self.escalations: Dict[str, int] = {level.name: 0 for level in Escalation if level}
+        self.overruns: Deque[Overrun] = deque(maxlen=policy.history)
+        self.max_late_s = 0.0
+        self._last_beat = monotonic()
+        self._allowance = period_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Watchdog":
+        self._last_beat = monotonic()
+        self.controller.block_hook = self.expect_block
+        self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.controller.block_hook == self.expect_block:
+            self.controller.block_hook = None
+
+    def expect_block(self, seconds: float) -> None:
+        """The loop is about to block on purpose for ``seconds`` (loop thread only)."""
+        self._allowance += seconds
+
+    def beat(self, next_sleep_s: Optional[float] = None) -> None:
+        """
+        Called by the control loop after each iteration.
+
+        ``next_sleep_s`` announces a longer planned sleep (adaptive idle rate)
+        so it is not mistaken for a stall.
+        """
+        now = monotonic()
+        gap = now - self._last_beat
+        overdue = gap - self._allowance
+        self._last_beat = now
+        self._allowance = next_sleep_s if next_sleep_s is not None else self.period_s
+        if overdue >= (self.policy.overrun_periods - 1.0) * self.period_s:
+            self.overruns.append(Overrun(now - gap, gap, gap / self.period_s, self.controller.state.name))
+
+    def overrun_history(self) -> List[dict]:
+        return [
+            {"at": o.at, "duration_s": o.duration_s, "periods": o.periods, "state": o.state}
+            for o in list(self.overruns)
+        ]
+
+    def check(self, now: Optional[float] = None) -> Escalation:
+        """One watchdog evaluation (the thread calls this every ``poll_s``)."""
+        now = monotonic() if now is None else now
+        late = now - self._last_beat - self._allowance
+        periods = max(0.0, late) / self.period_s
+        level = self.policy.level_for(periods)
+        if level > self.level:
+            if late > self.max_late_s:
+                self.max_late_s = late
+            for step in Escalation:
+                if self.level < step <= level:
+                    self._escalate(step, late)
+            self.level = level
+        elif level is Escalation.NONE and self.level:
+            self._recover()
+        elif late > self.max_late_s:
+            self.max_late_s = late
+        return self.level
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            self.check()
+
+    def _escalate(self, level: Escalation, late: float) -> None:
+        self.escalations[level.name] += 1
+        ctl = self.controller
+        if level is Escalation.LOG:
+            LOGGER.warning("Control loop stalled: %.0f ms late in %s", 1e3 * late, ctl.state.name)
+        elif level is Escalation.SHED:
+            LOGGER.warning("Watchdog: shedding trace/telemetry")
+            self.shedding = True
+        elif level is Escalation.INHIBIT and ctl.safety is not None:
+            LOGGER.error("Watchdog: inhibiting new cycles")
+            ctl.safety.inhibit_new_cycles(f"watchdog: loop {1e3 * late:.0f} ms late")
+        elif level is Escalation.FAULT:
+            LOGGER.critical("Watchdog: loop stalled %.2f s, latching fault and requesting abort", late)
+            reason = f"watchdog: loop stalled {late:.2f} s"
+            if ctl.safety is not None:
+                ctl.safety.latch_fault(reason, kind="watchdog")
+            ctl.request_abort(reason)
+
+    def _recover(self) -> None:
+        LOGGER.info("Control loop recovered from %s", self.level.name)
+        if self.level >= Escalation.SHED:
+            self.shedding = False
+        if self.level >= Escalation.INHIBIT and self.controller.safety is not None:
+            self.controller.safety.allow_new_cycles()
+        self.level = Escalation.NONE
@@ -1,7 +1,14 @@
 """Hardware abstraction layer exports."""
 
-from .arm import ArmInterface, QArmStub
-from .emg import EMGReader, StaticEMGSource
+from .arm import ArmInterface, AsyncArmInterface, QArmStub
+from .emg import AsyncEMGReader, EMGReader, StaticEMGSource
 
-__all__ = ["ArmInterface", "QArmStub", "EMGReader", "StaticEMGSource"]
+__all__ = [
+    "ArmInterface",
+    "AsyncArmInterface",
+    "AsyncEMGReader",
+    "QArmStub",
+    "EMGReader",
+    "StaticEMGSource",
+]
 
@@ -3,10 +3,12 @@
 from .base import AdapterPhase, HardwareAdapter
 from .bench_rig import BenchRigAdapter
 from .integration_rig import IntegrationRigAdapter
+from .tcp_rig import TcpRigAdapter
 
 __all__ = [
     "AdapterPhase",
     "BenchRigAdapter",
     "HardwareAdapter",
     "IntegrationRigAdapter",
+    "TcpRigAdapter",
 ]
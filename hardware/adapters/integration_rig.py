@@ -8,6 +8,8 @@ bench commissioning checklist must pass before switching phase to integration.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
 
 from hardware.arm import ArmInterface, QArmStub
 from hardware.emg import EMGReader, StaticEMGSource
@@ -22,6 +24,7 @@ class IntegrationRigAdapter:
     name: str = "integration-rig-v1"
     _connected: bool = False
     _bench_signoff_id: str = ""
+    _bench_report: Optional[dict] = None
     _arm: ArmInterface = field(default_factory=QArmStub)
     _emg: EMGReader = field(default_factory=StaticEMGSource)
     _safety: SafetySupervisor = field(default_factory=SafetySupervisor)
@@ -42,7 +45,22 @@ class IntegrationRigAdapter:
         )
         self._connected = True
 
-    def set_bench_signoff(self, signoff_id: str) -> None:
+    def set_bench_signoff(
+        self,
+        signoff_id: str,
+        report: Union[dict, Path, str, None] = None,
+        *,
+        key: Optional[bytes] = None,
+    ) -> None:
+        """
+        Record the bench sign-off. With ``report`` (a signed report from
+        ``scripts/bench_commission.py`` or its path) the signature, ID and
+        required checks are verified first (``CommissioningError``).
+        """
+        if report is not None:
+            from hardware.commissioning import verify_report
+
+            self._bench_report = verify_report(report, signoff_id, key)
         self._bench_signoff_id = signoff_id
 
     def arm(self) -> ArmInterface:
@@ -61,6 +79,7 @@ class IntegrationRigAdapter:
             "adapter": self.name,
             "phase": self.phase.value,
             "bench_signoff_id": self._bench_signoff_id,
+            "bench_signoff_verified": self._bench_report is not None,
             "connected": self._connected,
             "safety": self._safety.snapshot(),
         }
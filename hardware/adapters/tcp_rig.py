@@ -0,0 +1,303 @@
+"""
+TCP rig adapter — client for ``hardware.rig_server`` (or real rig I/O
+speaking the same protocol).
+
+One persistent, TCP_NODELAY connection carries every command. Requests
+issued together are pipelined (written in one send, answered in order), so
+``poll`` fetches the EMG batch and the interlock inputs in a single round
+trip per control tick. Round-trip statistics are kept for tuning.
+
+Like ``IntegrationRigAdapter`` it refuses to connect without a bench
+sign-off. A failed arm command or EMG poll latches a ``rig_link`` fault;
+arm commands then raise ``SafetyFault`` instead of a raw socket error.
+"""
+
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
+
+from hardware.arm import ArmInterface
+from hardware.emg import EMGReader
+from hardware.rig_server import (
+    EMG_HEADER,
+    EMG_REQUEST,
+    EMG_SAMPLE,
+    MAX_EMG_BATCH,
+    MOVE,
+    OP_EMG,
+    OP_GRIP,
+    OP_HOME,
+    OP_INPUTS,
+    OP_MOVE,
+    OP_PING,
+    OP_POSE,
+    OP_SET_INPUTS,
+    POSE,
+    REQUEST,
+    RESPONSE,
+    STATUS_OK,
+    pack_inputs,
+    read_exact,
+    unpack_inputs,
+)
+from safety.interlocks import InterlockInputs, SafetyFault, SafetySupervisor
+
+from .base import AdapterPhase
+
+LOGGER = logging.getLogger("musclemate.tcp_rig")
+
+
+class RigError(RuntimeError):
+    """The rig answered a request with an error status."""
+
+
+class RigConnection:
+    """Persistent request/response connection with pipelining."""
+
+    def __init__(self, host: str, port: int, *, timeout_s: float = 1.0) -> None:
+        self.host = host
+        self.port = port
+        self.timeout_s = timeout_s
+        self.requests = 0
+        self.round_trips = 0
+        self.rtt_total_s = 0.0
+        self.rtt_max_s = 0.0
+        self._sock: Optional[socket.socket] = None
+        self._rfile: Optional[BinaryIO] = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout_s)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+
+    def close(self) -> None:
+        if self._rfile is not None:
+            self._rfile.close()
+            self._rfile = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    @property
+    def rtt_mean_s(self) -> float:
+        return self.rtt_total_s / self.round_trips if self.round_trips else 0.0
+
+    def call(self, op: int, payload: bytes = b"") -> bytes:
+        return self.pipeline(((op, payload),))[0]
+
+    def pipeline(self, requests: Sequence[Tuple[int, bytes]]) -> List[bytes]:
+        """Send all ``requests`` in one write, then read their responses in order."""
+        with self._lock:
+            sock, rfile = self._sock, self._rfile
+            if sock is None or rfile is None:
+                raise ConnectionError("rig connection is not open")
+            out = bytearray()
+            ids = []
+            for op, payload in requests:
+                req_id = self._next_id
+                self._next_id = (req_id + 1) & 0xFFFF
+                ids.append(req_id)
+                out += REQUEST.pack(len(payload), req_id, op)
+                out += payload
+            t0 = perf_counter()
+            sock.sendall(out)
+            bodies: List[bytes] = []
+            errors = []
+            for req_id in ids:
+                size, got_id, op, status = RESPONSE.unpack(read_exact(rfile, RESPONSE.size))
+                body = read_exact(rfile, size) if size else b""
+                if got_id != req_id:
+                    raise ConnectionError(f"rig response out of order: {got_id} != {req_id}")
+                if status != STATUS_OK:
+                    errors.append(f"op {op}: {body.decode(errors='replace')}")
+                bodies.append(body)
+            rtt = perf_counter() - t0
+            self.requests += len(ids)
+            self.round_trips += 1
+            self.rtt_total_s += rtt
+            if rtt > self.rtt_max_s:
+                self.rtt_max_s = rtt
+        if errors:
+            raise RigError("; ".join(errors))
+        return bodies
+
+
+class TcpRigArm(ArmInterface):
+    """
+    ``ArmInterface`` over a rig connection (each command waits for its ack).
+
+    With ``adapter`` a failed command latches the adapter's link fault and
+    raises ``SafetyFault``, like any other blocked move.
+    """
+
+    def __init__(self, conn: RigConnection, adapter: Optional["TcpRigAdapter"] = None) -> None:
+        self.conn = conn
+        self.adapter = adapter
+
+    def _call(self, op: int, payload: bytes = b"") -> bytes:
+        try:
+            return self.conn.call(op, payload)
+        except (OSError, RigError) as exc:
+            if self.adapter is None:
+                raise
+            self.adapter.link_lost(exc)
+            raise SafetyFault(f"rig link: {exc}") from exc
+
+    def move_pose(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        yaw: float = 0.0,
+        pitch: float = 0.0,
+        roll: float = 0.0,
+        speed: float = 0.5,
+    ) -> None:
+        self._call(OP_MOVE, MOVE.pack(x, y, z, yaw, pitch, roll, speed))
+
+    def open_gripper(self) -> None:
+        self._call(OP_GRIP, b"\x00")
+
+    def close_gripper(self) -> None:
+        self._call(OP_GRIP, b"\x01")
+
+    def home(self) -> None:
+        self._call(OP_HOME)
+
+    def read_pose(self) -> Tuple[float, float, float, float, float, float]:
+        return POSE.unpack(self._call(OP_POSE))
+
+
+class TcpEMGReader(EMGReader):
+    """Newest sample of each batch; a dead link latches a safety fault and reads rest."""
+
+    def __init__(self, adapter: "TcpRigAdapter") -> None:
+        self.adapter = adapter
+
+    def read(self) -> Tuple[float, float]:
+        try:
+            self.adapter.poll()
+        except (OSError, RigError) as exc:
+            self.adapter.link_lost(exc)
+            return (0.0, 0.0)
+        return self.adapter.last_sample
+
+
+@dataclass
+class TcpRigAdapter:
+    host: str = "127.0.0.1"
+    port: int = 7700
+    phase: AdapterPhase = AdapterPhase.INTEGRATION
+    name: str = "tcp-rig-v1"
+    emg_batch: int = 256
+    timeout_s: float = 1.0
+    last_sample: Tuple[float, float] = (0.0, 0.0)
+    last_block: List[Tuple[float, float]] = field(default_factory=list)
+    emg_time_s: float = 0.0
+    polls: int = 0
+    link_down: bool = False
+    _bench_signoff_id: str = ""
+    _bench_report: Optional[dict] = None
+    _conn: Optional[RigConnection] = None
+    _mask: int = -1
+    _safety: SafetySupervisor = field(default_factory=SafetySupervisor)
+
+    @property
+    def connection(self) -> RigConnection:
+        if self._conn is None:
+            self.connect()
+        assert self._conn is not None
+        return self._conn
+
+    def __post_init__(self) -> None:
+        if not 0 < self.emg_batch <= MAX_EMG_BATCH:
+            raise ValueError(f"emg_batch must be in 1..{MAX_EMG_BATCH}")
+
+    def set_bench_signoff(
+        self,
+        signoff_id: str,
+        report: Union[dict, Path, str, None] = None,
+        *,
+        key: Optional[bytes] = None,
+    ) -> None:
+        """Record the bench sign-off (see ``IntegrationRigAdapter.set_bench_signoff``)."""
+        if report is not None:
+            from hardware.commissioning import verify_report
+
+            self._bench_report = verify_report(report, signoff_id, key)
+        self._bench_signoff_id = signoff_id
+
+    def connect(self) -> None:
+        if not self._bench_signoff_id:
+            raise RuntimeError(
+                "TCP rig requires bench sign-off. "
+                "Set bench_signoff_id after commissioning/bench_checklist.yaml passes."
+            )
+        self._conn = RigConnection(self.host, self.port, timeout_s=self.timeout_s)
+        self._conn.connect()
+        self._conn.call(OP_PING)
+        self.link_down = False
+        self.poll()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def poll(self) -> None:
+        """One round trip: the EMG batch since the last poll plus interlock inputs."""
+        emg, inputs = self.connection.pipeline(((OP_EMG, EMG_REQUEST.pack(self.emg_batch)), (OP_INPUTS, b"")))
+        n, self.emg_time_s = EMG_HEADER.unpack_from(emg, 0)
+        if n:
+            self.last_block = [EMG_SAMPLE.unpack_from(emg, EMG_HEADER.size + i * EMG_SAMPLE.size) for i in range(n)]
+            self.last_sample = self.last_block[-1]
+        self.polls += 1
+        mask = inputs[0]
+        if mask != self._mask:  # replace only on change: the runner watches identity
+            self._mask = mask
+            self._safety.inputs = unpack_inputs(mask)
+
+    def link_lost(self, exc: BaseException) -> None:
+        """Latch a ``rig_link`` fault once per outage."""
+        if not self.link_down:
+            self.link_down = True
+            LOGGER.error("Rig link lost: %s", exc)
+            self._safety.latch_fault(f"rig link: {exc}", kind="rig_link")
+
+    def set_inputs(self, inputs: InterlockInputs) -> None:
+        """Drive the rig's interlock inputs (stand-in server only; fault injection)."""
+        self.connection.call(OP_SET_INPUTS, bytes((pack_inputs(inputs),)))
+
+    def arm(self) -> ArmInterface:
+        return TcpRigArm(self.connection, self)
+
+    def emg(self) -> EMGReader:
+        return TcpEMGReader(self)
+
+    def safety(self) -> SafetySupervisor:
+        return self._safety
+
+    def commissioning_report(self) -> dict:
+        conn = self._conn
+        return {
+            "adapter": self.name,
+            "phase": self.phase.value,
+            "address": f"{self.host}:{self.port}",
+            "bench_signoff_id": self._bench_signoff_id,
+            "bench_signoff_verified": self._bench_report is not None,
+            "connected": conn is not None and not self.link_down,
+            "requests": conn.requests if conn else 0,
+            "round_trips": conn.round_trips if conn else 0,
+            "rtt_mean_ms": 1e3 * conn.rtt_mean_s if conn else 0.0,
+            "rtt_max_ms": 1e3 * conn.rtt_max_s if conn else 0.0,
+            "safety": self._safety.snapshot(),
+        }
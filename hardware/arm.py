@@ -36,6 +36,34 @@ class ArmInterface(Protocol):
         """Read the current pose."""
 
 
+class AsyncArmInterface(Protocol):
+    """Arm driver whose commands are coroutines (network / fieldbus I/O)."""
+
+    async def move_pose(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        yaw: float = 0.0,
+        pitch: float = 0.0,
+        roll: float = 0.0,
+        speed: float = 0.5,
+    ) -> None:
+        ...
+
+    async def open_gripper(self) -> None:
+        ...
+
+    async def close_gripper(self) -> None:
+        ...
+
+    async def home(self) -> None:
+        ...
+
+    async def read_pose(self) -> Tuple[float, float, float, float, float, float]:
+        ...
+
+
 @dataclass
 class QArmStub(ArmInterface):
     """
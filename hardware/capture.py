@@ -0,0 +1,273 @@
+"""
+Columnar on-disk format for raw multi-channel EMG captures.
+
+Layout (little-endian)::
+
+    header   64-byte fixed part + JSON metadata, padded to 64 bytes
+    chunk 0  ch0 float32[n0] | ch1 float32[n0] | ...
+    chunk 1  ch0 float32[n1] | ...
+    index    per chunk: offset u64, first_sample u64, n_samples u32, pad u32
+
+Each chunk stores every channel as one contiguous float32 block, so a
+reader can mmap the file and hand out zero-copy ``memoryview`` (or, with
+numpy installed, ``numpy.memmap``) slices of multi-hour recordings without
+loading them. The header is rewritten with the index location on close; a
+capture that was never closed has ``index_offset == 0`` and is rejected.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .emg import EMGReader
+
+MAGIC = b"MMCAP1\x00\x00"
+VERSION = 1
+FIXED = struct.Struct("<8sHHdIIQIQ")
+INDEX_ENTRY = struct.Struct("<QQII")
+ALIGN = 64
+
+Samples = Union[memoryview, array]
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _to_le(block: array) -> bytes:
+    if sys.byteorder != "little":
+        block = array("f", block)
+        block.byteswap()
+    return block.tobytes()
+
+
+class CaptureWriter:
+    """Stream samples into a capture file chunk by chunk."""
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: float,
+        *,
+        channels: int = 2,
+        chunk_samples: int = 4096,
+        calibration: Optional[Dict[str, Any]] = None,
+        channel_names: Optional[Sequence[str]] = None,
+    ) -> None:
+        if channels < 1 or chunk_samples < 1:
+            raise ValueError("channels and chunk_samples must be >= 1")
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.chunk_samples = chunk_samples
+        self.total_samples = 0
+        self._index: List[Tuple[int, int, int]] = []
+        self._buf = [array("f") for _ in range(channels)]
+        meta = {
+            "calibration": calibration or {},
+            "channel_names": list(channel_names or [f"ch{i + 1}" for i in range(channels)]),
+            "started_wall": time(),
+        }
+        blob = json.dumps(meta, separators=(",", ":")).encode()
+        self._header_len = _align(FIXED.size + len(blob))
+        self._fh = open(self.path, "wb")
+        self._write_header(index_offset=0, blob=blob)
+        self._fh.write(b"\x00" * (self._header_len - FIXED.size - len(blob)))
+
+    def append(self, *values: float) -> None:
+        if len(values) != self.channels:
+            raise ValueError(f"append needs {self.channels} values, got {len(values)}")
+        for buf, value in zip(self._buf, values):
+            buf.append(value)
+        if len(self._buf[0]) >= self.chunk_samples:
+            self._flush_chunk()
+
+    def append_block(self, columns: Sequence[Sequence[float]]) -> None:
+        """Append one sequence of samples per channel (equal lengths)."""
+        if len(columns) != self.channels or len({len(c) for c in columns}) != 1:
+            raise ValueError("append_block needs one equal-length column per channel")
+        for buf, col in zip(self._buf, columns):
+            buf.extend(col)
+        while len(self._buf[0]) >= self.chunk_samples:
+            self._flush_chunk()
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        if len(self._buf[0]):
+            self._flush_chunk()
+        index_offset = self._fh.tell()
+        for entry in self._index:
+            self._fh.write(INDEX_ENTRY.pack(*entry, 0))
+        self._fh.seek(0)
+        self._write_header(index_offset=index_offset)
+        self._fh.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _flush_chunk(self) -> None:
+        n = min(len(self._buf[0]), self.chunk_samples)
+        self._index.append((self._fh.tell(), self.total_samples, n))
+        for i, buf in enumerate(self._buf):
+            self._fh.write(_to_le(buf[:n]))
+            self._buf[i] = buf[n:]
+        self.total_samples += n
+
+    def _write_header(self, index_offset: int, blob: Optional[bytes] = None) -> None:
+        self._fh.write(
+            FIXED.pack(
+                MAGIC,
+                VERSION,
+                self.channels,
+                self.sample_rate,
+                self.chunk_samples,
+                self._header_len,
+                index_offset,
+                len(self._index),
+                self.total_samples,
+            )
+        )
+        if blob is not None:
+            self._fh.write(blob)
+
+
+class CaptureReader:
+    """Memory-mapped, zero-copy access to a capture file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._fh = open(self.path, "rb")
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            self.channels,
+            self.sample_rate,
+            self.chunk_samples,
+            header_len,
+            index_offset,
+            n_chunks,
+            self.total_samples,
+        ) = FIXED.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a v{VERSION} MuscleMate capture")
+        if index_offset == 0:
+            raise ValueError(f"{path}: capture was not closed (no chunk index)")
+        blob = bytes(self._mm[FIXED.size : header_len]).rstrip(b"\x00")
+        self.meta: Dict[str, Any] = json.loads(blob)
+        self.index: List[Tuple[int, int, int]] = [
+            INDEX_ENTRY.unpack_from(self._mm, index_offset + i * INDEX_ENTRY.size)[:3]
+            for i in range(n_chunks)
+        ]
+        self._view = memoryview(self._mm)
+
+    @property
+    def calibration(self) -> Dict[str, Any]:
+        return self.meta.get("calibration", {})
+
+    @property
+    def duration_s(self) -> float:
+        return self.total_samples / self.sample_rate if self.sample_rate else 0.0
+
+    def chunk(self, idx: int, channel: int) -> memoryview:
+        """Zero-copy float32 view of one channel block in chunk ``idx``."""
+        if sys.byteorder != "little":
+            raise RuntimeError("zero-copy views require a little-endian host")
+        offset, _, n = self.index[idx]
+        start = offset + channel * n * 4
+        return self._view[start : start + n * 4].cast("f")
+
+    def read(self, channel: int, start: int = 0, stop: Optional[int] = None) -> Samples:
+        """Samples ``[start, stop)`` of ``channel``; zero-copy within one chunk."""
+        stop = self.total_samples if stop is None else min(stop, self.total_samples)
+        parts = list(self._spans(channel, start, stop))
+        if len(parts) == 1:
+            return parts[0]
+        out = array("f")
+        for part in parts:
+            out.frombytes(part.tobytes())
+        return out
+
+    def numpy(self, channel: int, start: int = 0, stop: Optional[int] = None) -> Any:
+        """``numpy.memmap``-backed slice (requires numpy); copies only across chunks."""
+        import numpy as np
+
+        stop = self.total_samples if stop is None else min(stop, self.total_samples)
+        parts = []
+        for offset, first, n in self.index:
+            lo, hi = max(start, first), min(stop, first + n)
+            if lo >= hi:
+                continue
+            base = offset + channel * n * 4 + (lo - first) * 4
+            parts.append(np.memmap(self.path, dtype="<f4", mode="r", offset=base, shape=(hi - lo,)))
+        if not parts:
+            return np.empty(0, dtype="<f4")
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def iter_samples(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> Iterator[Tuple[float, ...]]:
+        """Yield per-sample channel tuples (every ``step``-th sample)."""
+        stop = self.total_samples if stop is None else min(stop, self.total_samples)
+        for idx, (_, first, n) in enumerate(self.index):
+            lo, hi = max(start, first), min(stop, first + n)
+            if lo >= hi:
+                continue
+            skip = (-(lo - start)) % step
+            cols = [self.chunk(idx, ch) for ch in range(self.channels)]
+            for i in range(lo - first + skip, hi - first, step):
+                yield tuple(col[i] for col in cols)
+
+    def close(self) -> None:
+        """Unmap the file; views still held by callers keep the mapping alive."""
+        try:
+            self._view.release()
+            self._mm.close()
+        except BufferError:
+            pass
+        self._fh.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _spans(self, channel: int, start: int, stop: int) -> Iterator[memoryview]:
+        for idx, (_, first, n) in enumerate(self.index):
+            lo, hi = max(start, first), min(stop, first + n)
+            if lo < hi:
+                yield self.chunk(idx, channel)[lo - first : hi - first]
+
+
+class CaptureEMGSource(EMGReader):
+    """Two-channel EMGReader stepping through a capture, ``stride`` samples per read."""
+
+    def __init__(self, reader: CaptureReader, *, stride: int = 1, repeat: bool = False) -> None:
+        if reader.channels < 2:
+            raise ValueError("CaptureEMGSource needs at least two channels")
+        self.reader = reader
+        self.stride = max(1, stride)
+        self.repeat = repeat
+        self._iter = reader.iter_samples(step=self.stride)
+        self._last: Tuple[float, float] = (0.0, 0.0)
+
+    def read(self) -> Tuple[float, float]:
+        try:
+            sample = next(self._iter)
+        except StopIteration:
+            if not self.repeat:
+                return self._last
+            self._iter = self.reader.iter_samples(step=self.stride)
+            sample = next(self._iter, self._last)
+        self._last = (sample[0], sample[1])
+        return self._last
@@ -0,0 +1,500 @@
+"""
+Automated bench commissioning against ``commissioning/bench_checklist.yaml``.
+
+Each checklist ID maps to a ``Check`` that runs on its own freshly connected
+``BenchRigAdapter``, so independent checks run concurrently. A passing
+result is cached under a key built from the check, the rig (the identity
+file ``commissioning/bench_rig.yaml``, edited per bench, plus the adapter's
+nominal inputs) and the software it exercises (package version plus a
+digest of the source modules and data files the check depends on).
+Re-commissioning therefore re-runs only the checks whose inputs changed;
+failures are never cached. Cache entries are authenticated with the
+sign-off key and expire after ``CACHE_MAX_AGE_S``; a rig whose ``rig_id``
+is still ``UNASSIGNED`` is never cached.
+
+The resulting report is signed with HMAC-SHA256 over its canonical JSON.
+``IntegrationRigAdapter.set_bench_signoff(signoff_id, report)`` refuses a
+report whose signature, sign-off ID or required checks do not hold up.
+The key comes from ``MUSCLEMATE_SIGNOFF_KEY`` or, failing that, a random
+per-host key created next to the cache.
+
+    PWR-01   drive power input gates motion
+    ESTOP-01 E-stop latches; clearing needs the technician key
+    IO-01    door / gripper / light-curtain inputs each block motion
+    MOT-01   bench motion probe completes
+    SEQ-01   manufacturing_validation runs with interlocks armed
+    DOC-01   passes once docs/INTEGRATION_HANDOFF.md records the signoff_id
+             (manual: record it and re-run; cached checks are reused)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import importlib.util
+import json
+import logging
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter, time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from safety.interlocks import InterlockInputs, SafetyFault
+
+from .adapters.bench_rig import BenchRigAdapter
+from .workspace import default_cache_dir
+
+LOGGER = logging.getLogger("musclemate.commissioning")
+
+ROOT = Path(__file__).resolve().parents[1]
+CHECKLIST = ROOT / "commissioning" / "bench_checklist.yaml"
+RIG_CONFIG = ROOT / "commissioning" / "bench_rig.yaml"
+HANDOFF = ROOT / "docs" / "INTEGRATION_HANDOFF.md"
+UNASSIGNED_RIG = "UNASSIGNED"
+CACHE_MAX_AGE_S = 7 * 24 * 3600.0
+SIGNOFF_KEY_ENV = "MUSCLEMATE_SIGNOFF_KEY"
+REPORT_VERSION = 1
+
+
+class CommissioningError(RuntimeError):
+    """A commissioning check failed or a sign-off report did not verify."""
+
+
+# -- checklist -------------------------------------------------------------
+
+
+def _scalar(text: str) -> Any:
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    if text in ("true", "false"):
+        return text == "true"
+    return text
+
+
+def parse_checklist(text: str) -> Dict[str, Any]:
+    """
+    Parse the checklist YAML subset: top-level scalars, one-level mappings
+    and lists of flat mappings (``- key: value``). Comments are dropped.
+    """
+    doc: Dict[str, Any] = {}
+    section: Optional[str] = None
+    item: Optional[Dict[str, Any]] = None
+    for lineno, raw in enumerate(text.splitlines(), 1):
+        line = raw.split(" #", 1)[0].rstrip() if not raw.lstrip().startswith("#") else ""
+        if not line.strip():
+            continue
+        indent = len(line) - len(line.lstrip())
+        body = line.strip()
+        if indent == 0:
+            key, sep, value = body.partition(":")
+            if not sep:
+                raise ValueError(f"checklist line {lineno}: expected 'key: value'")
+            section, item = (key, None) if not value.strip() else (None, None)
+            doc[key] = _scalar(value) if value.strip() else None
+            continue
+        if section is None:
+            raise ValueError(f"checklist line {lineno}: unexpected indentation")
+        if body.startswith("- "):
+            if doc[section] is None:
+                doc[section] = []
+            item = {}
+            doc[section].append(item)
+            body = body[2:]
+        key, sep, value = body.partition(":")
+        if not sep:
+            raise ValueError(f"checklist line {lineno}: expected 'key: value'")
+        if item is not None:
+            item[key.strip()] = _scalar(value)
+        else:
+            if doc[section] is None:
+                doc[section] = {}
+            doc[section][key.strip()] = _scalar(value)
+    return doc
+
+
+def load_checklist(path: Path = CHECKLIST) -> Dict[str, Any]:
+    return parse_checklist(Path(path).read_text(encoding="utf-8"))
+
+
+# -- checks ----------------------------------------------------------------
+
+
+def _blocks_motion(adapter: BenchRigAdapter, **inputs: bool) -> bool:
+    safety = adapter.safety()
+    safety.inputs = replace(safety.inputs, **inputs)
+    try:
+        safety.require_motion("commissioning")
+    except SafetyFault:
+        return True
+    finally:
+        safety.clear_estop(technician_key=True)
+        safety.inputs = replace(safety.inputs, **{k: not v for k, v in inputs.items()})
+    return False
+
+
+def check_power(adapter: BenchRigAdapter) -> dict:
+    if not adapter.safety().motion_allowed():
+        raise CommissioningError("motion not allowed with nominal inputs")
+    if not _blocks_motion(adapter, drive_power_ok=False):
+        raise CommissioningError("drive power loss did not block motion")
+    return {"drive_power_gates_motion": True}
+
+
+def check_estop(adapter: BenchRigAdapter) -> dict:
+    safety = adapter.safety()
+    safety.latch_estop()
+    try:
+        safety.require_motion("estop")
+    except SafetyFault:
+        pass
+    else:
+        raise CommissioningError("motion allowed with E-stop latched")
+    if safety.clear_estop(technician_key=False) or safety.motion_allowed():
+        raise CommissioningError("E-stop cleared without technician key")
+    if not safety.clear_estop(technician_key=True) or not safety.motion_allowed():
+        raise CommissioningError("E-stop did not clear with technician key")
+    return {"latched": True, "key_required": True}
+
+
+IO_INPUTS = ("door_closed", "gripper_pressure_ok", "light_curtain_clear", "technician_enable")
+
+
+def check_io(adapter: BenchRigAdapter) -> dict:
+    blocked = {name: _blocks_motion(adapter, **{name: False}) for name in IO_INPUTS}
+    open_inputs = [name for name, ok in blocked.items() if not ok]
+    if open_inputs:
+        raise CommissioningError(f"inputs do not block motion: {', '.join(open_inputs)}")
+    return {"inputs": list(IO_INPUTS)}
+
+
+def check_motion(adapter: BenchRigAdapter) -> dict:
+    probe = adapter.run_bench_motion_probe()
+    return {"poses": probe["poses"]}
+
+
+def _validation_sequence():
+    from sequences.registry import default_registry
+
+    registry = default_registry()
+    return registry, registry.get("manufacturing_validation")
+
+
+def check_sequence(adapter: BenchRigAdapter) -> dict:
+    from sequences import run_sequence_on_arm
+
+    _, sequence = _validation_sequence()
+    log = run_sequence_on_arm(adapter.arm(), sequence, adapter.safety())
+    return {"sequence": f"{sequence.name}@{sequence.version}", "steps": len(log)}
+
+
+def _sequence_files() -> List[Path]:
+    registry, sequence = _validation_sequence()
+    return [registry.resolve(f"{sequence.name}@{sequence.version}")]
+
+
+@dataclass(frozen=True)
+class Check:
+    """One automated checklist item and the software it exercises."""
+
+    id: str
+    run: Callable[[BenchRigAdapter], dict]
+    modules: Tuple[str, ...] = ()
+    files: Callable[[], List[Path]] = list
+
+
+_CORE = ("safety.interlocks", "hardware.adapters.bench_rig", "hardware.commissioning")
+
+CHECKS: Dict[str, Check] = {
+    "PWR-01": Check("PWR-01", check_power, _CORE),
+    "ESTOP-01": Check("ESTOP-01", check_estop, _CORE),
+    "IO-01": Check("IO-01", check_io, _CORE),
+    "MOT-01": Check("MOT-01", check_motion, _CORE + ("hardware.arm",)),
+    "SEQ-01": Check(
+        "SEQ-01",
+        check_sequence,
+        _CORE + ("hardware.arm", "sequences.motion_sequences", "sequences.registry"),
+        _sequence_files,
+    ),
+}
+RECORDED_IN_HANDOFF = ("DOC-01",)
+
+
+def handoff_records(path: Path, signoff_id: str) -> bool:
+    """True if the handoff document at ``path`` mentions ``signoff_id``."""
+    try:
+        return signoff_id in Path(path).read_text(encoding="utf-8")
+    except OSError:
+        return False
+
+
+# -- cache keys ------------------------------------------------------------
+
+
+def software_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        return version("musclemate")
+    except PackageNotFoundError:
+        return "0+local"
+
+
+def _digest_files(paths: Sequence[Path]) -> str:
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(str(path.name).encode())
+        h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
+def _module_files(modules: Sequence[str]) -> List[Path]:
+    out = []
+    for name in modules:
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.origin is None:
+            raise CommissioningError(f"cannot locate module {name!r}")
+        out.append(Path(spec.origin))
+    return out
+
+
+def rig_config(factory: Callable[[], BenchRigAdapter] = BenchRigAdapter, path: Path = RIG_CONFIG) -> Dict[str, Any]:
+    """The rig identity file, plus the adapter and its nominal interlock inputs after bring-up."""
+    identity = parse_checklist(Path(path).read_text(encoding="utf-8"))
+    adapter = factory()
+    adapter.connect()
+    inputs: InterlockInputs = adapter.safety().inputs
+    return {"identity": identity, "adapter": adapter.name, "phase": adapter.phase.value, "inputs": asdict(inputs)}
+
+
+def _canonical(doc: Any) -> bytes:
+    return json.dumps(doc, sort_keys=True, separators=(",", ":")).encode()
+
+
+def check_key(check: Check, item: Dict[str, Any], rig: Dict[str, Any], version: str) -> str:
+    h = hashlib.sha256(_canonical({"id": check.id, "item": item, "rig": rig, "version": version}))
+    h.update(_digest_files(_module_files(check.modules) + list(check.files())).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Passing check results on disk, one JSON document keyed by ``check_key``.
+
+    Each entry carries its time and an HMAC under ``key``; an entry that
+    does not verify or is older than ``max_age_s`` is a miss.
+    """
+
+    def __init__(self, path: Path, key: bytes, max_age_s: float = CACHE_MAX_AGE_S) -> None:
+        self.path = Path(path)
+        self.key = key
+        self.max_age_s = max_age_s
+        try:
+            self.entries: Dict[str, dict] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _mac(self, cache_key: str, entry: dict) -> str:
+        body = {k: v for k, v in entry.items() if k != "mac"}
+        return hmac.new(self.key, _canonical({"key": cache_key, **body}), hashlib.sha256).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[dict]:
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            return None
+        if not hmac.compare_digest(str(entry.get("mac", "")), self._mac(cache_key, entry)):
+            LOGGER.warning("Ignoring unauthenticated cache entry for %s", entry.get("id"))
+            return None
+        if not isinstance(entry.get("at"), (int, float)) or time() - entry["at"] > self.max_age_s:
+            return None
+        return entry
+
+    def put(self, cache_key: str, result: dict) -> None:
+        entry = {**result, "at": time()}
+        entry["mac"] = self._mac(cache_key, entry)
+        self.entries[cache_key] = entry
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# -- signing ---------------------------------------------------------------
+
+
+def signoff_key(cache_dir: Optional[Path] = None) -> bytes:
+    env = os.environ.get(SIGNOFF_KEY_ENV)
+    if env:
+        return env.encode()
+    path = Path(cache_dir or default_cache_dir()) / "signoff.key"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        key = secrets.token_hex(32).encode()
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(key)
+        return key
+
+
+def sign_report(report: Dict[str, Any], key: bytes) -> Dict[str, Any]:
+    body = {k: v for k, v in report.items() if k != "signature"}
+    return {**body, "signature": hmac.new(key, _canonical(body), hashlib.sha256).hexdigest()}
+
+
+def verify_report(
+    report: Union[Dict[str, Any], Path, str],
+    signoff_id: Optional[str] = None,
+    key: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    """Return the verified report or raise ``CommissioningError``."""
+    if not isinstance(report, dict):
+        report = json.loads(Path(report).read_text(encoding="utf-8"))
+    body = {k: v for k, v in report.items() if k != "signature"}
+    expected = hmac.new(key or signoff_key(), _canonical(body), hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(str(report.get("signature", "")), expected):
+        raise CommissioningError("sign-off report signature does not verify")
+    if signoff_id is not None and report.get("signoff_id") != signoff_id:
+        raise CommissioningError(f"report is for {report.get('signoff_id')!r}, not {signoff_id!r}")
+    checks = report.get("checks", [])
+    failed = [c["id"] for c in checks if c.get("required") and c.get("status") != "pass"]
+    if failed or not report.get("passed"):
+        raise CommissioningError(f"required checks not passed: {', '.join(failed) or 'report not passed'}")
+    return report
+
+
+# -- runner ----------------------------------------------------------------
+
+
+@dataclass
+class CheckResult:
+    id: str
+    item: str
+    required: bool
+    status: str  # pass | fail | manual
+    cached: bool = False
+    duration_s: float = 0.0
+    detail: Dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+
+
+def _execute(check: Check, factory: Callable[[], BenchRigAdapter]) -> Tuple[bool, float, dict, str]:
+    t0 = perf_counter()
+    try:
+        adapter = factory()
+        adapter.connect()
+        detail = check.run(adapter)
+        return True, perf_counter() - t0, detail, ""
+    except Exception as exc:  # a crashing check is a failed check
+        return False, perf_counter() - t0, {}, f"{type(exc).__name__}: {exc}"
+
+
+def make_signoff_id(technician: str, when: Optional[datetime] = None) -> str:
+    when = when or datetime.now(timezone.utc)
+    return f"BENCH-{when:%Y-%m%d}-{technician.strip().upper() or 'LOCAL'}"
+
+
+class CommissioningRunner:
+    """Run the checklist's automated checks concurrently, reusing cached passes."""
+
+    def __init__(
+        self,
+        checklist: Optional[Dict[str, Any]] = None,
+        *,
+        factory: Callable[[], BenchRigAdapter] = BenchRigAdapter,
+        checks: Optional[Dict[str, Check]] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        workers: Optional[int] = None,
+        rig_file: Path = RIG_CONFIG,
+        handoff: Path = HANDOFF,
+        max_age_s: float = CACHE_MAX_AGE_S,
+    ) -> None:
+        self.checklist = checklist if checklist is not None else load_checklist()
+        self.factory = factory
+        self.checks = CHECKS if checks is None else checks
+        self.cache_dir = Path(cache_dir or default_cache_dir())
+        self.rig_file = Path(rig_file)
+        self.handoff = Path(handoff)
+        self.cache = (
+            ResultCache(self.cache_dir / "commissioning.json", signoff_key(self.cache_dir), max_age_s)
+            if use_cache
+            else None
+        )
+        self.workers = workers
+        self.ran: List[str] = []
+
+    def run(self, signoff_id: Optional[str] = None) -> List[CheckResult]:
+        """Run the checks; with ``signoff_id``, DOC-01 passes if the handoff doc records it."""
+        rig = rig_config(self.factory, self.rig_file)
+        version = software_version()
+        cache = self.cache
+        if cache is not None and rig["identity"].get("rig_id", UNASSIGNED_RIG) in ("", UNASSIGNED_RIG):
+            LOGGER.warning("Rig %s has no rig_id; commissioning results are not cached", self.rig_file)
+            cache = None
+        results: Dict[str, CheckResult] = {}
+        pending: Dict[str, Tuple[Check, str]] = {}
+        for item in self.checklist.get("checks") or []:
+            cid = item["id"]
+            res = CheckResult(cid, item.get("item", ""), bool(item.get("required", False)), "manual")
+            results[cid] = res
+            if cid in RECORDED_IN_HANDOFF:
+                if signoff_id and handoff_records(self.handoff, signoff_id):
+                    res.status, res.detail = "pass", {"document": self.handoff.name}
+                continue
+            check = self.checks.get(cid)
+            if check is None:
+                continue
+            key = check_key(check, item, rig, version)
+            hit = cache.get(key) if cache is not None else None
+            if hit is not None:
+                res.status, res.cached, res.duration_s, res.detail = "pass", True, 0.0, hit["detail"]
+            else:
+                pending[cid] = (check, key)
+
+        self.ran = list(pending)
+        if pending:
+            workers = self.workers or len(pending)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="commission") as pool:
+                futures = {cid: pool.submit(_execute, check, self.factory) for cid, (check, _) in pending.items()}
+                for cid, future in futures.items():
+                    ok, duration, detail, error = future.result()
+                    res = results[cid]
+                    res.status = "pass" if ok else "fail"
+                    res.duration_s, res.detail, res.error = duration, detail, error
+                    if ok and cache is not None:
+                        cache.put(pending[cid][1], {"id": cid, "detail": detail})
+                    elif not ok:
+                        LOGGER.error("Commissioning check %s failed: %s", cid, error)
+            if cache is not None:
+                cache.save()
+        cached = sum(r.cached for r in results.values())
+        LOGGER.info("Commissioning: %d check(s) run, %d from cache", len(pending), cached)
+        return list(results.values())
+
+    def report(self, technician: str = "LOCAL", key: Optional[bytes] = None) -> Dict[str, Any]:
+        """Run the checklist and return the signed sign-off report."""
+        t0 = perf_counter()
+        signoff_id = make_signoff_id(technician)
+        results = self.run(signoff_id)
+        passed = all(r.status == "pass" for r in results if r.required)
+        report = {
+            "report_version": REPORT_VERSION,
+            "signoff_id": signoff_id,
+            "project": self.checklist.get("project", ""),
+            "checklist_schema": self.checklist.get("schema_version", ""),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "software_version": software_version(),
+            "rig": rig_config(self.factory, self.rig_file),
+            "passed": passed,
+            "wall_s": round(perf_counter() - t0, 4),
+            "checks": [asdict(r) for r in results],
+        }
+        return sign_report(report, key or signoff_key(self.cache_dir))
@@ -15,6 +15,13 @@ class EMGReader(Protocol):
         """Return latest normalized EMG tuple in [0, 1]."""
 
 
+class AsyncEMGReader(Protocol):
+    """Two-channel EMG source with a non-blocking (awaitable) read."""
+
+    async def read(self) -> Tuple[float, float]:
+        """Return latest normalized EMG tuple in [0, 1]."""
+
+
 @dataclass
 class StaticEMGSource(EMGReader):
     """Fixed-value EMG source useful for unit tests and demos."""
@@ -0,0 +1,189 @@
+"""
+Bounded, array-backed motion audit log.
+
+Records live in preallocated ``array`` columns (kind code, pose, speed,
+timestamp) inside a fixed-capacity ring, so appending a command is O(1) and
+does not allocate. Full rings either overwrite the oldest record (counted in
+``dropped``) or spill to an export sink in one batch. A failing spill sink
+never blocks the move being logged: the failure is counted in
+``spill_failures`` and the oldest record is overwritten instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from array import array
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+KINDS: Tuple[str, ...] = ("move_pose", "open_gripper", "close_gripper", "home")
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+MOVE_POSE, OPEN_GRIPPER, CLOSE_GRIPPER, HOME = range(len(KINDS))
+
+POSE_WIDTH = 6
+
+LOGGER = logging.getLogger("musclemate.motion_log")
+
+MotionSink = Callable[[List["MotionRecord"]], Any]
+
+
+@dataclass
+class MotionRecord:
+    kind: str
+    target: Tuple[float, ...]
+    speed: float
+    ts: float = 0.0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class MotionLog:
+    """Fixed-capacity ring of motion commands with batched export."""
+
+    __slots__ = (
+        "capacity",
+        "spill",
+        "dropped",
+        "total",
+        "spill_failures",
+        "_kind",
+        "_pose",
+        "_speed",
+        "_ts",
+        "_head",
+        "_count",
+    )
+
+    def __init__(self, capacity: int = 4096, *, spill: Optional[MotionSink] = None) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.spill = spill
+        self.dropped = 0
+        self.total = 0
+        self.spill_failures = 0
+        self._kind = array("B", bytes(capacity))
+        self._pose = array("d", bytes(8 * POSE_WIDTH * capacity))
+        self._speed = array("d", bytes(8 * capacity))
+        self._ts = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[MotionRecord]:
+        start = (self._head - self._count) % self.capacity
+        for n in range(self._count):
+            yield self._record((start + n) % self.capacity)
+
+    def record_move(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        yaw: float,
+        pitch: float,
+        roll: float,
+        speed: float,
+    ) -> None:
+        slot = self._claim(MOVE_POSE, speed)
+        base = slot * POSE_WIDTH
+        pose = self._pose
+        pose[base] = x
+        pose[base + 1] = y
+        pose[base + 2] = z
+        pose[base + 3] = yaw
+        pose[base + 4] = pitch
+        pose[base + 5] = roll
+
+    def record(self, code: int) -> None:
+        """Record a pose-less command (gripper, home) by kind code."""
+        self._claim(code, 0.0)
+
+    def append(self, kind: str, target: Tuple[float, ...] = (), speed: float = 0.0) -> None:
+        """Compatibility path taking the ``MotionRecord`` field layout."""
+        code = KIND_CODES[kind]
+        if code == MOVE_POSE:
+            padded = tuple(target) + (0.0,) * (POSE_WIDTH - len(target))
+            self.record_move(*padded[:POSE_WIDTH], speed)
+        else:
+            self._claim(code, speed)
+
+    def export(self, sink: MotionSink, *, batch_size: int = 256) -> int:
+        """Drain records oldest-first into ``sink`` in batches; return count."""
+        exported = 0
+        while self._count:
+            n = min(batch_size, self._count)
+            start = (self._head - self._count) % self.capacity
+            batch = [self._record((start + i) % self.capacity) for i in range(n)]
+            sink(batch)  # a raising sink leaves the batch in the ring
+            self._count -= n
+            exported += n
+        return exported
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+
+    def _claim(self, code: int, speed: float) -> int:
+        if self._count == self.capacity:
+            if self.spill is not None:
+                try:
+                    self.export(self.spill, batch_size=self.capacity)
+                except Exception as exc:  # the audit log must not stop the arm
+                    self.spill_failures += 1
+                    LOGGER.warning("Motion log spill failed (%s); overwriting the oldest record", exc)
+            if self._count == self.capacity:
+                self.dropped += 1
+                self._count -= 1
+        slot = self._head
+        self._kind[slot] = code
+        self._speed[slot] = speed
+        self._ts[slot] = monotonic()
+        self._head = (slot + 1) % self.capacity
+        self._count += 1
+        self.total += 1
+        return slot
+
+    def _record(self, slot: int) -> MotionRecord:
+        code = self._kind[slot]
+        if code == MOVE_POSE:
+            base = slot * POSE_WIDTH
+            target = tuple(self._pose[base : base + POSE_WIDTH])
+        else:
+            target = ()
+        return MotionRecord(KINDS[code], target, self._speed[slot], self._ts[slot])
+
+
+class JsonlMotionSink:
+    """Append exported batches to a JSONL file, one write per batch."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fh = open(path, "a", encoding="utf-8")
+
+    def __call__(self, batch: List[MotionRecord]) -> None:
+        if self._fh is None:
+            return
+        lines = [json.dumps(r.as_dict(), separators=(",", ":")) for r in batch]
+        self._fh.write("\n".join(lines) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+
+
+def trace_sink(trace: Any) -> MotionSink:
+    """Forward exported batches to a ``TraceWriter`` as ``motion`` rows."""
+
+    def _emit(batch: List[MotionRecord]) -> None:
+        trace.emit("motion", [r.as_dict() for r in batch])
+
+    return _emit
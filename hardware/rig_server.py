@@ -0,0 +1,204 @@
+"""
+Local TCP stand-in for the integration rig, plus its wire protocol.
+
+``RigServer`` owns an in-memory arm (``QArmStub``), a synthetic EMG stream
+and the six interlock inputs, and serves them over one persistent TCP
+connection per client. The protocol is compact and binary (little-endian):
+
+    request   u16 payload_len, u16 request_id, u8 opcode, payload
+    response  u16 payload_len, u16 request_id, u8 opcode, u8 status, payload
+
+A client may write several requests before reading (pipelining); responses
+come back in order, tagged with the request id. EMG samples accumulate on
+the server at ``emg_rate`` and one ``EMG`` request returns every sample since
+the previous one (up to the requested maximum), so the controller reads a
+whole batch per round trip. ``TcpRigAdapter`` (hardware.adapters.tcp_rig)
+is the client.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import socket
+import socketserver
+import struct
+import threading
+from collections import deque
+from dataclasses import fields
+from time import monotonic, sleep
+from typing import BinaryIO, Deque, Dict, Optional, Tuple
+
+from safety.interlocks import InterlockInputs
+
+from .arm import QArmStub
+from .shm_emg import SyntheticRawEMG
+
+LOGGER = logging.getLogger("musclemate.rig_server")
+
+REQUEST = struct.Struct("<HHB")
+RESPONSE = struct.Struct("<HHBB")
+
+OP_PING = 0
+OP_MOVE = 1
+OP_GRIP = 2
+OP_HOME = 3
+OP_POSE = 4
+OP_EMG = 5
+OP_INPUTS = 6
+OP_SET_INPUTS = 7
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+MOVE = struct.Struct("<7f")
+POSE = struct.Struct("<6f")
+EMG_REQUEST = struct.Struct("<H")
+EMG_HEADER = struct.Struct("<Hd")  # sample count, server time of the newest sample
+EMG_SAMPLE = struct.Struct("<2f")
+PING = struct.Struct("<d")
+# Largest EMG batch whose response still fits the u16 payload length.
+MAX_EMG_BATCH = (0xFFFF - EMG_HEADER.size) // EMG_SAMPLE.size
+
+INPUT_FIELDS = tuple(f.name for f in fields(InterlockInputs))
+
+
+def pack_inputs(inputs: InterlockInputs) -> int:
+    return sum(1 << i for i, name in enumerate(INPUT_FIELDS) if getattr(inputs, name))
+
+
+def unpack_inputs(mask: int) -> InterlockInputs:
+    return InterlockInputs(**{name: bool(mask >> i & 1) for i, name in enumerate(INPUT_FIELDS)})
+
+
+def read_exact(stream: BinaryIO, n: int) -> bytes:
+    """``n`` bytes from a buffered socket file (pipelined frames cost one recv)."""
+    data = stream.read(n)
+    if data is None or len(data) < n:
+        raise ConnectionError("rig connection closed")
+    return data
+
+
+class RigState:
+    """Everything the server simulates; shared by all client connections."""
+
+    def __init__(
+        self,
+        emg: Optional[SyntheticRawEMG] = None,
+        *,
+        emg_rate: float = 1000.0,
+        emg_buffer: int = 4096,
+        move_latency_s: float = 0.0,
+    ) -> None:
+        self.arm = QArmStub()
+        self.inputs = InterlockInputs()
+        self.emg = emg or SyntheticRawEMG()
+        self.emg_rate = emg_rate
+        self.move_latency_s = move_latency_s
+        self.commands: Dict[int, int] = {}
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=emg_buffer)
+        self._rng = random.Random(self.emg.seed)
+        self._t0 = monotonic()
+        self._next_sample = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> float:
+        """Synthesize samples up to now; returns the time of the newest one."""
+        due = int((monotonic() - self._t0) * self.emg_rate)
+        n = due - self._next_sample
+        if n > 0:
+            n = min(n, self._samples.maxlen or n)
+            first = due - n
+            cols = self.emg.block(first / self.emg_rate, n, self.emg_rate, self._rng)
+            self._samples.extend(zip(cols[0], cols[1]))
+            self._next_sample = due
+        return self._next_sample / self.emg_rate
+
+    def handle(self, op: int, payload: bytes) -> bytes:
+        with self._lock:
+            self.commands[op] = self.commands.get(op, 0) + 1
+            if op == OP_PING:
+                return PING.pack(monotonic())
+            if op == OP_MOVE:
+                x, y, z, yaw, pitch, roll, speed = MOVE.unpack(payload)
+                self.arm.move_pose(x, y, z, yaw, pitch, roll, speed)
+            elif op == OP_GRIP:
+                self.arm.close_gripper() if payload[0] else self.arm.open_gripper()
+            elif op == OP_HOME:
+                self.arm.home()
+            elif op == OP_POSE:
+                return POSE.pack(*self.arm.read_pose())
+            elif op == OP_EMG:
+                limit = min(EMG_REQUEST.unpack(payload)[0], MAX_EMG_BATCH)
+                t = self._acquire()
+                # Newest ``limit`` samples; anything older is dropped with them.
+                samples = list(self._samples)[-limit:] if limit else []
+                self._samples.clear()
+                out = bytearray(EMG_HEADER.pack(len(samples), t))
+                for ch1, ch2 in samples:
+                    out += EMG_SAMPLE.pack(ch1, ch2)
+                return bytes(out)
+            elif op == OP_INPUTS:
+                return bytes((pack_inputs(self.inputs),))
+            elif op == OP_SET_INPUTS:
+                self.inputs = unpack_inputs(payload[0])
+            else:
+                raise ValueError(f"unknown opcode {op}")
+        if op == OP_MOVE and self.move_latency_s:
+            sleep(self.move_latency_s)
+        return b""
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "RigServer"
+
+    def setup(self) -> None:
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self) -> None:
+        sock: socket.socket = self.request
+        rfile = sock.makefile("rb")
+        state = self.server.state
+        try:
+            while True:
+                size, req_id, op = REQUEST.unpack(read_exact(rfile, REQUEST.size))
+                payload = read_exact(rfile, size) if size else b""
+                try:
+                    body, status = state.handle(op, payload), STATUS_OK
+                except Exception as exc:  # reported to the client, connection stays up
+                    body, status = str(exc).encode()[:1024], STATUS_ERROR
+                sock.sendall(RESPONSE.pack(len(body), req_id, op, status) + body)
+        except (ConnectionError, OSError):
+            return
+        finally:
+            rfile.close()
+
+
+class RigServer(socketserver.ThreadingTCPServer):
+    """Serve a ``RigState`` on ``(host, port)``; port 0 picks a free port."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: Optional[RigState] = None) -> None:
+        super().__init__((host, port), _Handler)
+        self.state = state or RigState()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self.server_address[:2]
+        return str(host), int(port)
+
+    def start(self) -> "RigServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="rig-server", daemon=True)
+        self._thread.start()
+        LOGGER.info("Rig server listening on %s:%d", *self.address)
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
@@ -1,20 +1,20 @@
-"""Arm wrapper enforcing interlocks and deterministic speed clamps."""
+"""Arm wrapper enforcing interlocks, deterministic speed clamps and (optionally)
+the precomputed workspace grid."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from safety.interlocks import SafetySupervisor
 
 from .arm import ArmInterface
+from .motion_log import CLOSE_GRIPPER, HOME, OPEN_GRIPPER, MotionLog, MotionRecord
 
+if TYPE_CHECKING:
+    from .workspace import WorkspaceGrid
 
-@dataclass
-class MotionRecord:
-    kind: str
-    target: Tuple[float, ...]
-    speed: float
+__all__ = ["MotionRecord", "SafeguardedArm"]
 
 
 @dataclass
@@ -22,7 +22,9 @@ class SafeguardedArm:
     inner: ArmInterface
     safety: SafetySupervisor
     max_speed: float = 0.85
-    motion_log: List[MotionRecord] = field(default_factory=list)
+    motion_log: MotionLog = field(default_factory=MotionLog)
+    workspace: Optional["WorkspaceGrid"] = None
+    _last_target: Optional[Tuple[float, float, float]] = None
 
     def move_pose(
         self,
@@ -35,23 +37,38 @@ class SafeguardedArm:
         speed: float = 0.5,
     ) -> None:
         self.safety.require_motion("move_pose")
+        if self.workspace is not None:
+            self._check_workspace((x, y, z))
         spd = min(max(speed, 0.1), self.max_speed)
-        self.motion_log.append(MotionRecord("move_pose", (x, y, z, yaw, pitch, roll), spd))
+        self.motion_log.record_move(x, y, z, yaw, pitch, roll, spd)
         self.inner.move_pose(x, y, z, yaw=yaw, pitch=pitch, roll=roll, speed=spd)
+        self._last_target = (x, y, z)
 
     def open_gripper(self) -> None:
         self.safety.require_motion("open_gripper")
-        self.motion_log.append(MotionRecord("open_gripper", (), 0.0))
+        self.motion_log.record(OPEN_GRIPPER)
         self.inner.open_gripper()
 
     def close_gripper(self) -> None:
         self.safety.require_motion("close_gripper")
-        self.motion_log.append(MotionRecord("close_gripper", (), 0.0))
+        self.motion_log.record(CLOSE_GRIPPER)
         self.inner.close_gripper()
 
     def home(self) -> None:
-        self.motion_log.append(MotionRecord("home", (), 0.0))
+        self.motion_log.record(HOME)
         self.inner.home()
+        self._last_target = None
 
     def read_pose(self) -> Tuple[float, float, float, float, float, float]:
         return self.inner.read_pose()
+
+    def _check_workspace(self, target: Tuple[float, float, float]) -> None:
+        """Reject a target outside the grid, or a straight path from the last target through a keep-out."""
+        from .workspace import WorkspaceViolation
+
+        assert self.workspace is not None
+        reason = self.workspace.why(*target)
+        if reason is None and self._last_target is not None:
+            reason = self.workspace.check_segment(self._last_target, target)
+        if reason is not None:
+            raise WorkspaceViolation(f"move_pose {target} rejected: {reason}")
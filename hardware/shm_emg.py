@@ -0,0 +1,323 @@
+"""
+Out-of-process EMG acquisition over a ``multiprocessing.shared_memory`` ring.
+
+A producer process acquires (or synthesizes) raw EMG, computes per-block
+features and publishes both into a ring of fixed-size slots. Each slot is
+guarded by a sequence counter used as a seqlock (odd while being written),
+so the controller-side ``SharedMemoryEMGReader`` never blocks the producer
+and never sees a torn block. The reader hands out the newest block as a
+zero-copy ``memoryview`` and returns its features as the two-channel sample
+the decoder consumes.
+
+Layout (little-endian, 64-byte aligned)::
+
+    header  magic, version, channels, block_samples, n_features, slots,
+            sample_rate, write_seq u64, heartbeat f64, producer_pid u32
+    slot i  seq u64, t f64, block float32[channels][block_samples],
+            features float32[channels][n_features]
+
+If the heartbeat stops advancing for ``stale_s`` (producer hung or dead) the
+reader latches a fault on the safety supervisor and reports rest.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import os
+import random
+import struct
+from multiprocessing import shared_memory
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+from .emg import EMGReader
+
+if TYPE_CHECKING:
+    from safety.interlocks import SafetySupervisor
+
+LOGGER = logging.getLogger("musclemate.shm_emg")
+
+MAGIC = b"MMSHM1\x00\x00"
+VERSION = 1
+FEATURES = ("mav", "rms")
+
+_LAYOUT = struct.Struct("<8sHHIIId")
+_CONTROL = struct.Struct("<QdI")
+_SLOT_HEAD = struct.Struct("<Qd")
+_ALIGN = 64
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class ShmRing:
+    """Shared-memory ring of EMG blocks; one writer, any number of readers."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, *, owner: bool) -> None:
+        self.shm = shm
+        self.owner = owner
+        magic, version, channels, block_samples, n_features, slots, rate = _LAYOUT.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"shared memory {shm.name!r} is not a v{VERSION} EMG ring")
+        self.channels = channels
+        self.block_samples = block_samples
+        self.n_features = n_features
+        self.slots = slots
+        self.sample_rate = rate
+        self._control_at = _LAYOUT.size
+        self._slots_at = _align(_LAYOUT.size + _CONTROL.size)
+        self._block_len = channels * block_samples
+        self._feat_at = _SLOT_HEAD.size + 4 * self._block_len
+        self._slot_size = _align(self._feat_at + 4 * channels * n_features)
+        self._feat = struct.Struct(f"<{channels * n_features}f")
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        channels: int = 2,
+        block_samples: int = 64,
+        n_features: int = len(FEATURES),
+        slots: int = 16,
+        sample_rate: float = 1000.0,
+        name: Optional[str] = None,
+    ) -> "ShmRing":
+        control_end = _align(_LAYOUT.size + _CONTROL.size)
+        slot_size = _align(_SLOT_HEAD.size + 4 * channels * (block_samples + n_features))
+        shm = shared_memory.SharedMemory(name=name, create=True, size=control_end + slots * slot_size)
+        shm.buf[:control_end] = bytes(control_end)
+        _LAYOUT.pack_into(shm.buf, 0, MAGIC, VERSION, channels, block_samples, n_features, slots, sample_rate)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "ShmRing":
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    # -- control block ------------------------------------------------------
+
+    def control(self) -> Tuple[int, float, int]:
+        """``(write_seq, heartbeat, producer_pid)``."""
+        return _CONTROL.unpack_from(self.shm.buf, self._control_at)
+
+    def heartbeat(self, now: Optional[float] = None) -> None:
+        write_seq = _CONTROL.unpack_from(self.shm.buf, self._control_at)[0]
+        _CONTROL.pack_into(self.shm.buf, self._control_at, write_seq, monotonic() if now is None else now, os.getpid())
+
+    # -- writer -------------------------------------------------------------
+
+    def write_block(self, columns: Sequence[Sequence[float]], features: Sequence[float], t: float) -> int:
+        """Publish one block (channel-major columns) and its features; returns its index."""
+        buf = self.shm.buf
+        idx = _CONTROL.unpack_from(buf, self._control_at)[0]
+        base = self._slots_at + (idx % self.slots) * self._slot_size
+        struct.pack_into("<Q", buf, base, 2 * idx + 1)  # odd: write in progress
+        off = base + _SLOT_HEAD.size
+        fmt = f"<{self.block_samples}f"
+        for ch, col in enumerate(columns):
+            struct.pack_into(fmt, buf, off + 4 * ch * self.block_samples, *col)
+        self._feat.pack_into(buf, base + self._feat_at, *features)
+        _SLOT_HEAD.pack_into(buf, base, 2 * idx + 2, t)
+        _CONTROL.pack_into(buf, self._control_at, idx + 1, monotonic(), os.getpid())
+        return idx
+
+    # -- reader -------------------------------------------------------------
+
+    def latest_features(self, retries: int = 4) -> Optional[Tuple[int, float, Tuple[float, ...]]]:
+        """``(index, t, features)`` of the newest complete block, or None."""
+        buf = self.shm.buf
+        write_seq = _CONTROL.unpack_from(buf, self._control_at)[0]
+        for back in range(min(retries, write_seq)):
+            idx = write_seq - 1 - back
+            base = self._slots_at + (idx % self.slots) * self._slot_size
+            seq, t = _SLOT_HEAD.unpack_from(buf, base)
+            if seq != 2 * idx + 2:
+                continue  # being rewritten: fall back to the previous slot
+            features = self._feat.unpack_from(buf, base + self._feat_at)
+            if struct.unpack_from("<Q", buf, base)[0] == seq:
+                return idx, t, features
+        return None
+
+    def block_view(self, idx: int, channel: int) -> memoryview:
+        """
+        Zero-copy float32 view of ``channel`` in block ``idx``.
+
+        The slot is reused after ``slots`` more blocks; confirm with
+        ``block_valid(idx)`` after consuming the view. Release the view
+        before closing the ring.
+        """
+        base = self._slots_at + (idx % self.slots) * self._slot_size + _SLOT_HEAD.size
+        start = base + 4 * channel * self.block_samples
+        return self.shm.buf[start : start + 4 * self.block_samples].cast("f")
+
+    def block_valid(self, idx: int) -> bool:
+        base = self._slots_at + (idx % self.slots) * self._slot_size
+        return struct.unpack_from("<Q", self.shm.buf, base)[0] == 2 * idx + 2
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SyntheticRawEMG:
+    """Rectified two-channel EMG around a repeating amplitude pattern (picklable)."""
+
+    def __init__(
+        self,
+        pattern: Sequence[Tuple[Tuple[float, float], float]] = (((0.02, 0.02), 2.0), ((0.9, 0.02), 0.4)),
+        noise: float = 0.02,
+        seed: int = 0,
+    ) -> None:
+        self.pattern = list(pattern)
+        self.noise = noise
+        self.seed = seed
+        self._period = sum(d for _, d in self.pattern)
+
+    def amplitude(self, t: float) -> Tuple[float, float]:
+        t %= self._period
+        for amp, duration in self.pattern:
+            if t < duration:
+                return amp
+            t -= duration
+        return self.pattern[-1][0]
+
+    def block(self, t0: float, n: int, rate: float, rng: random.Random) -> List[List[float]]:
+        columns: List[List[float]] = [[], []]
+        for i in range(n):
+            amp = self.amplitude(t0 + i / rate)
+            for ch in (0, 1):
+                columns[ch].append(min(1.0, max(0.0, amp[ch] + rng.gauss(0.0, self.noise))))
+        return columns
+
+
+def block_features(columns: Sequence[Sequence[float]]) -> List[float]:
+    """``FEATURES`` per channel, channel-major."""
+    out: List[float] = []
+    for col in columns:
+        n = len(col) or 1
+        out.append(sum(abs(v) for v in col) / n)
+        out.append((sum(v * v for v in col) / n) ** 0.5)
+    return out
+
+
+def run_producer(name: str, source: SyntheticRawEMG, stop: "mp.synchronize.Event") -> None:
+    """Producer process body: pace blocks in real time until ``stop`` is set."""
+    ring = ShmRing.attach(name)
+    rng = random.Random(source.seed)
+    period = ring.block_samples / ring.sample_rate
+    start = next_at = monotonic()
+    try:
+        while not stop.is_set():
+            t = next_at - start
+            columns = source.block(t, ring.block_samples, ring.sample_rate, rng)
+            ring.write_block(columns, block_features(columns), t)
+            next_at += period
+            delay = next_at - monotonic()
+            if delay > 0:
+                sleep(delay)
+    finally:
+        ring.close()
+
+
+class EMGProducer:
+    """Own a ring plus the acquisition process that fills it."""
+
+    def __init__(
+        self,
+        source: Optional[SyntheticRawEMG] = None,
+        *,
+        target: Callable[..., None] = run_producer,
+        **ring_kwargs: float,
+    ) -> None:
+        self.ring = ShmRing.create(**ring_kwargs)  # type: ignore[arg-type]
+        self._stop = mp.Event()
+        self.process = mp.Process(
+            target=target,
+            args=(self.ring.name, source or SyntheticRawEMG(), self._stop),
+            name="emg-producer",
+            daemon=True,
+        )
+
+    def start(self) -> "EMGProducer":
+        self.process.start()
+        return self
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self.process.pid is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.ring.close()
+
+
+class SharedMemoryEMGReader(EMGReader):
+    """
+    Controller-side reader of the newest block's features.
+
+    Returns feature ``feature`` (index into ``FEATURES``) for channels 0 and
+    1. When the producer heartbeat is older than ``stale_s`` it latches a
+    fault on ``safety`` (once per stale episode) and returns rest.
+    """
+
+    def __init__(
+        self,
+        ring: ShmRing,
+        *,
+        safety: Optional["SafetySupervisor"] = None,
+        stale_s: float = 0.25,
+        feature: int = 0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.ring = ring
+        self.safety = safety
+        self.stale_s = stale_s
+        self.feature = feature
+        self.clock = clock
+        self.stale = False
+        self.trips = 0
+        self.last_index = -1
+        self._last: Tuple[float, float] = (0.0, 0.0)
+        self._created = clock()
+
+    def read(self) -> Tuple[float, float]:
+        write_seq, heartbeat, pid = self.ring.control()
+        # Before the first block, allow the producer ``stale_s`` from reader creation.
+        age = self.clock() - (heartbeat if write_seq else self._created)
+        if age > self.stale_s:
+            if not self.stale:
+                self.stale = True
+                self.trips += 1
+                reason = f"EMG producer stale: pid {pid}, heartbeat {age * 1e3:.0f} ms old"
+                LOGGER.error(reason)
+                if self.safety is not None:
+                    self.safety.latch_fault(reason, kind="emg_stale")
+            return (0.0, 0.0)
+        self.stale = False
+        latest = self.ring.latest_features()
+        if latest is not None:
+            idx, _, feats = latest
+            n = self.ring.n_features
+            self.last_index = idx
+            self._last = (feats[self.feature], feats[n + self.feature])
+        return self._last
+
+    def latest_block(self, channel: int) -> Optional[Tuple[int, memoryview]]:
+        """
+        Zero-copy view of the block last returned by ``read`` for ``channel``
+        (see ``ShmRing.block_view``), or None before any block was read.
+        """
+        if self.last_index < 0:
+            return None
+        return self.last_index, self.ring.block_view(self.last_index, channel)
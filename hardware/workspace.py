@@ -0,0 +1,247 @@
+"""
+Precomputed workspace grid: reach envelope and keep-out zones of the cell.
+
+``CellGeometry`` describes the cell (arm base, reach shell, table and
+ceiling heights, keep-out boxes). ``WorkspaceGrid.build`` rasterizes it once
+into a byte per ``resolution``-sized voxel:
+
+    bit 0      reachable (voxel centre inside the reach shell and height band)
+    bits 1..7  1 + index of the keep-out zone covering the voxel, else 0
+
+Keep-out boxes are inflated by ``clearance`` and cover every voxel they
+touch, so the raster errs on the blocked side. ``load_or_build`` caches the
+raster on disk keyed by a hash of the geometry and memory-maps it on later
+starts. A point check is one index computation and one byte read; a swept
+segment is checked at half-voxel steps, so its cost is bounded by the grid
+diagonal.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import asdict, dataclass
+from math import ceil, floor, sqrt
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from safety.interlocks import SafetyFault
+
+LOGGER = logging.getLogger("musclemate.workspace")
+
+Point = Tuple[float, float, float]
+
+MAGIC = b"MMWKSP1\x00"
+VERSION = 1
+_HEADER = struct.Struct("<8sH3I4d16s")
+_DATA_AT = 128
+REACHABLE = 1
+OUTSIDE = 0  # also returned for points beyond the grid
+
+
+class WorkspaceViolation(SafetyFault):
+    """A commanded pose or path leaves the reach envelope or enters a keep-out zone."""
+
+
+@dataclass(frozen=True)
+class KeepOut:
+    name: str
+    lo: Point
+    hi: Point
+
+
+@dataclass(frozen=True)
+class CellGeometry:
+    base: Point = (0.0, 0.0, 0.0)
+    reach_min_m: float = 0.10
+    reach_max_m: float = 0.62
+    z_min_m: float = 0.02
+    z_max_m: float = 0.60
+    clearance_m: float = 0.02
+    keep_out: Tuple[KeepOut, ...] = (
+        KeepOut("autoclave_body", (0.50, -0.35, 0.0), (0.75, 0.10, 0.40)),
+        KeepOut("operator_station", (-0.70, 0.35, 0.0), (0.70, 0.70, 0.70)),
+    )
+    extent_m: float = 0.65
+    resolution_m: float = 0.01
+
+    def key(self) -> bytes:
+        doc = json.dumps(asdict(self), sort_keys=True).encode()
+        return hashlib.sha256(doc).digest()[:16]
+
+
+class WorkspaceGrid:
+    """Voxel raster of a ``CellGeometry`` (bytearray when built, mmap when loaded)."""
+
+    def __init__(self, geometry: CellGeometry, dims: Tuple[int, int, int], origin: Point, data, path=None) -> None:
+        self.geometry = geometry
+        self.nx, self.ny, self.nz = dims
+        self.origin = origin
+        self.resolution = geometry.resolution_m
+        self.data = data
+        self.path: Optional[Path] = path
+        self._inv = 1.0 / self.resolution
+        self._mm: Optional[mmap.mmap] = None
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def build(cls, geometry: CellGeometry = CellGeometry()) -> "WorkspaceGrid":
+        g = geometry
+        res = g.resolution_m
+        n_xy = int(round(2 * g.extent_m / res))
+        nz = int(round(g.extent_m / res))
+        origin = (g.base[0] - g.extent_m, g.base[1] - g.extent_m, g.base[2])
+        grid = cls(g, (n_xy, n_xy, nz), origin, bytearray(n_xy * n_xy * nz))
+        if len(g.keep_out) > 126:
+            raise ValueError("at most 126 keep-out zones")
+        grid._fill_reach()
+        for idx, zone in enumerate(g.keep_out):
+            grid._fill_zone(idx, zone)
+        return grid
+
+    def _z_index_range(self, z_lo: float, z_hi: float) -> Tuple[int, int]:
+        """Voxels whose centres lie in ``[z_lo, z_hi]`` as ``[start, stop)``."""
+        oz, res = self.origin[2], self.resolution
+        start = max(0, ceil((z_lo - oz) / res - 0.5))
+        stop = min(self.nz, floor((z_hi - oz) / res - 0.5) + 1)
+        return start, max(start, stop)
+
+    def _fill_reach(self) -> None:
+        g = self.geometry
+        bx, by, bz = g.base
+        ox, oy, _ = self.origin
+        res = self.resolution
+        data = self.data
+        for ix in range(self.nx):
+            dx = ox + (ix + 0.5) * res - bx
+            for iy in range(self.ny):
+                dy = oy + (iy + 0.5) * res - by
+                r2 = dx * dx + dy * dy
+                if r2 > g.reach_max_m**2:
+                    continue
+                hi = sqrt(g.reach_max_m**2 - r2)
+                lo = sqrt(g.reach_min_m**2 - r2) if r2 < g.reach_min_m**2 else -1.0
+                col = (ix * self.ny + iy) * self.nz
+                bands = [(bz - hi, bz + hi)] if lo < 0 else [(bz - hi, bz - lo), (bz + lo, bz + hi)]
+                for z0, z1 in bands:
+                    start, stop = self._z_index_range(max(z0, g.z_min_m), min(z1, g.z_max_m))
+                    data[col + start : col + stop] = b"\x01" * (stop - start)
+
+    def _fill_zone(self, idx: int, zone: KeepOut) -> None:
+        c, res = self.geometry.clearance_m, self.resolution
+        lo = [zone.lo[k] - c - self.origin[k] for k in range(3)]
+        hi = [zone.hi[k] + c - self.origin[k] for k in range(3)]
+        dims = (self.nx, self.ny, self.nz)
+        i0 = [max(0, floor(lo[k] / res)) for k in range(3)]
+        i1 = [min(dims[k], ceil(hi[k] / res)) for k in range(3)]
+        if any(a >= b for a, b in zip(i0, i1)):
+            return
+        fill = bytes(((idx + 1) << 1,)) * (i1[2] - i0[2])
+        for ix in range(i0[0], i1[0]):
+            for iy in range(i0[1], i1[1]):
+                col = (ix * self.ny + iy) * self.nz
+                self.data[col + i0[2] : col + i1[2]] = fill
+
+    # -- disk cache ---------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = _HEADER.pack(MAGIC, VERSION, self.nx, self.ny, self.nz, *self.origin, self.resolution, self.geometry.key())
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(header.ljust(_DATA_AT, b"\x00"))
+            fh.write(self.data)
+        os.replace(tmp, path)
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path, geometry: CellGeometry) -> "WorkspaceGrid":
+        """Memory-map a saved grid; raises ValueError if it was built for other geometry."""
+        with open(path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, nx, ny, nz, ox, oy, oz, res, key = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or key != geometry.key() or len(mm) != _DATA_AT + nx * ny * nz:
+            mm.close()
+            raise ValueError(f"{path}: stale or foreign workspace grid")
+        grid = cls(geometry, (nx, ny, nz), (ox, oy, oz), memoryview(mm)[_DATA_AT:], Path(path))
+        grid._mm = mm
+        return grid
+
+    @classmethod
+    def load_or_build(cls, geometry: CellGeometry = CellGeometry(), cache_dir: Optional[Path] = None) -> "WorkspaceGrid":
+        cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        path = cache_dir / f"workspace-{geometry.key().hex()}.grid"
+        try:
+            return cls.load(path, geometry)
+        except (OSError, ValueError):
+            pass
+        grid = cls.build(geometry)
+        try:
+            grid.save(path)
+            LOGGER.info("Built workspace grid %dx%dx%d -> %s", grid.nx, grid.ny, grid.nz, path)
+        except OSError as exc:
+            LOGGER.warning("Workspace grid not cached (%s)", exc)
+        return grid
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self.data.release()
+            self._mm.close()
+            self._mm = None
+
+    # -- queries ------------------------------------------------------------
+
+    def cell(self, x: float, y: float, z: float) -> int:
+        ix = floor((x - self.origin[0]) * self._inv)
+        iy = floor((y - self.origin[1]) * self._inv)
+        iz = floor((z - self.origin[2]) * self._inv)
+        if 0 <= ix < self.nx and 0 <= iy < self.ny and 0 <= iz < self.nz:
+            return self.data[(ix * self.ny + iy) * self.nz + iz]
+        return OUTSIDE
+
+    def contains(self, x: float, y: float, z: float) -> bool:
+        return self.cell(x, y, z) == REACHABLE
+
+    def why(self, x: float, y: float, z: float) -> Optional[str]:
+        """None if the point is valid, else the reason it is not."""
+        value = self.cell(x, y, z)
+        if value == REACHABLE:
+            return None
+        if value >> 1:
+            return f"keep-out zone {self.geometry.keep_out[(value >> 1) - 1].name!r}"
+        return "outside reach"
+
+    def check_segment(self, a: Point, b: Point) -> Optional[str]:
+        """First problem along the straight path ``a -> b``, or None."""
+        dx, dy, dz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+        steps = max(1, ceil(sqrt(dx * dx + dy * dy + dz * dz) * 2.0 * self._inv))
+        for i in range(steps + 1):
+            t = i / steps
+            x, y, z = a[0] + t * dx, a[1] + t * dy, a[2] + t * dz
+            if self.cell(x, y, z) != REACHABLE:
+                return f"({x:.3f}, {y:.3f}, {z:.3f}) {self.why(x, y, z)}"
+        return None
+
+    def check_path(self, points: Sequence[Point], labels: Optional[Sequence[str]] = None) -> List[str]:
+        """Problems with each point and each consecutive segment of ``points``."""
+        problems = []
+        names = list(labels) if labels is not None else [f"#{i}" for i in range(len(points))]
+        for i, p in enumerate(points):
+            reason = self.why(*p)
+            if reason:
+                problems.append(f"{names[i]} {p}: {reason}")
+            elif i and self.contains(*points[i - 1]):
+                reason = self.check_segment(points[i - 1], p)
+                if reason:
+                    problems.append(f"{names[i - 1]} -> {names[i]}: {reason}")
+        return problems
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("MUSCLEMATE_CACHE", Path.home() / ".cache" / "musclemate"))
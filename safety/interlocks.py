@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from time import monotonic
-from typing import Optional
+from typing import Dict, Optional
 
 
 class SafetyFault(Exception):
@@ -36,7 +36,7 @@ class DutyCyclePolicy:
     min_cycle_gap_s: float = 2.0
     max_continuous_runtime_s: float = 3600.0
     _cycle_times: list[float] = field(default_factory=list)
-    _session_start: float = field(default_factory=monotonic)
+    _session_start: float = field(default_factory=lambda: monotonic())
 
     def record_cycle_complete(self) -> None:
         now = monotonic()
@@ -56,6 +56,10 @@ class DutyCyclePolicy:
                 return False, "max_cycles_per_hour exceeded"
         return True, "ok"
 
+    def start_session(self) -> None:
+        """Restart the continuous-runtime clock (operator back from a break)."""
+        self._session_start = monotonic()
+
 
 @dataclass
 class SafetySupervisor:
@@ -67,6 +71,11 @@ class SafetySupervisor:
     duty: DutyCyclePolicy = field(default_factory=DutyCyclePolicy)
     _fault_latched: bool = False
     _last_fault: str = ""
+    fault_counts: Dict[str, int] = field(default_factory=dict)
+    _cycle_inhibit: str = ""
+
+    def _count_fault(self, kind: str) -> None:
+        self.fault_counts[kind] = self.fault_counts.get(kind, 0) + 1
 
     def motion_allowed(self) -> bool:
         if self._fault_latched:
@@ -85,17 +94,35 @@ class SafetySupervisor:
         if not self.motion_allowed():
             self._fault_latched = True
             self._last_fault = f"interlock block: {context}"
+            self._count_fault("interlock")
             raise SafetyFault(self._last_fault)
 
     def require_cycle_start(self) -> None:
+        if self._cycle_inhibit:
+            # Refuse without latching: the inhibit lifts by itself once the cause clears.
+            raise SafetyFault(f"new cycles inhibited: {self._cycle_inhibit}")
         ok, reason = self.duty.allow_new_cycle()
         if not ok:
             self._fault_latched = True
             self._last_fault = f"duty cycle: {reason}"
+            self._count_fault("duty_cycle")
             raise SafetyFault(self._last_fault)
         if not self.motion_allowed():
             self.require_motion("cycle_start")
 
+    def inhibit_new_cycles(self, reason: str) -> None:
+        """Refuse new cycle starts (in-flight motion is unaffected) until ``allow_new_cycles``."""
+        self._cycle_inhibit = reason
+
+    def allow_new_cycles(self) -> None:
+        self._cycle_inhibit = ""
+
+    def latch_fault(self, reason: str, kind: str = "external") -> None:
+        """Latch a fault raised outside the interlock inputs (e.g. a loop watchdog)."""
+        self._fault_latched = True
+        self._last_fault = reason
+        self._count_fault(kind)
+
     def latch_estop(self) -> None:
         self.inputs = InterlockInputs(
             estop_latched=True,
@@ -107,6 +134,7 @@ class SafetySupervisor:
         )
         self._fault_latched = True
         self._last_fault = "E-stop latched"
+        self._count_fault("estop")
 
     def clear_estop(self, technician_key: bool = True) -> bool:
         if not technician_key:
@@ -130,4 +158,5 @@ class SafetySupervisor:
             "last_fault": self._last_fault,
             "inputs": self.inputs.__dict__,
             "cycles_last_hour": len(self.duty._cycle_times),
+            "new_cycles_inhibited": self._cycle_inhibit,
         }
@@ -1,27 +1,75 @@
 #!/usr/bin/env python3
-"""Technician-led bench commissioning before integration handoff."""
+"""Technician-led bench commissioning before integration handoff.
+
+Runs the automated items of commissioning/bench_checklist.yaml concurrently,
+reusing cached passes whose rig (commissioning/bench_rig.yaml) and software
+are unchanged, and writes a signed sign-off report for the integration
+adapter. DOC-01 passes once the signoff_id is recorded in
+docs/INTEGRATION_HANDOFF.md, so the first run asks for it and a re-run
+(served from the cache) completes the sign-off.
+
+    python scripts/bench_commission.py                    # run, sign, write bench_logs/bench_signoff.json
+    python scripts/bench_commission.py --technician ahmad --no-cache
+    python -m control.cli --adapter integration --signoff-report bench_logs/bench_signoff.json --demo
+"""
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
 
-from hardware.adapters import BenchRigAdapter
-from sequences import MANUFACTURING_VALIDATION, run_sequence_on_arm
+from hardware.commissioning import (
+    CHECKLIST,
+    HANDOFF,
+    RECORDED_IN_HANDOFF,
+    RIG_CONFIG,
+    CommissioningRunner,
+    load_checklist,
+)
+
+REPORT = ROOT / "bench_logs" / "bench_signoff.json"
 
 
 def main() -> int:
-    adapter = BenchRigAdapter()
-    adapter.connect()
-    probe = adapter.run_bench_motion_probe()
-    arm = adapter.arm()
-    safety = adapter.safety()
-    seq_log = run_sequence_on_arm(arm, MANUFACTURING_VALIDATION, safety)
-    report = adapter.commissioning_report()
-    report["bench_probe"] = probe
-    report["validation_sequence_steps"] = len(seq_log)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checklist", type=Path, default=CHECKLIST)
+    parser.add_argument("--technician", default="LOCAL", help="Name used in the signoff_id.")
+    parser.add_argument("--rig-config", type=Path, default=RIG_CONFIG, help="This bench's rig identity file.")
+    parser.add_argument("--handoff", type=Path, default=HANDOFF, help="Document that must record the signoff_id.")
+    parser.add_argument("--out", type=Path, default=REPORT, help="Signed report path.")
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="Default: $MUSCLEMATE_CACHE or ~/.cache/musclemate."
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check.")
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent checks (default: all).")
+    args = parser.parse_args()
+
+    runner = CommissioningRunner(
+        load_checklist(args.checklist),
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        workers=args.workers,
+        rig_file=args.rig_config,
+        handoff=args.handoff,
+    )
+    report = runner.report(args.technician)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
     print(json.dumps(report, indent=2))
-    print("\nBench commissioning complete. Record signoff_id in integration adapter.")
+    if not report["passed"]:
+        unmet = [c["id"] for c in report["checks"] if c["required"] and c["status"] != "pass"]
+        if unmet and set(unmet) <= set(RECORDED_IN_HANDOFF):
+            print(f"\nAutomated checks passed. Record signoff_id {report['signoff_id']} in {args.handoff} and re-run.")
+        else:
+            print(f"\nBench commissioning FAILED ({', '.join(unmet)}). See {args.out}.")
+        return 1
+    print(f"\nBench commissioning complete: {report['signoff_id']} (report {args.out}).")
+    print("Pass --signoff-report to the integration adapter.")
     return 0
 
 
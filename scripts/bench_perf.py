@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the control hot path, with JSON baselines.
+
+Times GestureDecoder update/intent, SterilizationController.tick (idle and
+a scripted cycle), TraceWriter.emit (inline and background), SafetySupervisor
+checks, DutyCyclePolicy with a large cycle history and run_sequence_on_arm.
+Clocks and sleeps run on a VirtualClock (sim.clock), so only CPU cost is
+measured.
+
+    python scripts/bench_perf.py                      # print + bench_logs/perf_latest.json
+    python scripts/bench_perf.py --save-baseline      # refresh bench_logs/perf_baseline.json
+    python scripts/bench_perf.py --save-baseline --only tick_idle    # refresh one entry
+    python scripts/bench_perf.py --compare --tolerance 0.25   # exit 1 on regressions
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import GestureDecoder
+from control.state_machine import SterilizationController
+from control.trace import TraceWriter
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import DutyCyclePolicy, SafetySupervisor
+from sequences.motion_sequences import STERILIZATION_AUTOMATION, run_sequence_on_arm
+from sim import scripted_cycle
+from sim.clock import VirtualClock, virtual_time
+
+BASELINE = ROOT / "bench_logs" / "perf_baseline.json"
+LATEST = ROOT / "bench_logs" / "perf_latest.json"
+
+Bench = Callable[[int, VirtualClock], Optional[float]]
+"""``bench(n, clock)`` runs ``n`` operations; it may return its own timed span to exclude setup."""
+
+
+def bench_decoder(n: int, clock: VirtualClock) -> None:
+    decoder = GestureDecoder(Thresholds())
+    samples = [(0.02, 0.02), (0.9, 0.05), (0.9, 0.05), (0.02, 0.02), (0.05, 0.9), (0.02, 0.02)]
+    for i in range(n):
+        clock.sleep(0.02)
+        ch1, ch2 = samples[i % 6]
+        decoder.update(ch1, ch2)
+        decoder.intent()
+
+
+def _controller(emg, safety=None) -> SterilizationController:
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=emg,
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+    )
+
+
+def bench_tick_idle(n: int, clock: VirtualClock) -> None:
+    ctl = _controller(StaticEMGSource(), SafetySupervisor())
+    for _ in range(n):
+        ctl.tick()
+        clock.sleep(0.02)
+
+
+def bench_tick_scripted(n: int, clock: VirtualClock) -> None:
+    ctl = _controller(scripted_cycle())
+    for _ in range(n):
+        ctl.tick()
+        clock.sleep(0.02)
+
+
+def _bench_trace(background: bool) -> Bench:
+    def run(n: int, clock: VirtualClock) -> None:
+        ctl = _controller(StaticEMGSource())
+        event = ctl.tick()
+        with tempfile.TemporaryDirectory() as tmp:
+            trace = TraceWriter(Path(tmp) / "bench.jsonl", background=background)
+            for _ in range(n):
+                trace.emit("tick", event)
+            trace.close()
+
+    return run
+
+
+def bench_safety(n: int, clock: VirtualClock) -> None:
+    safety = SafetySupervisor()
+    for _ in range(n):
+        safety.require_motion("bench")
+        safety.motion_allowed()
+
+
+def bench_duty_large_history(n: int, clock: VirtualClock) -> float:
+    # A full hour of history at an artificially high rate: worst case for list scans.
+    duty = DutyCyclePolicy(max_cycles_per_hour=1_000_000, min_cycle_gap_s=0.0, max_continuous_runtime_s=1e9)
+    duty._cycle_times = [clock.now - 0.18 * i for i in range(20_000, 0, -1)]
+    t0 = perf_counter()
+    for _ in range(n):
+        clock.sleep(0.18)
+        duty.allow_new_cycle()
+        duty.record_cycle_complete()
+    return perf_counter() - t0
+
+
+def bench_sequence(n: int, clock: VirtualClock) -> None:
+    arm = QArmStub()
+    safety = SafetySupervisor()
+    safety.duty = DutyCyclePolicy(max_cycles_per_hour=1_000_000, min_cycle_gap_s=0.0)
+    for _ in range(n):
+        run_sequence_on_arm(arm, STERILIZATION_AUTOMATION, safety)
+
+
+BENCHMARKS: Dict[str, tuple] = {
+    "decoder_update_intent": (bench_decoder, 20_000),
+    "tick_idle": (bench_tick_idle, 20_000),
+    "tick_scripted_cycle": (bench_tick_scripted, 20_000),
+    "trace_emit_inline": (_bench_trace(False), 5_000),
+    "trace_emit_background": (_bench_trace(True), 5_000),
+    "safety_require_motion": (bench_safety, 50_000),
+    "duty_cycle_20k_history": (bench_duty_large_history, 200),
+    "run_sequence_on_arm": (bench_sequence, 2_000),
+}
+
+
+def measure(fn: Bench, n: int, repeat: int) -> float:
+    """Best-of-``repeat`` nanoseconds per operation."""
+    best = float("inf")
+    for _ in range(repeat):
+        with virtual_time(VirtualClock(1000.0)) as clock:
+            t0 = perf_counter()
+            span = fn(n, clock)
+            best = min(best, span if span is not None else perf_counter() - t0)
+    return best / n * 1e9
+
+
+def run_all(selected, scale: float, repeat: int) -> Dict[str, dict]:
+    results = {}
+    for name in selected:
+        fn, n = BENCHMARKS[name]
+        n = max(1, int(n * scale))
+        ns = measure(fn, n, repeat)
+        results[name] = {"ns_per_op": round(ns, 1), "ops_per_s": round(1e9 / ns, 1), "n": n}
+        print(f"{name:26s} {ns:12.1f} ns/op {1e9 / ns:14.0f} ops/s")
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> list:
+    regressions = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:26s} (no baseline)")
+            continue
+        ratio = row["ns_per_op"] / base["ns_per_op"]
+        flag = "REGRESSION" if ratio > 1.0 + tolerance else "ok"
+        print(f"{name:26s} {ratio:6.2f}x baseline  {flag}")
+        if flag != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS), help="Run a subset.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply iteration counts.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of repetitions per benchmark.")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Write {BASELINE.name}.")
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE,
+        type=Path,
+        default=None,
+        help="Compare against a baseline JSON (default bench_logs/perf_baseline.json).",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown fraction before flagging."
+    )
+    args = parser.parse_args()
+    if args.save_baseline and args.compare is not None:
+        parser.error("--save-baseline and --compare are exclusive: compare first, then save")
+
+    results = run_all(args.only or list(BENCHMARKS), args.scale, args.repeat)
+    out = BASELINE if args.save_baseline else LATEST
+    saved = dict(results)
+    if args.save_baseline and args.only and BASELINE.exists():
+        # A subset run refreshes its own entries and keeps the rest of the baseline.
+        saved = {**json.loads(BASELINE.read_text(encoding="utf-8"))["benchmarks"], **results}
+    doc = {"python": platform.python_version(), "machine": platform.machine(), "benchmarks": saved}
+    out.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {out}")
+
+    if args.compare is not None:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["benchmarks"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Calibrate an operator profile from a rest capture and store it.
+
+    python scripts/emg_capture.py --source adapter --duration 60 --out rest.mmcap
+    python scripts/calibrate_operator.py --operator op-117 --rest-capture rest.mmcap
+    python -m control.cli --operator op-117 --adapter bench
+
+``--list`` prints the stored operators and their thresholds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from control.profiles import ProfileStore, calibrate_from_capture
+from hardware.capture import CaptureReader
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operator", default="")
+    parser.add_argument("--rest-capture", type=Path, default=None)
+    parser.add_argument("--profiles-dir", type=Path, default=Path("operator_profiles"))
+    parser.add_argument("--margin", type=float, default=0.5, help="Added to the rest p95 to set emg_on.")
+    parser.add_argument("--list", action="store_true", help="List stored profiles and exit.")
+    args = parser.parse_args(argv)
+
+    store = ProfileStore(args.profiles_dir)
+    if args.list:
+        for operator_id in store.ids():
+            th = store.get(operator_id).thresholds
+            print(f"{operator_id:20s} emg_on {th.emg_on:.3f} emg_off {th.emg_off:.3f}")
+        return 0
+    if not args.operator or args.rest_capture is None:
+        parser.error("--operator and --rest-capture are required")
+
+    with CaptureReader(args.rest_capture) as reader:
+        profile = calibrate_from_capture(args.operator, reader, margin=args.margin)
+    path = store.put(profile)
+    th = profile.thresholds
+    print(
+        f"{profile.operator_id}: baseline {profile.baseline_mean[0]:.3f}/{profile.baseline_mean[1]:.3f}, "
+        f"emg_on {th.emg_on:.3f}, emg_off {th.emg_off:.3f} ({profile.rest_samples} samples) -> {path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Capture raw two-channel EMG into the columnar .mmcap format.
+
+``--source adapter`` samples the bench/integration adapter in real time;
+``--source synthetic`` writes a deterministic rest + contraction profile
+instantly (useful for exercising decoders and sweeps on long files).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from time import perf_counter, sleep
+
+from hardware.adapters import BenchRigAdapter, IntegrationRigAdapter
+from hardware.capture import CaptureReader, CaptureWriter
+
+
+def synthetic(writer: CaptureWriter, n: int, seed: int, rest: bool = False) -> None:
+    rng = random.Random(seed)
+    block = int(writer.sample_rate)
+    for start in range(0, n, block):
+        size = min(block, n - start)
+        second = start // block
+        burst = not rest and second % 10 in (3, 7)
+        ch1 = [abs(rng.gauss(0.85 if burst and second % 20 < 10 else 0.02, 0.03)) for _ in range(size)]
+        ch2 = [abs(rng.gauss(0.85 if burst and second % 20 >= 10 else 0.02, 0.03)) for _ in range(size)]
+        writer.append_block([ch1, ch2])
+
+
+def from_adapter(writer: CaptureWriter, n: int, adapter_name: str, signoff_id: str) -> None:
+    if adapter_name == "bench":
+        adapter = BenchRigAdapter()
+    else:
+        adapter = IntegrationRigAdapter()
+        adapter.set_bench_signoff(signoff_id)
+    adapter.connect()
+    emg = adapter.emg()
+    dt = 1.0 / writer.sample_rate
+    t_next = perf_counter()
+    for _ in range(n):
+        writer.append(*emg.read())
+        t_next += dt
+        delay = t_next - perf_counter()
+        if delay > 0:
+            sleep(delay)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Capture raw EMG to .mmcap")
+    parser.add_argument("--out", type=Path, required=True)
+    parser.add_argument("--rate", type=float, default=1000.0, help="Sample rate (Hz).")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to capture.")
+    parser.add_argument("--source", choices=["synthetic", "adapter"], default="synthetic")
+    parser.add_argument("--adapter", choices=["bench", "integration"], default="bench")
+    parser.add_argument("--signoff-id", default="BENCH-LOCAL-001")
+    parser.add_argument("--chunk", type=int, default=65536, help="Samples per chunk.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rest", action="store_true", help="Synthetic rest only (no contractions).")
+    args = parser.parse_args(argv)
+
+    n = int(args.rate * args.duration)
+    calibration = {"source": args.source, "normalized": True}
+    with CaptureWriter(args.out, args.rate, chunk_samples=args.chunk, calibration=calibration) as writer:
+        if args.source == "synthetic":
+            synthetic(writer, n, args.seed, rest=args.rest)
+        else:
+            from_adapter(writer, n, args.adapter, args.signoff_id)
+
+    with CaptureReader(args.out) as reader:
+        out = {
+            "path": str(args.out),
+            "samples": reader.total_samples,
+            "chunks": len(reader.index),
+            "duration_s": reader.duration_s,
+            "bytes": args.out.stat().st_size,
+        }
+    print(json.dumps(out, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Replay a recorded EMG session (musclemate --record) through the controller.
+
+``build`` starts from default tuning; the recording's tuning records
+(thresholds, speeds, operator offsets and gains, live-config changes) are
+applied as they come, so an ``--emg-on`` or ``--operator`` session replays
+as it ran.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.state_machine import SterilizationController
+from control.trace import TraceWriter
+from hardware.arm import QArmStub
+from hardware.safeguarded_arm import SafeguardedArm
+from safety.interlocks import SafetySupervisor
+from sim.replay import load_session, replay_session
+
+
+def build(emg) -> SterilizationController:
+    safety = SafetySupervisor()
+    return SterilizationController(
+        arm=SafeguardedArm(QArmStub(), safety),
+        emg=emg,
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded MuscleMate session")
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--realtime", action="store_true", help="Replay at recorded speed.")
+    parser.add_argument("--trace", type=Path, default=None, help="Write replayed events as JSONL.")
+    args = parser.parse_args(argv)
+
+    records = load_session(args.recording)
+    t0 = perf_counter()
+    events = replay_session(args.recording, build, realtime=args.realtime)
+    elapsed = perf_counter() - t0
+
+    if args.trace:
+        trace = TraceWriter(args.trace)
+        for event in events:
+            trace.emit("tick", event)
+        trace.close()
+
+    span = records[-1][1] - records[0][1] if records else 0.0
+    out = {
+        "records": len(records),
+        "events": len(events),
+        "recorded_span_s": round(span, 3),
+        "replay_s": round(elapsed, 3),
+        "speedup": round(span / elapsed, 1) if elapsed > 0 else None,
+        "states": dict(Counter(e.state.name for e in events)),
+    }
+    print(json.dumps(out, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Measure round-trip latency to the TCP rig: single calls vs pipelined polls.
+
+Starts scripts/rig_server.py in a child process unless ``--address`` points at
+a running rig, then times, per operation:
+
+    ping              one request, one round trip
+    poll_sequential   EMG batch and interlock inputs as two round trips
+    poll_pipelined    the same two requests in one round trip (TcpRigAdapter.poll)
+    move              one arm command
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from hardware.adapters.tcp_rig import TcpRigAdapter
+from hardware.rig_server import EMG_REQUEST, OP_EMG, OP_INPUTS, OP_PING
+
+
+def timed(fn, n: int) -> float:
+    t0 = perf_counter()
+    for _ in range(n):
+        fn()
+    return (perf_counter() - t0) / n
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--address", default="", help="HOST:PORT of a running rig (default: spawn one).")
+    parser.add_argument("--signoff-id", default="BENCH-LOCAL-001")
+    parser.add_argument("-n", type=int, default=2000, help="Iterations per measurement.")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.address:
+        host, port = args.address.rsplit(":", 1)
+    else:
+        server = subprocess.Popen(
+            [sys.executable, str(ROOT / "scripts" / "rig_server.py"), "--port", "0"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        assert server.stdout is not None
+        host, port = server.stdout.readline().split()[1].rsplit(":", 1)
+    try:
+        adapter = TcpRigAdapter(host, int(port))
+        adapter.set_bench_signoff(args.signoff_id)
+        adapter.connect()
+        conn = adapter.connection
+        arm = adapter.arm()
+        emg_req = EMG_REQUEST.pack(adapter.emg_batch)
+        rows = {
+            "ping": timed(lambda: conn.call(OP_PING), args.n),
+            "poll_sequential": timed(lambda: (conn.call(OP_EMG, emg_req), conn.call(OP_INPUTS)), args.n),
+            "poll_pipelined": timed(adapter.poll, args.n),
+            "move": timed(lambda: arm.move_pose(0.38, 0.0, 0.2, speed=0.5), args.n),
+        }
+        for name, seconds in rows.items():
+            print(f"{name:16s} {1e6 * seconds:9.1f} us")
+        report = adapter.commissioning_report()
+        print(f"{report['round_trips']} round trips, max {report['rtt_max_ms']:.2f} ms")
+        adapter.close()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Run the local TCP integration-rig stand-in (arm, EMG stream, interlocks).
+
+    python scripts/rig_server.py --port 7700
+    python -m control.cli --adapter tcp --rig-address 127.0.0.1:7700 --demo
+
+Prints ``listening HOST:PORT`` once ready (``--port 0`` picks a free port).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from hardware.rig_server import RigServer, RigState
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7700)
+    parser.add_argument("--emg-rate", type=float, default=1000.0, help="Synthetic EMG sample rate (Hz).")
+    parser.add_argument("--move-latency", type=float, default=0.0, help="Simulated seconds per arm move.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    server = RigServer(args.host, args.port, RigState(emg_rate=args.emg_rate, move_latency_s=args.move_latency))
+    print("listening %s:%d" % server.address, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
-"""Run a versioned Python motion sequence (manufacturing / sterilization)."""
+"""Run a versioned motion sequence (manufacturing / sterilization).
+
+Sequences come from the file library (sequences/library, MUSCLEMATE_SEQUENCES
+and --sequence-dir) and are selected as ``name`` (newest version) or
+``name@version``; ``sterilization`` and ``manufacturing`` remain aliases.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 import sys
+from pathlib import Path
 
 from hardware.adapters import BenchRigAdapter, IntegrationRigAdapter
 from hardware.safeguarded_arm import SafeguardedArm
-from sequences import MANUFACTURING_VALIDATION, STERILIZATION_AUTOMATION, run_sequence_on_arm
+from sequences import run_sequence_on_arm
+from sequences.registry import default_registry
 
-SEQUENCES = {
-    "sterilization": STERILIZATION_AUTOMATION,
-    "manufacturing": MANUFACTURING_VALIDATION,
+ALIASES = {
+    "sterilization": "sterilization_automation",
+    "manufacturing": "manufacturing_validation",
 }
 
 
@@ -21,13 +28,43 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run MuscleMate motion sequence")
     parser.add_argument(
         "--sequence",
-        choices=list(SEQUENCES.keys()),
         default="sterilization",
+        help="name[@version] from the sequence library, or an alias: " + ", ".join(ALIASES),
+    )
+    parser.add_argument(
+        "--sequence-dir",
+        type=Path,
+        action="append",
+        default=[],
+        help="Additional sequence library directory (repeatable; later wins).",
     )
+    parser.add_argument("--list", action="store_true", help="List available sequences and exit.")
     parser.add_argument("--adapter", choices=["bench", "integration"], default="bench")
     parser.add_argument("--signoff-id", default="BENCH-LOCAL-001")
+    parser.add_argument(
+        "--workspace",
+        action="store_true",
+        help="Validate the sequence against the reach/keep-out grid before moving.",
+    )
     args = parser.parse_args(argv)
 
+    workspace = None
+    if args.workspace:
+        from hardware.workspace import WorkspaceGrid
+
+        workspace = WorkspaceGrid.load_or_build()
+    registry = default_registry(args.sequence_dir, workspace=workspace)
+    if args.list:
+        for name in registry.names():
+            print(f"{name:32s} {', '.join(registry.versions(name))}")
+        return 0
+    name, _, version = args.sequence.partition("@")
+    spec = ALIASES.get(name, name) + (f"@{version}" if version else "")
+    try:
+        seq = registry.get(spec)
+    except (KeyError, ValueError) as exc:
+        parser.error(exc.args[0])
+
     if args.adapter == "bench":
         adapter = BenchRigAdapter()
     else:
@@ -36,9 +73,8 @@ def main(argv: list[str] | None = None) -> int:
 
     adapter.connect()
     safety = adapter.safety()
-    arm = SafeguardedArm(adapter.arm(), safety)
-    seq = SEQUENCES[args.sequence]
-    log = run_sequence_on_arm(arm, seq, safety)
+    arm = SafeguardedArm(adapter.arm(), safety, workspace=workspace)
+    log = run_sequence_on_arm(arm, seq, safety, workspace=workspace)
     out = {
         "sequence": seq.name,
         "version": seq.version,
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Run the scenario matrix (EMG profile x thresholds x adapter x fault) in parallel.
+
+Every combination of the selected registry entries from sim/scenarios.py is
+run in virtual time; exits 1 if any scenario breaks an invariant or crashes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sim.scenarios import ADAPTERS, FAULTS, PROFILES, THRESHOLDS, build_matrix, run_matrix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", choices=sorted(PROFILES), default=list(PROFILES))
+    parser.add_argument("--thresholds", nargs="+", choices=sorted(THRESHOLDS), default=list(THRESHOLDS))
+    parser.add_argument("--adapters", nargs="+", choices=sorted(ADAPTERS), default=list(ADAPTERS))
+    parser.add_argument("--faults", nargs="+", choices=FAULTS, default=list(FAULTS))
+    parser.add_argument("--seeds", type=int, default=1, help="Seeds per combination.")
+    parser.add_argument("--duration", type=float, default=120.0, help="Virtual seconds per scenario.")
+    parser.add_argument(
+        "--max-dwell", type=float, default=30.0, help="Liveness limit: seconds any non-IDLE state may be held."
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--json", type=Path, default=None, help="Write the aggregated report here.")
+    args = parser.parse_args()
+
+    scenarios = build_matrix(
+        args.profiles,
+        args.thresholds,
+        args.adapters,
+        args.faults,
+        seeds=range(args.seeds),
+        duration_s=args.duration,
+        max_state_dwell_s=args.max_dwell,
+    )
+    report = run_matrix(scenarios, workers=args.workers)
+
+    print(
+        f"{report.total} scenarios in {report.wall_s:.1f} s wall ({report.cpu_s:.1f} s CPU), "
+        f"{report.cycles_completed} cycles completed, {len(report.failed)} failed"
+    )
+    print("slowest:")
+    for r in report.slowest:
+        print(f"  {r.wall_s * 1e3:8.1f} ms  {r.name}")
+    for r in report.failed:
+        print(f"FAIL {r.name}: {r.error or r.violation_counts}")
+        for line in r.violations:
+            print(f"     {line}")
+    if args.json:
+        args.json.write_text(json.dumps(report.as_dict(), indent=2) + "\n", encoding="utf-8")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Soak the controller over 24+ hours of virtual time (see sim/soak.py).
+
+Prints a summary, optionally writes the full JSON report, and exits 1 when
+any invariant was violated or memory grew past ``--max-growth-kib``.
+Findings (e.g. the cell stopping at the continuous-runtime ceiling with
+``--no-session-breaks``) are printed but do not fail the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from safety.interlocks import DutyCyclePolicy
+from sim.soak import SoakConfig, run_soak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--loop-rate", type=float, default=SoakConfig().loop_hz)
+    parser.add_argument("--faults-per-hour", type=float, default=SoakConfig().faults_per_hour)
+    parser.add_argument(
+        "--max-continuous-runtime",
+        type=float,
+        default=None,
+        help="Override DutyCyclePolicy.max_continuous_runtime_s (seconds).",
+    )
+    parser.add_argument(
+        "--no-session-breaks",
+        action="store_true",
+        help="Operator never breaks: reproduces the cell stopping at the continuous-runtime ceiling.",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (faster).")
+    parser.add_argument("--max-growth-kib", type=float, default=256.0)
+    parser.add_argument("--json", type=Path, default=None, help="Write the full report here.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    duty = None
+    if args.max_continuous_runtime is not None:
+        duty = DutyCyclePolicy(max_continuous_runtime_s=args.max_continuous_runtime)
+    report = run_soak(
+        SoakConfig(
+            hours=args.hours,
+            seed=args.seed,
+            loop_hz=args.loop_rate,
+            faults_per_hour=args.faults_per_hour,
+            duty=duty,
+            session_breaks=not args.no_session_breaks,
+            track_memory=not args.no_memory,
+        )
+    )
+
+    print(f"virtual {report.virtual_s / 3600:.1f} h in {report.wall_s:.1f} s wall, {report.ticks} ticks")
+    print(f"cycles: {report.cycles_completed} completed / {report.cycle_starts} started")
+    print(f"cycles per hour: {report.cycles_per_hour} ({report.session_breaks} operator break(s))")
+    print(f"faults injected: {report.faults_injected}; safety faults: {report.safety_faults}")
+    for reason, n in sorted(report.refusals.items()):
+        print(f"refused x{n}: {reason} (first at {report.first_refusal_h[reason]:.2f} h)")
+    if report.memory_growth_kib is not None:
+        print(f"memory growth after warm-up: {report.memory_growth_kib:+.1f} KiB (peak {report.memory_peak_kib} KiB)")
+        for line in report.memory_top_growth:
+            print(f"  {line}")
+    for finding in report.findings:
+        print(f"FINDING {finding}")
+    for v in report.violations[:20]:
+        print(f"VIOLATION {v.invariant} at {v.t / 3600:.2f} h: {v.detail}")
+    if args.json:
+        args.json.write_text(json.dumps(report.as_dict(), indent=2, default=str) + "\n", encoding="utf-8")
+
+    grew = report.memory_growth_kib is not None and report.memory_growth_kib > args.max_growth_kib
+    return 0 if report.ok and not grew else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,10 +3,13 @@
 
 Writes bench_logs/threshold_sweep_summary.csv for calibration traceability.
 Uses deterministic sample lists — regenerate after changing control/config.py defaults.
+With ``--rest-capture FILE`` (a .mmcap from scripts/emg_capture.py recorded at
+rest) false triggers are also counted on real rest EMG, read via mmap.
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
 import sys
 from pathlib import Path
@@ -17,6 +20,7 @@ sys.path.insert(0, str(ROOT))
 
 from control.config import Thresholds
 from control.gesture import GestureDecoder
+from hardware.capture import CaptureReader
 
 OUT = ROOT / "bench_logs" / "threshold_sweep_summary.csv"
 
@@ -53,7 +57,19 @@ def count_missed_starts(decoder: GestureDecoder, samples: list[tuple[float, floa
     return missed
 
 
-def main() -> int:
+def capture_samples(path: Path, step_s: float = 0.20) -> list[tuple[float, float]]:
+    """Rest capture decimated to the sweep's clock step."""
+    with CaptureReader(path) as reader:
+        stride = max(1, int(reader.sample_rate * step_s))
+        return [(s[0], s[1]) for s in reader.iter_samples(step=stride)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rest-capture", type=Path, default=None)
+    args = parser.parse_args(argv)
+    rest_capture = capture_samples(args.rest_capture) if args.rest_capture else None
+
     OUT.parent.mkdir(parents=True, exist_ok=True)
     rows: list[dict] = []
     for emg_on in (0.55, 0.60, 0.65, 0.70, 0.75):
@@ -69,16 +85,20 @@ def main() -> int:
                 false_noisy = count_intents(GestureDecoder(th), NOISY_SAMPLES, clock)
                 clock[0] = 0.0
                 missed = count_missed_starts(GestureDecoder(th), CONTRACT_SAMPLES, clock)
-            rows.append(
-                {
-                    "emg_on": emg_on,
-                    "emg_off": emg_off,
-                    "false_triggers_rest": false_rest,
-                    "false_triggers_noisy": false_noisy,
-                    "missed_start_ticks": missed,
-                    "recommended": emg_on == 0.65 and emg_off == 0.35,
-                }
-            )
+                if rest_capture is not None:
+                    clock[0] = 0.0
+                    false_capture = count_intents(GestureDecoder(th), rest_capture, clock)
+            row = {
+                "emg_on": emg_on,
+                "emg_off": emg_off,
+                "false_triggers_rest": false_rest,
+                "false_triggers_noisy": false_noisy,
+                "missed_start_ticks": missed,
+                "recommended": emg_on == 0.65 and emg_off == 0.35,
+            }
+            if rest_capture is not None:
+                row["false_triggers_rest_capture"] = false_capture
+            rows.append(row)
 
     with OUT.open("w", newline="") as f:
         w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
@@ -6,6 +6,7 @@ from .motion_sequences import (
     MotionSequence,
     MotionStep,
     run_sequence_on_arm,
+    validate_sequence,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "MotionSequence",
     "MotionStep",
     "run_sequence_on_arm",
+    "validate_sequence",
 ]
@@ -10,11 +10,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from time import sleep
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from hardware.arm import ArmInterface
 from safety.interlocks import SafetySupervisor
 
+if TYPE_CHECKING:
+    from hardware.workspace import WorkspaceGrid
+
 
 class StepKind(Enum):
     MOVE = auto()
@@ -79,14 +82,44 @@ MANUFACTURING_VALIDATION = MotionSequence(
 )
 
 
+def validate_sequence(sequence: MotionSequence, workspace: "WorkspaceGrid") -> List[str]:
+    """
+    Check every MOVE pose and the straight path between consecutive MOVEs
+    against the workspace grid (a HOME step starts a new path).
+    """
+    problems: List[str] = []
+    path: List[Tuple[float, float, float]] = []
+    labels: List[str] = []
+    for idx, step in enumerate(sequence.steps + [MotionStep(StepKind.HOME)]):
+        if step.kind == StepKind.MOVE and step.pose:
+            path.append(step.pose)
+            labels.append(f"step {idx} ({step.note or 'move'})")
+        elif step.kind == StepKind.HOME and path:
+            problems.extend(workspace.check_path(path, labels))
+            path, labels = [], []
+    return problems
+
+
 def run_sequence_on_arm(
     arm: ArmInterface,
     sequence: MotionSequence,
     safety: Optional[SafetySupervisor] = None,
     *,
     step_delay_s: float = 0.05,
+    workspace: Optional["WorkspaceGrid"] = None,
 ) -> List[dict]:
-    """Execute a motion sequence with optional interlock gating."""
+    """
+    Execute a motion sequence with optional interlock gating.
+
+    With ``workspace`` the whole sequence is validated first and nothing
+    moves if any pose or path is invalid (``WorkspaceViolation``).
+    """
+    if workspace is not None:
+        problems = validate_sequence(sequence, workspace)
+        if problems:
+            from hardware.workspace import WorkspaceViolation
+
+            raise WorkspaceViolation(f"{sequence.name}@{sequence.version}: " + "; ".join(problems))
     log: List[dict] = []
     for idx, step in enumerate(sequence.steps):
         if safety is not None and step.kind != StepKind.CYCLE_MARK:
@@ -0,0 +1,197 @@
+"""
+File-based motion sequence library.
+
+Each sequence is one JSON file named ``<name>@<version>.json``::
+
+    {"name": "sterilization_automation", "version": "1.0.0",
+     "description": "...",
+     "steps": [{"kind": "HOME", "note": "safe start"},
+               {"kind": "MOVE", "pose": [0.30, 0.18, 0.08], "speed": 0.35}, ...]}
+
+``SequenceRegistry`` indexes one or more directories by file name only; a
+file is read, validated and parsed the first time its sequence is requested.
+Parsed sequences are cached by the SHA-256 of the file bytes, so an edited
+file is re-parsed and an unchanged one (or an identical copy) is not; the
+file's name@version must match its contents on every load, cached or not.
+Directories listed later override earlier ones for the same name@version.
+The package ships ``sequences/library``; ``MUSCLEMATE_SEQUENCES`` (an
+``os.pathsep``-separated list) adds site directories.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .motion_sequences import MotionSequence, MotionStep, StepKind, validate_sequence
+
+if TYPE_CHECKING:
+    from hardware.workspace import WorkspaceGrid
+
+LIBRARY = Path(__file__).resolve().parent / "library"
+_FILE = re.compile(r"^(?P<name>[A-Za-z0-9_.-]+)@(?P<version>[A-Za-z0-9_.+-]+)\.json$")
+
+
+def parse_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """``"name"`` or ``"name@version"`` -> ``(name, version or None)``."""
+    name, _, version = spec.partition("@")
+    return name, version or None
+
+
+def _version_key(version: str) -> Tuple[Any, ...]:
+    """SemVer precedence: a prerelease (``1.0.0-rc1``) sorts below its release; build metadata is ignored."""
+    core, _, prerelease = version.split("+", 1)[0].partition("-")
+    pre = (0,) + _identifiers(prerelease) if prerelease else (1,)
+    return (_identifiers(core), pre)
+
+
+def _identifiers(text: str) -> Tuple[Any, ...]:
+    return tuple((0, int(p), "") if p.isdigit() else (1, 0, p) for p in text.split("."))
+
+
+def sequence_to_dict(sequence: MotionSequence) -> Dict[str, Any]:
+    steps = []
+    for step in sequence.steps:
+        row: Dict[str, Any] = {"kind": step.kind.name}
+        if step.pose is not None:
+            row["pose"] = list(step.pose)
+        if step.kind == StepKind.MOVE:
+            row["speed"] = step.speed
+        if step.dwell_s:
+            row["dwell_s"] = step.dwell_s
+        if step.note:
+            row["note"] = step.note
+        steps.append(row)
+    return {"name": sequence.name, "version": sequence.version, "description": sequence.description, "steps": steps}
+
+
+def dump_sequence(sequence: MotionSequence, directory: Path) -> Path:
+    """Write ``sequence`` as ``<name>@<version>.json`` (one step per line, diff-friendly)."""
+    doc = sequence_to_dict(sequence)
+    steps = ",\n".join("    " + json.dumps(row) for row in doc.pop("steps"))
+    head = json.dumps(doc, indent=2)[:-2]
+    path = Path(directory) / f"{sequence.name}@{sequence.version}.json"
+    path.write_text(f'{head},\n  "steps": [\n{steps}\n  ]\n}}\n', encoding="utf-8")
+    return path
+
+
+def sequence_from_dict(doc: Any, source: str = "<sequence>") -> MotionSequence:
+    """Validate and build a sequence; raises ValueError naming the bad step."""
+    if not isinstance(doc, dict):
+        raise ValueError(f"{source}: sequence must be a JSON object")
+    for key in ("name", "version", "steps"):
+        if key not in doc:
+            raise ValueError(f"{source}: missing {key!r}")
+    if not isinstance(doc["steps"], list) or not doc["steps"]:
+        raise ValueError(f"{source}: steps must be a non-empty list")
+    steps = []
+    for idx, row in enumerate(doc["steps"]):
+        where = f"{source}: step {idx}"
+        if not isinstance(row, dict):
+            raise ValueError(f"{where}: must be an object")
+        unknown = set(row) - {"kind", "pose", "speed", "dwell_s", "note"}
+        if unknown:
+            raise ValueError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+        try:
+            kind = StepKind[row.get("kind", "")]
+        except KeyError:
+            raise ValueError(f"{where}: unknown kind {row.get('kind')!r}") from None
+        pose = row.get("pose")
+        if kind == StepKind.MOVE:
+            if not isinstance(pose, list) or len(pose) != 3 or not all(isinstance(v, (int, float)) for v in pose):
+                raise ValueError(f"{where}: MOVE needs pose [x, y, z]")
+            pose = (float(pose[0]), float(pose[1]), float(pose[2]))
+        elif pose is not None:
+            raise ValueError(f"{where}: only MOVE steps take a pose")
+        speed = float(row.get("speed", MotionStep.speed))
+        if not 0.0 < speed <= 1.0:
+            raise ValueError(f"{where}: speed must be in (0, 1]")
+        dwell = float(row.get("dwell_s", 0.0))
+        if dwell < 0.0:
+            raise ValueError(f"{where}: dwell_s must be >= 0")
+        steps.append(MotionStep(kind, pose, speed, dwell, str(row.get("note", ""))))
+    return MotionSequence(str(doc["name"]), str(doc["version"]), steps, str(doc.get("description", "")))
+
+
+class SequenceRegistry:
+    """Lazily loaded, hash-cached sequences from ``directories``."""
+
+    def __init__(self, *directories: Path, workspace: Optional["WorkspaceGrid"] = None) -> None:
+        self.directories = [Path(d) for d in directories]
+        self.workspace = workspace
+        self.hits = 0
+        self.misses = 0
+        self._index: Optional[Dict[str, Dict[str, Path]]] = None
+        self._parsed: Dict[str, MotionSequence] = {}
+
+    @property
+    def index(self) -> Dict[str, Dict[str, Path]]:
+        if self._index is None:
+            self.refresh()
+        assert self._index is not None
+        return self._index
+
+    def refresh(self) -> None:
+        """Rescan the directories (file names only)."""
+        index: Dict[str, Dict[str, Path]] = {}
+        for directory in self.directories:
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory):
+                match = _FILE.match(entry.name)
+                if match and entry.is_file():
+                    index.setdefault(match["name"], {})[match["version"]] = Path(entry.path)
+        self._index = index
+
+    def names(self) -> List[str]:
+        return sorted(self.index)
+
+    def versions(self, name: str) -> List[str]:
+        return sorted(self.index.get(name, {}), key=_version_key)
+
+    def resolve(self, spec: str) -> Path:
+        """File for ``name@version``, or the newest version of ``name``; KeyError if absent."""
+        return self._locate(spec)[2]
+
+    def _locate(self, spec: str) -> Tuple[str, str, Path]:
+        name, version = parse_spec(spec)
+        versions = self.index.get(name)
+        if not versions:
+            raise KeyError(f"unknown sequence {name!r}")
+        if version is None:
+            version = max(versions, key=_version_key)
+        if version not in versions:
+            raise KeyError(f"no version {version!r} of {name!r} (have {', '.join(self.versions(name))})")
+        return name, version, versions[version]
+
+    def get(self, spec: str) -> MotionSequence:
+        """Load, validate (and workspace-check, if configured) one sequence."""
+        name, version, path = self._locate(spec)
+        blob = path.read_bytes()
+        digest = hashlib.sha256(blob).hexdigest()
+        sequence = self._parsed.get(digest)
+        if sequence is None:
+            self.misses += 1
+            sequence = sequence_from_dict(json.loads(blob), str(path))
+        else:
+            self.hits += 1
+        # Checked on hits too: an identical copy filed under another name@version is still a mismatch.
+        if (sequence.name, sequence.version) != (name, version):
+            raise ValueError(f"{path}: contains {sequence.name}@{sequence.version}, not {name}@{version}")
+        if digest not in self._parsed:
+            if self.workspace is not None:
+                problems = validate_sequence(sequence, self.workspace)
+                if problems:
+                    raise ValueError(f"{path}: outside the workspace: " + "; ".join(problems))
+            self._parsed[digest] = sequence
+        return sequence
+
+
+def default_registry(extra: Iterable[Path] = (), workspace: Optional["WorkspaceGrid"] = None) -> SequenceRegistry:
+    """Packaged library, then ``MUSCLEMATE_SEQUENCES`` directories, then ``extra``."""
+    env = [Path(p) for p in os.environ.get("MUSCLEMATE_SEQUENCES", "").split(os.pathsep) if p]
+    return SequenceRegistry(LIBRARY, *env, *extra, workspace=workspace)
@@ -1,6 +1,18 @@
 """Simulation utilities for MuscleMate."""
 
+from .clock import VirtualClock, virtual_time
 from .emg_profiles import ScriptedEMGSource, scripted_cycle
+from .replay import RecordingEMGReader, ReplayEMGReader, SessionRecorder, load_session, replay_session
 
-__all__ = ["ScriptedEMGSource", "scripted_cycle"]
+__all__ = [
+    "RecordingEMGReader",
+    "ReplayEMGReader",
+    "ScriptedEMGSource",
+    "SessionRecorder",
+    "VirtualClock",
+    "load_session",
+    "replay_session",
+    "scripted_cycle",
+    "virtual_time",
+]
 
@@ -0,0 +1,62 @@
+"""
+Virtual time for deterministic, faster-than-real-time simulation.
+
+Control modules bind ``time``/``monotonic``/``sleep`` at import; inside
+``virtual_time(clock)`` those module attributes are patched (the same
+approach ``scripts/threshold_sweep.py`` uses for the decoder) so the whole
+stack reads one ``VirtualClock`` and sleeping just advances it.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack, contextmanager
+from importlib import import_module
+from typing import Iterator, Tuple
+
+CLOCK_TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("control.gesture", "time"),
+    ("control.state_machine", "monotonic"),
+    ("control.arbitration", "monotonic"),
+    ("control.runner", "time"),
+    ("control.metrics", "monotonic"),
+    ("safety.interlocks", "monotonic"),
+    ("sim.emg_profiles", "time"),
+    ("hardware.motion_log", "monotonic"),
+)
+
+SLEEP_TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("control.state_machine", "sleep"),
+    ("control.runner", "sleep"),
+    ("sequences.motion_sequences", "sleep"),
+)
+
+
+class VirtualClock:
+    """Monotonic simulated clock; ``sleep`` advances it instantly."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.now += seconds
+
+    def advance_to(self, t: float) -> None:
+        if t > self.now:
+            self.now = t
+
+
+@contextmanager
+def virtual_time(clock: VirtualClock) -> Iterator[VirtualClock]:
+    """Route every control-stack clock read and sleep through ``clock``."""
+    from unittest.mock import patch  # deferred: unittest.mock pulls in asyncio
+
+    with ExitStack() as stack:
+        for module, name in CLOCK_TARGETS:
+            stack.enter_context(patch.object(import_module(module), name, clock.time))
+        for module, name in SLEEP_TARGETS:
+            stack.enter_context(patch.object(import_module(module), name, clock.sleep))
+        yield clock
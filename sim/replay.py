@@ -0,0 +1,304 @@
+"""
+Deterministic session record and replay of EMG inputs.
+
+``RecordingEMGReader`` wraps a live reader and appends every sample, plus
+any change of the supervisor's interlock inputs, with its timestamp to a
+compact binary file. Given the controller, it also records the tuning the
+decoder and FSM run with (thresholds, speeds, operator offsets and gains)
+as a header before the first sample and again whenever it changes (live
+config, operator switch). ``ReplayEMGReader`` feeds the same inputs back,
+applying recorded tuning to the controller it drives: in virtual time (as
+fast as the CPU allows, clock pinned to each recorded timestamp) or in real
+time. Because the decoder, duty policy and FSM only see recorded values,
+recorded tuning and recorded times, the replayed ``ControllerEvent`` stream
+matches the original run.
+
+File layout: ``MAGIC`` then records ``<Bd`` (kind, timestamp) followed by
+``<ff`` (ch1, ch2) for samples, ``<B`` (interlock bitmask) for interlocks,
+or ``<I`` (length) and UTF-8 JSON for tuning. The writer flushes about once
+per ``flush_s`` of recorded time; a recording cut off mid-record (crash,
+power loss) loads up to its last complete record. ``MMREC1`` files (no
+tuning records) still load and replay with the builder's tuning.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+from dataclasses import asdict, fields
+from pathlib import Path
+from time import sleep, time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from control.config import Speeds, Thresholds
+from control.gesture import GestureDecoder
+from hardware.emg import EMGReader
+from safety.interlocks import InterlockInputs
+
+from .clock import VirtualClock, virtual_time
+
+if TYPE_CHECKING:
+    from control.state_machine import ControllerEvent, SterilizationController
+    from safety.interlocks import SafetySupervisor
+
+LOGGER = logging.getLogger("musclemate.replay")
+
+MAGIC = b"MMREC2\n"
+_MAGIC_V1 = b"MMREC1\n"
+SAMPLE = 0
+INTERLOCKS = 1
+TUNING = 2
+
+_HEAD = struct.Struct("<Bd")
+_SAMPLE = struct.Struct("<ff")
+_MASK = struct.Struct("<B")
+_LENGTH = struct.Struct("<I")
+_INPUT_FIELDS = tuple(f.name for f in fields(InterlockInputs))
+
+Record = Tuple[int, float, Union[Tuple[float, float], InterlockInputs, Dict[str, Any]]]
+
+
+def pack_inputs(inputs: InterlockInputs) -> int:
+    mask = 0
+    for bit, name in enumerate(_INPUT_FIELDS):
+        if getattr(inputs, name):
+            mask |= 1 << bit
+    return mask
+
+
+def unpack_inputs(mask: int) -> InterlockInputs:
+    return InterlockInputs(**{name: bool(mask >> bit & 1) for bit, name in enumerate(_INPUT_FIELDS)})
+
+
+def capture_tuning(controller: "SterilizationController") -> Dict[str, Any]:
+    """What the decoder and FSM run with: thresholds, speeds, operator calibration."""
+    decoder = controller.decoder
+    return {
+        "thresholds": asdict(controller.thresholds),
+        "speeds": asdict(controller.speeds),
+        "offsets": list(decoder.offsets),
+        "gains": list(decoder.gains),
+        "operator_id": controller.operator_id,
+    }
+
+
+def apply_tuning(controller: "SterilizationController", tuning: Dict[str, Any]) -> None:
+    """Put ``controller`` in the recorded tuning, the way the live change was made."""
+    thresholds = Thresholds(**tuning["thresholds"])
+    offsets, gains = tuple(tuning["offsets"]), tuple(tuning["gains"])
+    decoder = controller.decoder
+    if (decoder.offsets, decoder.gains) != (offsets, gains):
+        # An operator switch: a fresh decoder, as ``switch_operator`` does.
+        controller._decoder = GestureDecoder(thresholds, offsets, gains)  # type: ignore[arg-type]
+    else:
+        decoder.thresholds = thresholds
+    controller.thresholds = thresholds
+    controller.speeds = Speeds(**tuning["speeds"])
+    controller.operator_id = tuning.get("operator_id", "")
+
+
+class SessionRecorder:
+    """Append-only writer for recorded sessions."""
+
+    def __init__(self, path: Path, flush_s: float = 1.0) -> None:
+        self.path = Path(path)
+        self.flush_s = flush_s
+        self._fh = open(self.path, "wb")
+        self._fh.write(MAGIC)
+        self._flushed_at: Optional[float] = None
+        self.samples = 0
+
+    def sample(self, t: float, ch1: float, ch2: float) -> None:
+        self._fh.write(_HEAD.pack(SAMPLE, t) + _SAMPLE.pack(ch1, ch2))
+        self.samples += 1
+        if self._flushed_at is None:
+            self._flushed_at = t
+        elif t - self._flushed_at >= self.flush_s:
+            self._fh.flush()
+            self._flushed_at = t
+
+    def interlocks(self, t: float, inputs: InterlockInputs) -> None:
+        self._fh.write(_HEAD.pack(INTERLOCKS, t) + _MASK.pack(pack_inputs(inputs)))
+
+    def tuning(self, t: float, tuning: Dict[str, Any]) -> None:
+        payload = json.dumps(tuning, separators=(",", ":")).encode()
+        self._fh.write(_HEAD.pack(TUNING, t) + _LENGTH.pack(len(payload)) + payload)
+        self._fh.flush()
+
+    def close(self) -> None:
+        if not self._fh.closed:
+            self._fh.flush()
+            self._fh.close()
+
+
+def load_session(path: Path) -> List[Record]:
+    data = Path(path).read_bytes()
+    if not data.startswith((MAGIC, _MAGIC_V1)):
+        raise ValueError(f"{path}: not a MuscleMate session recording")
+    records: List[Record] = []
+    offset = len(MAGIC)
+    end = len(data)
+    while offset < end:
+        start = offset
+        if offset + _HEAD.size > end:
+            break
+        kind, t = _HEAD.unpack_from(data, offset)
+        offset += _HEAD.size
+        if kind == SAMPLE and offset + _SAMPLE.size <= end:
+            ch1, ch2 = _SAMPLE.unpack_from(data, offset)
+            offset += _SAMPLE.size
+            records.append((SAMPLE, t, (ch1, ch2)))
+        elif kind == INTERLOCKS and offset + _MASK.size <= end:
+            (mask,) = _MASK.unpack_from(data, offset)
+            offset += _MASK.size
+            records.append((INTERLOCKS, t, unpack_inputs(mask)))
+        elif kind == TUNING and offset + _LENGTH.size <= end:
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            if offset + length > end:
+                offset = start
+                break
+            records.append((TUNING, t, json.loads(data[offset : offset + length])))
+            offset += length
+        elif kind in (SAMPLE, INTERLOCKS, TUNING):
+            offset = start
+            break
+        else:
+            raise ValueError(f"{path}: unknown record kind {kind} at byte {start}")
+    if offset < end:
+        LOGGER.warning("%s: ignoring %d trailing byte(s) of a truncated record", path, end - offset)
+    return records
+
+
+class RecordingEMGReader(EMGReader):
+    """Pass-through reader that records samples, interlock and tuning changes."""
+
+    def __init__(
+        self,
+        inner: EMGReader,
+        recorder: SessionRecorder,
+        safety: Optional["SafetySupervisor"] = None,
+        clock: Callable[[], float] = time,
+        controller: Optional["SterilizationController"] = None,
+    ) -> None:
+        self.inner = inner
+        self.recorder = recorder
+        self.safety = safety
+        self.clock = clock
+        self.controller = controller
+        self._inputs: Optional[InterlockInputs] = None
+        self._tuning: Optional[Tuple[Any, ...]] = None
+
+    def read(self) -> Tuple[float, float]:
+        value = self.inner.read()
+        t = self.clock()
+        ctl = self.controller
+        # Identity checks only: tuning objects are frozen and replaced whole.
+        if ctl is not None and (
+            self._tuning is None
+            or ctl.thresholds is not self._tuning[0]
+            or ctl.speeds is not self._tuning[1]
+            or ctl._decoder is not self._tuning[2]
+            or ctl.decoder.thresholds is not self._tuning[3]
+        ):
+            self._tuning = (ctl.thresholds, ctl.speeds, ctl._decoder, ctl.decoder.thresholds)
+            self.recorder.tuning(t, capture_tuning(ctl))
+        if self.safety is not None and self.safety.inputs is not self._inputs:
+            self._inputs = self.safety.inputs
+            self.recorder.interlocks(t, self._inputs)
+        # Store the float32-rounded value so live and replayed runs agree exactly.
+        ch1, ch2 = _SAMPLE.unpack(_SAMPLE.pack(*value))
+        self.recorder.sample(t, ch1, ch2)
+        return ch1, ch2
+
+
+class ReplayEMGReader(EMGReader):
+    """Feed recorded samples (and interlock changes) back in order."""
+
+    def __init__(
+        self,
+        records: List[Record],
+        *,
+        clock: Optional[VirtualClock] = None,
+        safety: Optional["SafetySupervisor"] = None,
+        controller: Optional["SterilizationController"] = None,
+    ) -> None:
+        self.records = records
+        self.clock = clock
+        self.safety = safety
+        self.controller = controller
+        self._idx = 0
+        self._last: Tuple[float, float] = (0.0, 0.0)
+        self._origin: Optional[Tuple[float, float]] = None
+
+    @property
+    def exhausted(self) -> bool:
+        return self._idx >= len(self.records)
+
+    def read(self) -> Tuple[float, float]:
+        while not self.exhausted:
+            kind, t, payload = self.records[self._idx]
+            self._idx += 1
+            self._wait_until(t)
+            if kind == INTERLOCKS:
+                if self.safety is not None:
+                    self.safety.inputs = payload  # type: ignore[assignment]
+                continue
+            if kind == TUNING:
+                if self.controller is not None:
+                    apply_tuning(self.controller, payload)  # type: ignore[arg-type]
+                continue
+            self._last = payload  # type: ignore[assignment]
+            return self._last
+        return self._last
+
+    def _wait_until(self, t: float) -> None:
+        if self.clock is not None:
+            self.clock.advance_to(t)
+            return
+        if self._origin is None:
+            self._origin = (t, time())
+        delay = (t - self._origin[0]) - (time() - self._origin[1])
+        if delay > 0:
+            sleep(delay)
+
+
+def replay_session(
+    path: Path,
+    build: Callable[[EMGReader], "SterilizationController"],
+    *,
+    realtime: bool = False,
+) -> List["ControllerEvent"]:
+    """
+    Replay a recording through a fresh controller and return its events.
+
+    ``build`` receives the replay reader and returns a controller wired to
+    it (and to the supervisor whose interlocks should be replayed, via the
+    controller's ``safety``); recorded tuning overrides the controller's. Without ``realtime`` the run happens in
+    virtual time, as fast as the CPU allows.
+    """
+    records = load_session(path)
+    if realtime:
+        return _drive(records, build, clock=None)
+    clock = VirtualClock(records[0][1] if records else 0.0)
+    with virtual_time(clock):
+        return _drive(records, build, clock=clock)
+
+
+def _drive(
+    records: List[Record],
+    build: Callable[[EMGReader], "SterilizationController"],
+    clock: Optional[VirtualClock],
+) -> List["ControllerEvent"]:
+    reader = ReplayEMGReader(records, clock=clock)
+    controller = build(reader)
+    reader.safety = controller.safety
+    reader.controller = controller
+    events = []
+    while True:
+        event = controller.tick()
+        if event is not None:
+            events.append(event)
+        if reader.exhausted:
+            return events
@@ -0,0 +1,269 @@
+"""
+Scenario matrix: EMG profiles x thresholds x adapters x fault injections.
+
+Each ``Scenario`` names one entry from every registry below, so it pickles
+cheaply and runs in any worker process. ``run_scenario`` builds the full
+controller stack on the named adapter, drives it for ``duration_s`` of
+virtual time with the fault injected at a seeded moment, and audits it with
+``sim.soak.InvariantMonitor`` (no motion while faulted, every cycle ends
+through HOME or a homing abort, duty limits respected, no state other than
+IDLE held past ``max_state_dwell_s``).
+``run_matrix`` fans scenarios out over a process pool and aggregates the
+failing and slowest ones.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.state_machine import State, SterilizationController
+from hardware.adapters import BenchRigAdapter, IntegrationRigAdapter
+from hardware.emg import EMGReader, StaticEMGSource
+from hardware.safeguarded_arm import SafeguardedArm
+from safety.interlocks import SafetyFault, SafetySupervisor
+
+from .clock import VirtualClock, virtual_time
+from .emg_profiles import ScriptedEMGSource, scripted_cycle
+from .soak import InvariantMonitor, SyntheticOperator
+
+LOGGER = logging.getLogger("musclemate.scenarios")
+
+
+class _TremorEMG(EMGReader):
+    """Random activity straddling the hysteresis band (false-trigger stress)."""
+
+    def __init__(self, rng: random.Random, lo: float = 0.2, hi: float = 0.75) -> None:
+        self.rng = rng
+        self.lo = lo
+        self.hi = hi
+
+    def read(self) -> Tuple[float, float]:
+        return (self.rng.uniform(self.lo, self.hi), self.rng.uniform(self.lo, self.hi))
+
+
+ProfileFactory = Callable[[VirtualClock, random.Random, Thresholds], EMGReader]
+
+PROFILES: Dict[str, ProfileFactory] = {
+    "scripted_cycle": lambda clock, rng, th: scripted_cycle(),
+    "rest": lambda clock, rng, th: StaticEMGSource((0.0, 0.0)),
+    "noisy_rest": lambda clock, rng, th: ScriptedEMGSource(
+        [((0.04, 0.03), 0.3), ((0.30, 0.32), 0.2), ((0.02, 0.05), 0.5)]
+    ),
+    "tremor": lambda clock, rng, th: _TremorEMG(rng),
+    "operator": lambda clock, rng, th: SyntheticOperator(clock, rng, th, idle_gap_s=(1.0, 5.0)),
+}
+
+THRESHOLDS: Dict[str, Thresholds] = {
+    "default": Thresholds(),
+    "sensitive": replace(Thresholds(), emg_on=0.5, emg_off=0.25, debounce_s=0.1),
+    "strict": replace(Thresholds(), emg_on=0.8, emg_off=0.45, debounce_s=0.25),
+}
+
+
+def _bench() -> BenchRigAdapter:
+    return BenchRigAdapter()
+
+
+def _integration() -> IntegrationRigAdapter:
+    adapter = IntegrationRigAdapter()
+    adapter.set_bench_signoff("SCENARIO-MATRIX")
+    return adapter
+
+
+ADAPTERS: Dict[str, Callable[[], object]] = {
+    "bench": _bench,
+    "integration": _integration,
+}
+
+FAULTS: Tuple[str, ...] = ("none", "estop", "light_curtain", "drive_power", "door_open", "emg_dropout")
+_FAULT_INPUT = {"light_curtain": "light_curtain_clear", "drive_power": "drive_power_ok", "door_open": "door_closed"}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    profile: str
+    thresholds: str
+    adapter: str
+    fault: str = "none"
+    seed: int = 0
+    duration_s: float = 120.0
+    loop_hz: float = 50.0
+    max_state_dwell_s: float = 30.0
+
+    @property
+    def name(self) -> str:
+        return f"{self.profile}/{self.thresholds}/{self.adapter}/{self.fault}#{self.seed}"
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    ok: bool
+    wall_s: float
+    ticks: int = 0
+    cycle_starts: int = 0
+    cycles_completed: int = 0
+    cycles_aborted: int = 0
+    tick_faults: int = 0
+    fault_at_s: Optional[float] = None
+    violation_counts: Dict[str, int] = field(default_factory=dict)
+    violations: List[str] = field(default_factory=list)
+    error: str = ""
+
+
+@dataclass
+class MatrixReport:
+    total: int
+    failed: List[ScenarioResult]
+    slowest: List[ScenarioResult]
+    wall_s: float
+    cpu_s: float
+    cycles_completed: int
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def build_matrix(
+    profiles: Iterable[str] = tuple(PROFILES),
+    thresholds: Iterable[str] = tuple(THRESHOLDS),
+    adapters: Iterable[str] = tuple(ADAPTERS),
+    faults: Iterable[str] = FAULTS,
+    *,
+    seeds: Iterable[int] = (0,),
+    duration_s: float = 120.0,
+    max_state_dwell_s: float = Scenario.max_state_dwell_s,
+) -> List[Scenario]:
+    for name in faults:
+        if name not in FAULTS:
+            raise ValueError(f"unknown fault {name!r}")
+    return [
+        Scenario(p, t, a, f, seed, duration_s, max_state_dwell_s=max_state_dwell_s)
+        for p, t, a, f, seed in itertools.product(profiles, thresholds, adapters, faults, seeds)
+    ]
+
+
+def run_scenario(scenario: Scenario) -> ScenarioResult:
+    """Run one scenario in virtual time (safe to call in a worker process)."""
+    t0 = perf_counter()
+    try:
+        with virtual_time(VirtualClock(0.0)) as clock:
+            result = _run(scenario, clock)
+    except Exception as exc:  # a crash is a failed scenario, not a failed matrix
+        result = ScenarioResult(scenario.name, ok=False, wall_s=0.0, error=repr(exc))
+    result.wall_s = perf_counter() - t0
+    return result
+
+
+def _run(sc: Scenario, clock: VirtualClock) -> ScenarioResult:
+    rng = random.Random(f"{sc.name}")
+    thresholds = THRESHOLDS[sc.thresholds]
+    adapter = ADAPTERS[sc.adapter]()
+    adapter.connect()  # type: ignore[attr-defined]
+    safety: SafetySupervisor = adapter.safety()  # type: ignore[attr-defined]
+    emg = PROFILES[sc.profile](clock, rng, thresholds)
+    controller = SterilizationController(
+        arm=adapter.arm(),  # type: ignore[attr-defined]
+        emg=emg,
+        thresholds=thresholds,
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+        emit_on_change=True,
+        reuse_event=True,
+    )
+    monitor = InvariantMonitor(controller, safety, max_state_dwell_s=sc.max_state_dwell_s)
+    controller.arm = SafeguardedArm(monitor.probe(controller.arm), safety)
+    if isinstance(emg, SyntheticOperator):
+        emg.controller = controller
+
+    result = ScenarioResult(sc.name, ok=True, wall_s=0.0)
+    fault_at = rng.uniform(0.1, 0.7) * sc.duration_s if sc.fault != "none" else float("inf")
+    fault_end = fault_at + rng.uniform(0.5, 10.0)
+    clear_at = fault_end + rng.uniform(2.0, 10.0)
+    if sc.fault != "none":
+        result.fault_at_s = round(fault_at, 3)
+    injected = restored = False
+    dt = 1.0 / max(1.0, sc.loop_hz)
+
+    while clock.now < sc.duration_s:
+        now = clock.now
+        if not injected and now >= fault_at:
+            injected = True
+            if sc.fault == "estop":
+                safety.latch_estop()
+            elif sc.fault == "emg_dropout":
+                controller.emg = StaticEMGSource((0.0, 0.0))
+            else:
+                safety.inputs = replace(safety.inputs, **{_FAULT_INPUT[sc.fault]: False})
+        if injected and not restored and now >= fault_end:
+            restored = True
+            if sc.fault == "emg_dropout":
+                controller.emg = emg
+            elif sc.fault in _FAULT_INPUT:
+                safety.inputs = replace(safety.inputs, **{_FAULT_INPUT[sc.fault]: True})
+        if restored and now >= clear_at and safety._fault_latched and controller.state is State.IDLE:
+            safety.clear_estop(technician_key=True)
+            clear_at = now + 5.0
+
+        try:
+            controller.tick()
+        except SafetyFault:
+            result.tick_faults += 1
+            controller.state = State.ABORT
+        result.ticks += 1
+        monitor.check(clock.now)
+        clock.sleep(dt)
+
+    result.cycle_starts = monitor.cycle_starts
+    result.cycles_completed = monitor.cycles_completed
+    result.cycles_aborted = monitor.cycles_aborted
+    result.violation_counts = dict(monitor.counts)
+    result.violations = [f"{v.t:.2f}s {v.invariant}: {v.detail}" for v in monitor.violations[:5]]
+    result.ok = not monitor.counts
+    return result
+
+
+def run_matrix(
+    scenarios: Sequence[Scenario],
+    *,
+    workers: Optional[int] = None,
+    slowest: int = 5,
+) -> MatrixReport:
+    """Run ``scenarios`` across a process pool (``workers=1`` runs in-process)."""
+    t0 = perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        results = [run_scenario(sc) for sc in scenarios]
+    else:
+        chunk = max(1, len(scenarios) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_scenario, scenarios, chunksize=chunk))
+    report = MatrixReport(
+        total=len(results),
+        failed=[r for r in results if not r.ok],
+        slowest=sorted(results, key=lambda r: r.wall_s, reverse=True)[:slowest],
+        wall_s=perf_counter() - t0,
+        cpu_s=sum(r.wall_s for r in results),
+        cycles_completed=sum(r.cycles_completed for r in results),
+    )
+    LOGGER.info(
+        "Scenario matrix: %d run, %d failed, %.1f s wall (%.1f s CPU)",
+        report.total,
+        len(report.failed),
+        report.wall_s,
+        report.cpu_s,
+    )
+    return report
@@ -0,0 +1,486 @@
+"""
+Long-duration soak runs in virtual time.
+
+``run_soak`` drives a controller, its ``SafetySupervisor``, a
+``SafeguardedArm`` over an in-memory arm and a ``SyntheticOperator`` for a
+day (or more) of virtual time, as fast as the CPU allows. Faults (E-stop,
+light-curtain and drive-power drops, gripper pressure loss, EMG dropout) are
+injected at random with a seeded RNG; a simulated technician clears latched
+faults once the inputs are healthy again. ``InvariantMonitor`` checks the
+run independently of the code under test: no arm motion while interlocks
+block it, duty-cycle envelope respected at every cycle start, every cycle
+ending through HOME or a homing abort, no state held past a dwell limit.
+The ``SoakReport`` also carries memory growth (tracemalloc), throughput
+ceilings hit (duty refusals by reason) and cycles per virtual hour.
+
+The operator works in sessions: once a session nears the duty policy's
+``max_continuous_runtime_s`` they finish the cycle, take a break and start a
+new session, so the cell cycles across the whole run. With
+``session_breaks=False`` the operator never stops and the runtime ceiling
+shuts the cell down for the rest of the run; that is reported as a finding
+(``SoakReport.findings``), not a violation.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field, replace
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.state_machine import State, SterilizationController
+from hardware.arm import ArmInterface, QArmStub
+from hardware.emg import EMGReader
+from hardware.safeguarded_arm import SafeguardedArm
+from safety.interlocks import DutyCyclePolicy, SafetyFault, SafetySupervisor
+
+from .clock import VirtualClock, virtual_time
+
+LOGGER = logging.getLogger("musclemate.soak")
+
+FAULT_KINDS = ("estop", "light_curtain", "drive_power", "gripper_pressure", "emg_dropout")
+
+_FAULT_DURATION_S: Dict[str, Tuple[float, float]] = {
+    "estop": (0.0, 0.0),
+    "light_curtain": (2.0, 20.0),
+    "drive_power": (0.5, 5.0),
+    "gripper_pressure": (1.0, 10.0),
+    "emg_dropout": (5.0, 60.0),
+}
+
+_HIGH = 0.9
+_PATTERN: Dict[State, Tuple[float, float]] = {
+    State.IDLE: (_HIGH, 0.0),  # START
+    State.SELECT_BIN: (0.0, _HIGH),  # GRIP (sometimes START to cycle bins)
+    State.GRIP: (0.0, _HIGH),
+    State.OPEN_AUTOCLAVE: (_HIGH, _HIGH),  # OPEN_DOOR
+    State.PLACE: (0.0, _HIGH),
+    State.CLOSE_AUTOCLAVE: (_HIGH, _HIGH),
+}
+
+
+@dataclass
+class SoakConfig:
+    hours: float = 24.0
+    seed: int = 0
+    loop_hz: float = Sampling().loop_hz
+    faults_per_hour: float = 2.0
+    idle_gap_s: Tuple[float, float] = (2.0, 30.0)
+    think_s: Tuple[float, float] = (0.3, 2.0)
+    abort_prob: float = 0.01
+    technician_response_s: Tuple[float, float] = (20.0, 120.0)
+    max_state_dwell_s: float = 600.0
+    duty: Optional[DutyCyclePolicy] = None
+    session_breaks: bool = True
+    session_fraction: float = 0.9  # of max_continuous_runtime_s before the operator breaks
+    break_s: Tuple[float, float] = (300.0, 900.0)
+    track_memory: bool = True
+
+
+class SyntheticOperator(EMGReader):
+    """
+    EMG source that reacts to the controller like a trained operator.
+
+    Waits a random think time after each state change (a longer idle gap
+    between cycles), then holds the channel pattern for the intent the state
+    needs for ``press_s`` (past debounce, short of cooldown). With
+    ``abort_prob`` it long-presses channel 2 instead (ABORT).
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        rng: random.Random,
+        thresholds: Thresholds,
+        *,
+        think_s: Tuple[float, float] = (0.3, 2.0),
+        idle_gap_s: Tuple[float, float] = (2.0, 30.0),
+        abort_prob: float = 0.01,
+    ) -> None:
+        self.clock = clock
+        self.rng = rng
+        self.think_s = think_s
+        self.idle_gap_s = idle_gap_s
+        self.abort_prob = abort_prob
+        self.press_s = (thresholds.debounce_s + thresholds.cooldown_s) / 2
+        self.longpress_s = thresholds.longpress_s + 0.3
+        self.controller: Optional[SterilizationController] = None
+        self.dropout_until = 0.0
+        self.away_until = 0.0
+        self.aborts = 0
+        self._state: Optional[State] = None
+        self._next_at: Optional[float] = None
+        self._press: Tuple[float, float] = (0.0, 0.0)
+        self._press_until = 0.0
+
+    def read(self) -> Tuple[float, float]:
+        now = self.clock.now
+        if now < self.dropout_until or now < self.away_until:
+            return (0.0, 0.0)
+        if now < self._press_until:
+            return self._press
+        assert self.controller is not None, "bind SyntheticOperator.controller first"
+        state = self.controller.state
+        if state is not self._state or self._next_at is None:
+            self._state = state
+            lo, hi = self.idle_gap_s if state is State.IDLE else self.think_s
+            self._next_at = now + self.rng.uniform(lo, hi)
+        pattern = _PATTERN.get(state)
+        if pattern is None or now < self._next_at:
+            noise = self.rng.uniform(0.0, 0.03)
+            return (noise, noise)
+        self._next_at = None
+        hold = self.press_s
+        if self.rng.random() < self.abort_prob:
+            pattern, hold = (0.0, _HIGH), self.longpress_s
+            self.aborts += 1
+        elif state is State.SELECT_BIN and self.rng.random() < 0.3:
+            pattern = (_HIGH, 0.0)
+        self._press = pattern
+        self._press_until = now + hold
+        return pattern
+
+
+@dataclass
+class Violation:
+    t: float
+    invariant: str
+    detail: str
+
+
+class InvariantMonitor:
+    """
+    Independent checks over a running controller (reusable outside soak).
+
+    Call ``check(now)`` after every tick and route the raw arm through
+    ``probe(arm)`` so commands reaching the hardware are audited.
+    """
+
+    def __init__(
+        self,
+        controller: SterilizationController,
+        safety: SafetySupervisor,
+        *,
+        max_state_dwell_s: float = 600.0,
+        keep: int = 100,
+    ) -> None:
+        self.controller = controller
+        self.safety = safety
+        self.max_state_dwell_s = max_state_dwell_s
+        self.keep = keep
+        self.violations: List[Violation] = []
+        self.counts: Counter = Counter()
+        self.cycle_starts = 0
+        self.cycles_completed = 0
+        self.cycles_aborted = 0
+        self.homes = 0
+        self._homes_seen = 0
+        self._in_cycle = False
+        self._completions: List[float] = []
+        self._state = controller.state
+        self._since: Optional[float] = None
+        self._stuck_reported = False
+        self._now = 0.0
+
+    def probe(self, arm: ArmInterface) -> "_ProbeArm":
+        return _ProbeArm(arm, self)
+
+    def violation(self, invariant: str, detail: str) -> None:
+        self.counts[invariant] += 1
+        if len(self.violations) < self.keep:
+            self.violations.append(Violation(self._now, invariant, detail))
+
+    def check(self, now: float) -> None:
+        self._now = now
+        ctl = self.controller
+        state = ctl.state
+        if self._since is None:
+            self._since = now
+        if state is not self._state:
+            prev, self._state, self._since = self._state, state, now
+            self._stuck_reported = False
+            if prev is State.IDLE and state is State.SELECT_BIN:
+                self._in_cycle = True
+                self._check_cycle_start(now)
+            elif prev is State.HOME and state is State.IDLE:
+                self._in_cycle = False
+                self.cycles_completed += 1
+                self._completions.append(now)
+            elif state is State.IDLE:
+                # Any other way back to IDLE is an abort and must have homed the arm.
+                self.cycles_aborted += self._in_cycle
+                self._in_cycle = False
+                if self.homes == self._homes_seen:
+                    self.violation("cycle_end", f"{prev.name} -> IDLE without homing")
+        elif (
+            state is not State.IDLE
+            and not self._stuck_reported
+            and now - self._since > self.max_state_dwell_s
+        ):
+            self._stuck_reported = True
+            self.violation("liveness", f"{state.name} held for {now - self._since:.0f} s")
+        self._homes_seen = self.homes
+        if not 0 <= ctl.selected_bin < len(ctl.waypoints.bins):
+            self.violation("bounds", f"selected_bin={ctl.selected_bin}")
+
+    def _check_cycle_start(self, now: float) -> None:
+        self.cycle_starts += 1
+        duty = self.safety.duty
+        cutoff = now - 3600.0
+        self._completions = [t for t in self._completions if t >= cutoff]
+        if self._completions and now - self._completions[-1] < duty.min_cycle_gap_s:
+            self.violation("duty_gap", f"cycle started {now - self._completions[-1]:.2f} s after the last")
+        if len(self._completions) >= duty.max_cycles_per_hour:
+            self.violation("duty_rate", f"{len(self._completions)} cycles in the last hour")
+        if now - duty._session_start > duty.max_continuous_runtime_s:
+            self.violation("duty_runtime", f"cycle started {now - duty._session_start:.0f} s into the session")
+
+
+class _ProbeArm:
+    """Forwards to the raw arm, flagging motion that interlocks forbid."""
+
+    def __init__(self, inner: ArmInterface, monitor: InvariantMonitor) -> None:
+        self.inner = inner
+        self.monitor = monitor
+
+    def _audit(self, what: str) -> None:
+        if not self.monitor.safety.motion_allowed():
+            self.monitor.violation("motion_gating", f"{what} while motion is blocked")
+
+    def move_pose(self, x: float, y: float, z: float, **kwargs: Any) -> None:
+        self._audit("move_pose")
+        self.inner.move_pose(x, y, z, **kwargs)
+
+    def open_gripper(self) -> None:
+        self._audit("open_gripper")
+        self.inner.open_gripper()
+
+    def close_gripper(self) -> None:
+        self._audit("close_gripper")
+        self.inner.close_gripper()
+
+    def home(self) -> None:
+        # Homing is the recovery path and is allowed while faulted.
+        self.monitor.homes += 1
+        self.inner.home()
+
+    def read_pose(self) -> Tuple[float, float, float, float, float, float]:
+        return self.inner.read_pose()
+
+
+@dataclass
+class SoakReport:
+    config: Dict[str, Any]
+    virtual_s: float = 0.0
+    wall_s: float = 0.0
+    ticks: int = 0
+    cycle_starts: int = 0
+    cycles_completed: int = 0
+    cycles_per_hour: List[int] = field(default_factory=list)
+    operator_aborts: int = 0
+    faults_injected: Dict[str, int] = field(default_factory=dict)
+    safety_faults: Dict[str, int] = field(default_factory=dict)
+    tick_faults: int = 0
+    refusals: Dict[str, int] = field(default_factory=dict)
+    first_refusal_h: Dict[str, float] = field(default_factory=dict)
+    session_breaks: int = 0
+    findings: List[str] = field(default_factory=list)
+    memory_hourly_kib: List[float] = field(default_factory=list)
+    memory_growth_kib: Optional[float] = None
+    memory_peak_kib: Optional[float] = None
+    memory_top_growth: List[str] = field(default_factory=list)
+    violation_counts: Dict[str, int] = field(default_factory=dict)
+    violations: List[Violation] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.violation_counts
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def run_soak(config: SoakConfig) -> SoakReport:
+    """Run one soak in virtual time and return its report."""
+    if config.track_memory:
+        tracemalloc.start()
+    try:
+        with virtual_time(VirtualClock(0.0)) as clock:
+            return _soak(config, clock)
+    finally:
+        if config.track_memory:
+            tracemalloc.stop()
+
+
+def _soak(config: SoakConfig, clock: VirtualClock) -> SoakReport:
+    rng = random.Random(config.seed)
+    thresholds = Thresholds()
+    duty = DutyCyclePolicy()
+    if config.duty is not None:
+        # Copy the limits only: history and session start belong to virtual time.
+        duty = DutyCyclePolicy(
+            max_cycles_per_hour=config.duty.max_cycles_per_hour,
+            min_cycle_gap_s=config.duty.min_cycle_gap_s,
+            max_continuous_runtime_s=config.duty.max_continuous_runtime_s,
+        )
+    safety = SafetySupervisor(duty=duty)
+    operator = SyntheticOperator(
+        clock,
+        rng,
+        thresholds,
+        think_s=config.think_s,
+        idle_gap_s=config.idle_gap_s,
+        abort_prob=config.abort_prob,
+    )
+    controller = SterilizationController(
+        arm=QArmStub(),  # replaced below once the monitor exists
+        emg=operator,
+        thresholds=thresholds,
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+        emit_on_change=True,
+        reuse_event=True,
+    )
+    monitor = InvariantMonitor(controller, safety, max_state_dwell_s=config.max_state_dwell_s)
+    controller.arm = SafeguardedArm(monitor.probe(QArmStub()), safety)
+    operator.controller = controller
+
+    cfg = asdict(config)
+    cfg["duty"] = asdict(safety.duty)
+    cfg["duty"].pop("_cycle_times")
+    cfg["duty"].pop("_session_start")
+    report = SoakReport(config=cfg)
+    faults: Counter = Counter()
+    refusals: Counter = Counter()
+    dt = 1.0 / max(1.0, config.loop_hz)
+    end = config.hours * 3600.0
+    next_fault = _next_fault_at(rng, 0.0, config.faults_per_hour)
+    restore_at: Optional[float] = None
+    clear_at: Optional[float] = None
+    back_at: Optional[float] = None
+    session_limit = config.session_fraction * duty.max_continuous_runtime_s
+    next_hour = 3600.0
+    hour_cycles = 0
+    warm_snapshot = None
+    wall0 = perf_counter()
+
+    while clock.now < end:
+        now = clock.now
+        if now >= next_fault:
+            kind = rng.choice(FAULT_KINDS)
+            faults[kind] += 1
+            lo, hi = _FAULT_DURATION_S[kind]
+            if kind == "estop":
+                safety.latch_estop()
+            elif kind == "emg_dropout":
+                operator.dropout_until = now + rng.uniform(lo, hi)
+            else:
+                safety.inputs = replace(safety.inputs, **{_INPUT[kind]: False})
+                restore_at = max(restore_at or 0.0, now + rng.uniform(lo, hi))
+            next_fault = _next_fault_at(rng, now, config.faults_per_hour)
+        if restore_at is not None and now >= restore_at:
+            safety.inputs = replace(
+                safety.inputs, light_curtain_clear=True, drive_power_ok=True, gripper_pressure_ok=True
+            )
+            restore_at = None
+        if safety._fault_latched and restore_at is None and controller.state is State.IDLE:
+            if clear_at is None:
+                clear_at = now + rng.uniform(*config.technician_response_s)
+            elif now >= clear_at:
+                safety.clear_estop(technician_key=True)
+                clear_at = None
+        if config.session_breaks and controller.state is State.IDLE:
+            if back_at is None and now - duty._session_start >= session_limit:
+                back_at = now + rng.uniform(*config.break_s)
+                operator.away_until = back_at
+                report.session_breaks += 1
+            elif back_at is not None and now >= back_at:
+                duty.start_session()
+                back_at = None
+
+        prev = controller.state
+        try:
+            controller.tick()
+        except SafetyFault:
+            report.tick_faults += 1
+            controller.state = State.ABORT
+        report.ticks += 1
+        if prev is State.IDLE and controller.state is State.ABORT:
+            reason = safety._last_fault
+            refusals[reason] += 1
+            report.first_refusal_h.setdefault(reason, round(clock.now / 3600.0, 3))
+        monitor.check(clock.now)
+        clock.sleep(dt)
+
+        if clock.now >= next_hour:
+            report.cycles_per_hour.append(monitor.cycles_completed - hour_cycles)
+            hour_cycles = monitor.cycles_completed
+            next_hour += 3600.0
+            if config.track_memory:
+                report.memory_hourly_kib.append(round(tracemalloc.get_traced_memory()[0] / 1024, 1))
+                if warm_snapshot is None:
+                    warm_snapshot = _snapshot()
+
+    report.wall_s = perf_counter() - wall0
+    report.virtual_s = clock.now
+    report.cycle_starts = monitor.cycle_starts
+    report.cycles_completed = monitor.cycles_completed
+    report.operator_aborts = operator.aborts
+    report.faults_injected = dict(faults)
+    report.safety_faults = dict(safety.fault_counts)
+    report.refusals = dict(refusals)
+    report.violation_counts = dict(monitor.counts)
+    report.violations = list(monitor.violations)
+    report.findings = _findings(report)
+    if config.track_memory:
+        current, peak = tracemalloc.get_traced_memory()
+        report.memory_peak_kib = round(peak / 1024, 1)
+        if warm_snapshot is not None:
+            stats = _snapshot().compare_to(warm_snapshot, "lineno")
+            report.memory_growth_kib = round(sum(s.size_diff for s in stats) / 1024, 1)
+            report.memory_top_growth = [str(s) for s in stats[:5] if s.size_diff > 0]
+    LOGGER.info(
+        "Soak: %.1f h virtual in %.1f s, %d cycles, %d violation(s)",
+        report.virtual_s / 3600.0,
+        report.wall_s,
+        report.cycles_completed,
+        sum(report.violation_counts.values()),
+    )
+    return report
+
+
+def _findings(report: SoakReport) -> List[str]:
+    """Throughput problems worth reporting that are not invariant violations."""
+    findings = []
+    idle_hours = [i + 1 for i, n in enumerate(report.cycles_per_hour) if n == 0]
+    if idle_hours:
+        findings.append(f"no cycles completed in {len(idle_hours)} hour(s), from hour {idle_hours[0]}")
+    runtime = "duty cycle: max_continuous_runtime exceeded"
+    if report.refusals.get(runtime):
+        findings.append(
+            f"max_continuous_runtime refused {report.refusals[runtime]} cycle start(s) from "
+            f"{report.first_refusal_h[runtime]:.2f} h; the session only restarts after an operator break"
+        )
+    return findings
+
+
+_INPUT = {
+    "light_curtain": "light_curtain_clear",
+    "drive_power": "drive_power_ok",
+    "gripper_pressure": "gripper_pressure_ok",
+}
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def _next_fault_at(rng: random.Random, now: float, per_hour: float) -> float:
+    if per_hour <= 0:
+        return float("inf")
+    return now + rng.expovariate(per_hour / 3600.0)
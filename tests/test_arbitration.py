@@ -0,0 +1,111 @@
+import pytest
+
+from control.arbitration import DOOR, SLOT, TRANSIT, ResourceArbiter
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import Intent
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+
+
+def test_priority_then_fifo_and_all_or_nothing():
+    arb = ResourceArbiter()
+    assert arb.try_acquire("a", (DOOR, SLOT))
+    assert arb.try_acquire("b", (DOOR,)) is None
+    assert arb.try_acquire("c", (DOOR, SLOT), priority=1) is None
+    arb.release("a")
+    assert arb.try_acquire("b", (DOOR,)) is None
+    assert arb.try_acquire("c", (DOOR, SLOT), priority=1)
+    assert arb.metrics()["owners"]["c"]["contended"] == 1
+
+
+def test_out_of_order_request_rejected():
+    arb = ResourceArbiter()
+    assert arb.try_acquire("a", (TRANSIT,))
+    with pytest.raises(ValueError):
+        arb.try_acquire("a", (DOOR,))
+
+
+def test_expired_lease_is_reclaimed(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("control.arbitration.monotonic", lambda: clock[0])
+    arb = ResourceArbiter(lease_s=5.0)
+    assert arb.try_acquire("crashed", (DOOR,))
+    clock[0] += 6.0
+    assert arb.try_acquire("b", (DOOR,))
+
+
+def _controller(arbiter, cell_id, monkeypatch):
+    ctl = SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        arbiter=arbiter,
+        cell_id=cell_id,
+    )
+    ctl.state = State.OPEN_AUTOCLAVE
+    ctl._last_grip_action_close = True
+    monkeypatch.setattr(ctl.decoder, "intent", lambda: Intent.OPEN_DOOR)
+    return ctl
+
+
+def test_second_arm_waits_for_shared_door(monkeypatch):
+    monkeypatch.setattr("control.state_machine.sleep", lambda s: None)
+    arb = ResourceArbiter()
+    a = _controller(arb, "a", monkeypatch)
+    b = _controller(arb, "b", monkeypatch)
+    a.tick()
+    b.tick()
+    assert a.state == State.PLACE
+    assert b.state == State.OPEN_AUTOCLAVE
+    monkeypatch.setattr(a.decoder, "intent", lambda: Intent.GRIP)
+    a.tick()
+    monkeypatch.setattr(a.decoder, "intent", lambda: Intent.OPEN_DOOR)
+    a.tick()
+    assert a.state == State.HOME
+    b.tick()
+    assert b.state == State.OPEN_AUTOCLAVE  # a is still leaving the autoclave zone
+    a.tick()
+    assert a.state == State.IDLE
+    b.tick()
+    assert b.state == State.PLACE
+    assert arb.holder(DOOR) == "b"
+    assert arb.metrics()["owners"]["b"]["total_wait_s"] > 0
+
+
+def test_slow_pick_keeps_zone_leased_from_a_fast_arm(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("control.arbitration.monotonic", lambda: clock[0])
+    monkeypatch.setattr("control.state_machine.sleep", lambda s: None)
+    arb = ResourceArbiter(lease_s=5.0)
+    intents = {"a": Intent.GRIP, "b": Intent.NONE}
+    slow = _controller(arb, "a", monkeypatch)
+    fast = _controller(arb, "b", monkeypatch)
+    monkeypatch.setattr(slow.decoder, "intent", lambda: intents["a"])
+    monkeypatch.setattr(fast.decoder, "intent", lambda: intents["b"])
+
+    # a is mid-batch: door open and leased, one more bin to fetch.
+    assert arb.try_acquire("a", (DOOR, SLOT))
+    slow.state, slow.door_open, slow._batch_plan = State.PLACE, True, [1]
+    fast.state = State.TRANSIT
+    slow.tick()
+    assert slow.state == State.APPROACH
+
+    # a's operator takes 20 s (4 leases) to grip the next bin; b keeps asking.
+    intents["a"] = Intent.NONE
+    for _ in range(10):
+        clock[0] += 2.0
+        slow.tick()
+        fast.tick()
+        assert fast.state == State.TRANSIT
+        assert fast.arm.pose[:3] != Waypoints().autoclave
+    assert slow.state == State.GRIP
+    assert arb.holder(DOOR) == "a" and arb.holder(SLOT) == "a"
+
+    intents["a"] = Intent.GRIP
+    for _ in range(3):  # GRIP -> LIFT -> TRANSIT -> OPEN_AUTOCLAVE
+        slow.tick()
+    assert slow.state == State.OPEN_AUTOCLAVE
+    assert arb.holder(TRANSIT) is None and fast.state == State.TRANSIT
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from control.async_runner import run_controller_async
+from control.cli import main
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from safety.interlocks import InterlockInputs, SafetySupervisor
+
+
+class AsyncEMG:
+    def __init__(self):
+        self.reads = 0
+
+    async def read(self):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return (0.0, 0.0)
+
+
+class AsyncArm:
+    def __init__(self):
+        self.inner = QArmStub(pose=(1, 1, 1, 0, 0, 0))
+        self.homed = 0
+
+    async def move_pose(self, x, y, z, yaw=0.0, pitch=0.0, roll=0.0, speed=0.5):
+        self.inner.move_pose(x, y, z)
+
+    async def open_gripper(self):
+        self.inner.open_gripper()
+
+    async def close_gripper(self):
+        self.inner.close_gripper()
+
+    async def home(self):
+        self.homed += 1
+        self.inner.home()
+
+    async def read_pose(self):
+        return self.inner.pose
+
+
+def _controller(emg, arm, safety=None):
+    return SterilizationController(
+        arm=arm,
+        emg=emg,
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+    )
+
+
+def test_async_adapters_run_and_home_on_exit():
+    emg, arm, events = AsyncEMG(), AsyncArm(), []
+    ctl = _controller(emg, arm)
+    stats = asyncio.run(
+        run_controller_async(ctl, Sampling(loop_hz=200.0, runtime_s=0.2), event_sink=events)
+    )
+    assert emg.reads > 5
+    assert stats.tasks["control"].runs > 5
+    assert len(events) == stats.tasks["control"].runs - stats.dropped_events
+    assert arm.homed == 1
+    assert ctl.arm is arm
+
+
+def test_safety_monitor_aborts_active_cycle():
+    safety = SafetySupervisor()
+    ctl = _controller(AsyncEMG(), QArmStub(), safety)
+    ctl.state = State.GRIP
+
+    async def scenario():
+        run = asyncio.ensure_future(
+            run_controller_async(ctl, Sampling(loop_hz=200.0, runtime_s=0.3))
+        )
+        await asyncio.sleep(0.05)
+        safety.inputs = InterlockInputs(light_curtain_clear=False)
+        return await run
+
+    stats = asyncio.run(scenario())
+    assert stats.safety_aborts == 1
+    assert ctl.state == State.IDLE
+
+
+def test_cli_rejects_options_the_async_runner_ignores(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--async", "--runtime", "0", "--idle-rate", "5", "--watchdog", "--metrics-port", "0"])
+    assert exc.value.code == 2
+    assert "--idle-rate, --metrics-port, --watchdog not supported with --async" in capsys.readouterr().err
@@ -0,0 +1,57 @@
+from control.batch import plan_picks, route_length
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import Intent
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+
+
+def test_plan_picks_is_travel_optimal():
+    wp = Waypoints()
+    queue = [2, 0, 1, 0]
+    plan = plan_picks(queue, wp.bins, wp.home, wp.autoclave)
+    assert sorted(plan) == sorted(queue)
+    best = min(
+        route_length([queue[i]] + queue[:i] + queue[i + 1 :], wp.bins, wp.home, wp.autoclave)
+        for i in range(len(queue))
+    )
+    assert route_length(plan, wp.bins, wp.home, wp.autoclave) == best
+
+
+def test_batch_cycles_door_once(monkeypatch):
+    monkeypatch.setattr("control.state_machine.sleep", lambda s: None)
+    ctl = SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        batch_mode=True,
+    )
+    script = iter(
+        [Intent.START, Intent.OPEN_DOOR, Intent.START, Intent.OPEN_DOOR, Intent.GRIP]
+    )
+    monkeypatch.setattr(ctl.decoder, "intent", lambda: next(script, Intent.NONE))
+    for _ in range(5):
+        ctl.tick()
+    assert ctl.batch_pending == (1,)
+    placed = 0
+    for _ in range(40):
+        state = ctl.state
+        intent = {
+            State.GRIP: Intent.GRIP,
+            State.OPEN_AUTOCLAVE: Intent.OPEN_DOOR,
+            State.PLACE: Intent.GRIP,
+            State.CLOSE_AUTOCLAVE: Intent.OPEN_DOOR,
+        }.get(state, Intent.NONE)
+        monkeypatch.setattr(ctl.decoder, "intent", lambda i=intent: i)
+        ctl.tick()
+        placed += state == State.PLACE and ctl.state != State.PLACE
+        if ctl.state == State.IDLE:
+            break
+    assert placed == 2
+    (report,) = ctl.batch_reports
+    assert sorted(report.bins) == [0, 1]
+    assert report.picks == 2
+    assert report.door_cycles == 1
+    assert not ctl.door_open
@@ -0,0 +1,58 @@
+import pytest
+
+from hardware.capture import CaptureEMGSource, CaptureReader, CaptureWriter
+
+
+def _write(path, n=10, chunk=4):
+    with CaptureWriter(path, 1000.0, chunk_samples=chunk, calibration={"rest_mean": [0.02, 0.03]}) as w:
+        for i in range(n):
+            w.append(float(i), float(-i))
+
+
+def test_roundtrip_zero_copy_within_chunk(tmp_path):
+    path = tmp_path / "emg.mmcap"
+    _write(path)
+    with CaptureReader(path) as r:
+        assert (r.total_samples, r.channels, len(r.index)) == (10, 2, 3)
+        assert r.calibration == {"rest_mean": [0.02, 0.03]}
+        inside = r.read(0, 4, 7)
+        assert isinstance(inside, memoryview)
+        assert list(inside) == [4.0, 5.0, 6.0]
+        assert list(r.read(1, 2, 9)) == [-float(i) for i in range(2, 9)]
+        del inside
+
+
+def test_emg_source_strides_through_capture(tmp_path):
+    path = tmp_path / "emg.mmcap"
+    _write(path)
+    with CaptureReader(path) as r:
+        src = CaptureEMGSource(r, stride=3)
+        assert [src.read()[0] for _ in range(5)] == [0.0, 3.0, 6.0, 9.0, 9.0]
+
+
+def test_unclosed_capture_rejected(tmp_path):
+    path = tmp_path / "emg.mmcap"
+    w = CaptureWriter(path, 1000.0)
+    w.append(1.0, 2.0)
+    w._fh.flush()
+    with pytest.raises(ValueError):
+        CaptureReader(path)
+    w.close()
+
+
+def test_append_rejects_wrong_channel_count(tmp_path):
+    with CaptureWriter(tmp_path / "emg.mmcap", 1000.0) as w:
+        w.append(1.0, 2.0)
+        for values in ((1.0,), (1.0, 2.0, 3.0)):
+            with pytest.raises(ValueError):
+                w.append(*values)
+    with CaptureReader(tmp_path / "emg.mmcap") as r:
+        assert r.total_samples == 1
+
+
+def test_numpy_memmap_slices(tmp_path):
+    np = pytest.importorskip("numpy")
+    path = tmp_path / "emg.mmcap"
+    _write(path)
+    with CaptureReader(path) as r:
+        assert np.allclose(r.numpy(0, 1, 9), np.arange(1, 9))
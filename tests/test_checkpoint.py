@@ -0,0 +1,101 @@
+import pytest
+
+from control.checkpoint import Checkpointer, capture, load_checkpoint, restore
+from control.config import Speeds, Thresholds, Waypoints
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import SafetySupervisor
+
+
+def _controller(safety):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(grip_time_s=0.0),
+        safety=safety,
+    )
+
+
+def test_crash_resume_restores_cycle_and_duty(tmp_path):
+    path = tmp_path / "ckpt.json"
+    safety = SafetySupervisor()
+    safety.duty.record_cycle_complete()
+    ctl = _controller(safety)
+    ctl.state = State.GRIP
+    ctl.selected_bin = 2
+    ckpt = Checkpointer(path, interval_s=60.0).start()
+    ckpt.offer(ctl)
+    ckpt.close()
+
+    fresh = _controller(SafetySupervisor())
+    assert restore(fresh, load_checkpoint(path)) == State.APPROACH
+    assert fresh.selected_bin == 2
+    assert len(fresh.safety.duty._cycle_times) == 1
+    assert not fresh.safety.duty.allow_new_cycle()[0]
+
+
+def test_carried_instrument_is_regripped():
+    ctl = _controller(SafetySupervisor())
+    ctl.state = State.TRANSIT
+    ctl._last_grip_action_close = True
+    fresh = _controller(SafetySupervisor())
+    assert restore(fresh, capture(ctl)) == State.TRANSIT
+    assert fresh.arm.gripper_closed
+
+
+def test_latched_fault_resumes_through_abort():
+    safety = SafetySupervisor()
+    ctl = _controller(safety)
+    ctl.state = State.TRANSIT
+    ctl._last_grip_action_close = True
+    safety.latch_estop()
+    fresh = _controller(SafetySupervisor())
+    assert restore(fresh, capture(ctl)) == State.ABORT
+    assert not fresh.safety.motion_allowed()
+    assert not fresh.arm.gripper_closed
+
+
+def test_clean_shutdown_resumes_idle(tmp_path):
+    path = tmp_path / "ckpt.json"
+    ctl = _controller(SafetySupervisor())
+    ctl.state = State.PLACE
+    Checkpointer(path).start().close(ctl)
+    fresh = _controller(SafetySupervisor())
+    assert restore(fresh, load_checkpoint(path)) == State.IDLE
+
+
+def test_downtime_is_a_break_and_idle_resume_drops_the_batch():
+    safety = SafetySupervisor()
+    ctl = _controller(safety)
+    ctl._batch_plan, ctl._batch_queue, ctl.door_open = [1, 2], [0, 1, 2], True
+    snap = capture(ctl, clean_shutdown=True)
+    snap["safety"]["session_age_s"] = 40 * 60.0
+    snap["wall_ts"] -= 25 * 60.0
+    fresh = _controller(SafetySupervisor())
+    assert restore(fresh, snap) == State.IDLE
+    assert fresh.safety.duty.allow_new_cycle() == (True, "ok")
+    assert (fresh._batch_plan, fresh._batch_queue, fresh.door_open) == ([], [], False)
+
+
+def test_only_a_completed_run_checkpoints_clean(tmp_path, monkeypatch):
+    import control.runner
+    from control.cli import main
+    from safety.interlocks import SafetyFault
+
+    path = tmp_path / "ckpt.json"
+    assert main(["--checkpoint", str(path), "--runtime", "0.05"]) == 0
+    assert load_checkpoint(path)["clean_shutdown"]
+
+    def fail(controller, *args, **kwargs):
+        controller.state = State.TRANSIT
+        kwargs["checkpointer"].offer(controller)
+        raise SafetyFault("interlock block: state:TRANSIT")
+
+    monkeypatch.setattr(control.runner, "run_controller", fail)
+    with pytest.raises(SafetyFault):
+        main(["--checkpoint", str(path), "--runtime", "0.05"])
+    snap = load_checkpoint(path)
+    assert not snap["clean_shutdown"] and snap["controller"]["state"] == "TRANSIT"
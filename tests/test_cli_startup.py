@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Agreed budget for CLI startup (import + parse + controller + services), excluding interpreter start.
+BUDGET_S = 0.5
+LAZY = ("hardware.adapters", "hardware.safeguarded_arm", "sim", "control.state_machine", "control.trace", "asyncio")
+
+
+def _python(*args):
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60)
+
+
+def test_importing_cli_stays_lazy():
+    code = f"import sys, control.cli; print([m for m in {LAZY!r} if m in sys.modules])"
+    result = _python("-c", code)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_cold_start_within_budget():
+    result = _python("-m", "control.cli", "--runtime", "0", "--startup-report", "--log-level", "ERROR")
+    assert result.returncode == 0, result.stderr
+    total = next(line for line in result.stderr.splitlines() if line.startswith("total"))
+    assert float(total.split()[1]) / 1e3 < BUDGET_S
+
+
+def test_startup_report_includes_the_cli_import():
+    result = _python("-m", "control.cli", "--runtime", "0", "--startup-report", "--log-level", "ERROR")
+    assert result.returncode == 0, result.stderr
+    rows = {line.split()[0]: line.split() for line in result.stderr.splitlines() if line.strip()}
+    assert int(rows["import"][2]) > 0  # argparse, logging, control.config, ...
+    phases = sum(float(rows[name][1]) for name in ("import", "parse", "controller", "services"))
+    assert abs(phases - float(rows["total"][1])) < 0.5
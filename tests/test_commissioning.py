@@ -0,0 +1,156 @@
+import json
+import threading
+
+import pytest
+
+from hardware.adapters import IntegrationRigAdapter
+from hardware.commissioning import (
+    CHECKS,
+    Check,
+    CommissioningError,
+    CommissioningRunner,
+    load_checklist,
+    parse_checklist,
+    verify_report,
+)
+
+KEY = b"test-signoff-key"
+
+
+@pytest.fixture(autouse=True)
+def signoff_key(monkeypatch):
+    monkeypatch.setenv("MUSCLEMATE_SIGNOFF_KEY", KEY.decode())
+
+
+@pytest.fixture
+def rig(tmp_path):
+    path = tmp_path / "bench_rig.yaml"
+    path.write_text('rig_id: BENCH-A\nserial: "SN-1"\nwiring_revision: "C"\n', encoding="utf-8")
+    return path
+
+
+def test_checklist_parses_and_maps_to_checks():
+    checklist = load_checklist()
+    ids = [c["id"] for c in checklist["checks"]]
+    assert ids == ["PWR-01", "ESTOP-01", "IO-01", "MOT-01", "SEQ-01", "DOC-01"]
+    assert all(c["required"] is True for c in checklist["checks"])
+    assert checklist["signoff"]["field"] == "signoff_id"
+    assert set(CHECKS) == set(ids) - {"DOC-01"}
+    assert parse_checklist('a: "1"  # note\nb:\n  c: false\n') == {"a": "1", "b": {"c": False}}
+
+
+def test_runner_caches_passes_and_report_verifies(tmp_path, rig):
+    handoff = tmp_path / "handoff.md"
+    first = CommissioningRunner(cache_dir=tmp_path, rig_file=rig, handoff=handoff)
+    report = first.report("tester")
+    assert sorted(first.ran) == sorted(CHECKS)
+    assert not report["passed"] and report["signoff_id"].endswith("-TESTER")
+    assert [c["id"] for c in report["checks"] if c["status"] != "pass"] == ["DOC-01"]
+    with pytest.raises(CommissioningError, match="DOC-01"):
+        verify_report(report)
+
+    handoff.write_text(f"| signoff_id | {report['signoff_id']} |\n", encoding="utf-8")
+    second = CommissioningRunner(cache_dir=tmp_path, rig_file=rig, handoff=handoff)
+    again = second.report("tester")
+    assert second.ran == [] and again["passed"]
+    assert all(c["cached"] for c in again["checks"] if c["id"] in CHECKS)
+
+    path = tmp_path / "signoff.json"
+    path.write_text(json.dumps(again), encoding="utf-8")
+    adapter = IntegrationRigAdapter()
+    adapter.set_bench_signoff(again["signoff_id"], path)
+    adapter.connect()
+    assert adapter.commissioning_report()["bench_signoff_verified"]
+
+
+def test_tampered_or_mismatched_report_is_refused(tmp_path):
+    report = CommissioningRunner(cache_dir=tmp_path).report("tester")
+    adapter = IntegrationRigAdapter()
+    with pytest.raises(CommissioningError, match="not"):
+        adapter.set_bench_signoff("BENCH-OTHER", report)
+    tampered = dict(report, checks=[dict(c, status="fail") for c in report["checks"]])
+    with pytest.raises(CommissioningError, match="signature"):
+        adapter.set_bench_signoff(report["signoff_id"], tampered)
+    with pytest.raises(CommissioningError, match="signature"):
+        verify_report(report, key=b"other-key")
+    with pytest.raises(RuntimeError):
+        adapter.connect()  # nothing was recorded
+
+
+def test_only_invalidated_or_failed_checks_rerun(tmp_path, rig):
+    data = tmp_path / "limits.txt"
+    data.write_text("v1", encoding="utf-8")
+    calls = []
+
+    def ok(adapter):
+        calls.append("ok")
+        return {}
+
+    def bad(adapter):
+        calls.append("bad")
+        raise CommissioningError("input stuck")
+
+    checklist = {"checks": [{"id": "A-01", "required": True}, {"id": "B-01", "required": True}]}
+    checks = {"A-01": Check("A-01", ok, files=lambda: [data]), "B-01": Check("B-01", bad)}
+    runner = CommissioningRunner(checklist, checks=checks, cache_dir=tmp_path / "cache", rig_file=rig)
+    report = runner.report()
+    assert not report["passed"]
+    with pytest.raises(CommissioningError, match="B-01"):
+        verify_report(report)
+
+    runner = CommissioningRunner(checklist, checks=checks, cache_dir=tmp_path / "cache", rig_file=rig)
+    runner.run()
+    assert runner.ran == ["B-01"]  # failures are never cached
+    data.write_text("v2", encoding="utf-8")
+    runner.run()
+    assert sorted(runner.ran) == ["A-01", "B-01"]
+    assert (calls.count("ok"), calls.count("bad")) == (2, 3)
+
+
+def test_independent_checks_run_concurrently(tmp_path):
+    barrier = threading.Barrier(3, timeout=5.0)
+
+    def meet(adapter):
+        barrier.wait()  # raises BrokenBarrierError if the checks ran one at a time
+        return {}
+
+    checks = {cid: Check(cid, meet) for cid in ("X-01", "X-02", "X-03")}
+    checklist = {"checks": [{"id": cid, "required": True} for cid in checks]}
+    results = CommissioningRunner(checklist, checks=checks, use_cache=False, cache_dir=tmp_path).run()
+    assert [r.status for r in results] == ["pass"] * 3
+
+
+def test_cache_is_per_rig_authenticated_and_expires(tmp_path, rig):
+    def make(**kwargs):
+        return CommissioningRunner(cache_dir=tmp_path, rig_file=kwargs.pop("rig_file", rig), **kwargs)
+
+    make().run()
+    runner = make()
+    runner.run()
+    assert runner.ran == []  # warm
+
+    other = tmp_path / "other_rig.yaml"
+    other.write_text(rig.read_text().replace("BENCH-A", "BENCH-B"), encoding="utf-8")
+    runner = make(rig_file=other)
+    runner.run()
+    assert sorted(runner.ran) == sorted(CHECKS)
+
+    unassigned = tmp_path / "unassigned.yaml"
+    unassigned.write_text("rig_id: UNASSIGNED\n", encoding="utf-8")
+    for _ in range(2):
+        runner = make(rig_file=unassigned)
+        runner.run()
+        assert sorted(runner.ran) == sorted(CHECKS)
+
+    cache = tmp_path / "commissioning.json"
+    entries = json.loads(cache.read_text())
+    for entry in entries.values():
+        entry["detail"] = {"forged": True}
+    cache.write_text(json.dumps(entries))
+    runner = make()
+    runner.run()
+    assert sorted(runner.ran) == sorted(CHECKS)
+
+    runner = make(max_age_s=-1.0)
+    runner.run()
+    assert sorted(runner.ran) == sorted(CHECKS)
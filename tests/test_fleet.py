@@ -0,0 +1,88 @@
+import pytest
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.fleet import Cell, FleetRunner
+from control.state_machine import SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import SafetySupervisor
+
+
+class BrokenEMG:
+    def read(self):
+        raise IOError("amplifier disconnected")
+
+
+def _controller(emg, safety=None):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=emg,
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+    )
+
+
+def test_faulted_cell_is_isolated():
+    safety = SafetySupervisor()
+    events = []
+    cells = [
+        Cell("good", _controller(StaticEMGSource()), loop_hz=100.0, event_sink=events),
+        Cell("bad", _controller(BrokenEMG(), safety), loop_hz=100.0),
+    ]
+    metrics = FleetRunner(cells).run(0.3)
+    assert metrics["faulted"] == ["bad"]
+    assert metrics["per_cell"]["bad"]["ticks"] == 1
+    assert metrics["per_cell"]["good"]["ticks"] >= 10
+    assert len(events) == metrics["per_cell"]["good"]["ticks"]
+    assert not safety.motion_allowed()
+
+
+def test_dozens_of_cells_share_one_scheduler():
+    cells = [
+        Cell(f"cell-{i}", _controller(StaticEMGSource()), loop_hz=20.0 + i)
+        for i in range(30)
+    ]
+    metrics = FleetRunner(cells, workers=4).run(0.5)
+    assert metrics["errors"] == 0
+    assert all(c["ticks"] >= 5 for c in metrics["per_cell"].values())
+
+
+def test_interrupted_fleet_still_homes_every_arm(monkeypatch):
+    cells = [Cell(f"cell-{i}", _controller(StaticEMGSource()), loop_hz=50.0) for i in range(3)]
+    for cell in cells:
+        cell.controller.arm.move_pose(0.3, 0.1, 0.2)
+    runner = FleetRunner(cells)
+
+    def interrupt(timeout=None):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(runner._stop, "wait", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        runner.run(5.0)
+    assert all(c.controller.arm.pose == QArmStub().pose for c in cells)
+
+
+def test_cli_rejects_options_the_fleet_ignores(capsys):
+    from control.cli import main
+
+    with pytest.raises(SystemExit) as exc:
+        main(["--cells", "2", "--runtime", "0", "--watchdog", "--record", "x.jsonl"])
+    assert exc.value.code == 2
+    assert "--record, --watchdog not supported with --cells > 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--idle-rate", "5", "--checkpoint", "c.json", "--resume"], "--idle-rate, --checkpoint, --resume"),
+        (["--resume"], "--resume requires --checkpoint"),
+    ],
+)
+def test_cli_rejects_idle_rate_and_resume_for_fleets(capsys, argv, message):
+    from control.cli import main
+
+    with pytest.raises(SystemExit):
+        main(["--cells", "2", "--runtime", "0"] + argv)
+    assert message in capsys.readouterr().err
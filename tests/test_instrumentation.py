@@ -0,0 +1,49 @@
+import json
+
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.instrumentation import TickProfiler
+from control.runner import run_controller
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+
+
+def _controller(**kwargs):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        **kwargs,
+    )
+
+
+def test_profiler_times_each_tick_stage(tmp_path):
+    prof = TickProfiler()
+    ctl = _controller(profiler=prof)
+    ctl.state = State.APPROACH
+    ctl.tick()
+    ctl.tick()
+    stats = prof.snapshot()
+    assert stats["tick"]["count"] == 2
+    assert stats["emg_read"]["count"] == stats["decode"]["count"] == stats["fsm"]["count"] == 2
+    assert stats["arm"]["count"] == 1
+    assert stats["tick"]["max_us"] >= stats["fsm"]["max_us"]
+    assert sum(stats["tick"]["histogram_log2_us"]) == 2
+
+    out = tmp_path / "profile.json"
+    prof.dump(out)
+    assert json.loads(out.read_text())["stages"]["tick"]["count"] == 2
+
+
+def test_sampling_and_sink_stage():
+    prof = TickProfiler(sample_every=4)
+    ctl = _controller(profiler=prof)
+    events = []
+    run_controller(ctl, Sampling(loop_hz=1000, runtime_s=0.05), event_sink=events)
+    stats = prof.snapshot()
+    assert 0 < stats["tick"]["count"] <= len(events) // 4 + 1
+    assert stats["sink"]["count"] == stats["tick"]["count"]
+    prof.reset()
+    assert prof.snapshot() == {}
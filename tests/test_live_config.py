@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.live_config import ConfigWatcher, parse_config
+from control.state_machine import State, SterilizationController
+from control.trace import TraceWriter
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+
+
+def _controller():
+    return SterilizationController(
+        arm=QArmStub(), emg=StaticEMGSource(), thresholds=Thresholds(), waypoints=Waypoints(), speeds=Speeds()
+    )
+
+
+def test_parse_config_overlays_and_validates():
+    update = parse_config(
+        {"thresholds": {"emg_on": 0.7}, "waypoints": {"bins": [[0.3, 0.1, 0.08]]}}, Thresholds(), Speeds(), Waypoints()
+    )
+    assert update.thresholds.emg_on == 0.7 and update.thresholds.emg_off == Thresholds().emg_off
+    assert update.waypoints.bins == ((0.3, 0.1, 0.08),)
+    assert update.changes == {"thresholds": {"emg_on": 0.7}, "waypoints": {"bins": ((0.3, 0.1, 0.08),)}}
+    for bad in (
+        {"thresholds": {"emg_off": 0.8}},
+        {"thresholds": {"emg_onn": 0.7}},
+        {"speeds": {"move": 1.5}},
+        {"waypoints": {"home": [0.1, 0.2]}},
+        {"sampling": {}},
+    ):
+        with pytest.raises(ValueError):
+            parse_config(bad, Thresholds(), Speeds(), Waypoints())
+
+
+def test_update_waits_for_safe_state_and_is_traced(tmp_path):
+    cfg = tmp_path / "live.json"
+    trace_path = tmp_path / "trace.jsonl"
+    trace = TraceWriter(trace_path)
+    ctl = _controller()
+    watcher = ConfigWatcher(cfg, trace=trace)
+
+    cfg.write_text(json.dumps({"thresholds": {"emg_on": 0.72, "debounce_s": 0.2}, "speeds": {"move": 0.5}}))
+    assert watcher.poll() is not None and watcher.poll() is None
+    ctl.state = State.TRANSIT
+    assert watcher.apply(ctl) is None and watcher.pending is not None
+    assert ctl.decoder.thresholds.emg_on == Thresholds().emg_on
+
+    ctl.state = State.SELECT_BIN
+    update = watcher.apply(ctl)
+    assert update is not None and watcher.pending is None
+    assert ctl.decoder.thresholds is ctl.thresholds and ctl.thresholds.emg_on == 0.72
+    assert ctl.speeds.move == 0.5
+
+    cfg.write_text("{not json")
+    assert watcher.poll() is None and len(watcher.rejected) == 1
+    assert ctl.thresholds.emg_on == 0.72
+    trace.close()
+    rows = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert [r["type"] for r in rows] == ["config", "config_rejected"]
+    assert rows[0]["payload"]["state"] == "SELECT_BIN"
+    assert rows[0]["payload"]["changes"]["thresholds"] == {"emg_on": 0.72, "debounce_s": 0.2}
+
+
+def test_waypoint_changes_need_idle():
+    ctl = _controller()
+    wp = Waypoints(bins=((0.3, 0.1, 0.08),))
+    ctl.state = State.SELECT_BIN
+    ctl.selected_bin = 2
+    assert not ctl.apply_config(waypoints=wp)
+    ctl.state = State.IDLE
+    assert ctl.apply_config(waypoints=wp) and ctl.selected_bin == 0
@@ -0,0 +1,61 @@
+import urllib.request
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import Intent
+from control.metrics import ControllerMetrics, MetricsServer
+from control.state_machine import State, SterilizationController
+from control.trace import TraceWriter
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import SafetySupervisor
+
+
+def _controller(**kwargs):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        **kwargs,
+    )
+
+
+def test_metrics_count_ticks_intents_cycles_and_faults(monkeypatch):
+    ctl = _controller(safety=SafetySupervisor(), emit_on_change=True)
+    metrics = ControllerMetrics(ctl)
+    ctl.state = State.HOME
+    metrics._state = State.HOME
+    metrics.observe(ctl.tick(), 0.0002)
+    metrics.observe(ctl.tick(), 0.002)
+    monkeypatch.setattr(ctl.decoder, "intent", lambda: Intent.ABORT)
+    metrics.observe(ctl.tick(), 0.2)
+
+    text = metrics.render()
+    assert "musclemate_ticks_total 3" in text
+    assert 'musclemate_tick_latency_seconds_bucket{le="0.00025"} 1' in text
+    assert 'musclemate_tick_latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'musclemate_tick_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'musclemate_intents_total{intent="NONE"} 2' in text
+    assert 'musclemate_intents_total{intent="ABORT"} 1' in text
+    assert "musclemate_cycles_completed_total 1" in text
+    assert 'musclemate_safety_faults_total{kind="estop"} 1' in text
+    assert 'musclemate_state{state="IDLE"} 1' in text
+
+
+def test_server_serves_metrics_and_trace_depth(tmp_path):
+    trace = TraceWriter(tmp_path / "t.jsonl", background=True)
+    ctl = _controller()
+    metrics = ControllerMetrics(ctl, trace=trace)
+    server = MetricsServer(metrics, port=0).start()
+    try:
+        metrics.observe(ctl.tick(), 0.001)
+        trace.emit("tick", ctl._last_event)
+        url = f"http://127.0.0.1:{server.port}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+    finally:
+        server.close()
+        trace.close()
+    assert "musclemate_ticks_total 1" in body
+    assert "musclemate_trace_queue_depth" in body
+    assert (tmp_path / "t.jsonl").read_text().count("\n") == 1
@@ -0,0 +1,79 @@
+import json
+
+from hardware.arm import QArmStub
+from hardware.motion_log import JsonlMotionSink, MotionLog
+from hardware.safeguarded_arm import SafeguardedArm
+from safety.interlocks import SafetySupervisor
+
+
+def test_ring_overwrites_oldest_and_counts_drops():
+    log = MotionLog(capacity=3)
+    for i in range(5):
+        log.record_move(float(i), 0.0, 0.0, 0.0, 0.0, 0.0, 0.5)
+    assert len(log) == 3
+    assert log.dropped == 2
+    assert [r.target[0] for r in log] == [2.0, 3.0, 4.0]
+
+
+def test_spill_streams_full_ring_to_sink():
+    batches = []
+    log = MotionLog(capacity=2, spill=batches.append)
+    for kind in ("home", "open_gripper", "close_gripper"):
+        log.append(kind)
+    assert [len(b) for b in batches] == [2]
+    assert [r.kind for r in log] == ["close_gripper"]
+    assert log.dropped == 0
+
+
+def test_safeguarded_arm_exports_jsonl(tmp_path):
+    arm = SafeguardedArm(QArmStub(), SafetySupervisor())
+    arm.move_pose(0.3, 0.1, 0.2, speed=2.0)
+    arm.close_gripper()
+    arm.home()
+    sink = JsonlMotionSink(tmp_path / "motion.jsonl")
+    assert arm.motion_log.export(sink, batch_size=2) == 3
+    sink.close()
+    rows = [json.loads(line) for line in (tmp_path / "motion.jsonl").read_text().splitlines()]
+    assert [r["kind"] for r in rows] == ["move_pose", "close_gripper", "home"]
+    assert rows[0]["speed"] == arm.max_speed
+    assert len(arm.motion_log) == 0
+
+
+def test_failed_export_keeps_records():
+    log = MotionLog(capacity=4)
+    log.append("home")
+    log.append("open_gripper")
+
+    def broken(batch):
+        raise OSError("disk full")
+
+    try:
+        log.export(broken)
+    except OSError:
+        pass
+    assert len(log) == 2
+    batches = []
+    assert log.export(batches.append) == 2
+    assert [r.kind for r in batches[0]] == ["home", "open_gripper"]
+
+
+def test_failing_spill_drops_oldest_instead_of_blocking_the_move():
+    def broken(batch):
+        raise OSError("disk full")
+
+    arm = SafeguardedArm(QArmStub(), SafetySupervisor(), motion_log=MotionLog(capacity=2, spill=broken))
+    for x in (0.1, 0.2, 0.3):
+        arm.move_pose(x, 0.0, 0.2)
+    assert arm.inner.pose[0] == 0.3
+    log = arm.motion_log
+    assert (log.spill_failures, log.dropped, log.total) == (1, 1, 3)
+    assert [r.target[0] for r in log] == [0.2, 0.3]
+
+
+def test_cli_streams_motion_log_to_jsonl(tmp_path):
+    from control.cli import main
+
+    path = tmp_path / "motion.jsonl"
+    assert main(["--demo", "--runtime", "0.05", "--motion-log", str(path)]) == 0
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows and rows[-1]["kind"] == "home"
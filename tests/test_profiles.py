@@ -0,0 +1,81 @@
+import random
+from time import perf_counter
+
+import pytest
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import Intent
+from control.profiles import ProfileStore, calibrate_from_capture, calibrate_rest, switch_operator
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.capture import CaptureReader, CaptureWriter
+from hardware.emg import StaticEMGSource
+from sim import VirtualClock, virtual_time
+
+
+def _rest(mean, n=2000, seed=0):
+    rng = random.Random(seed)
+    return [[abs(rng.gauss(mean, 0.03)) for _ in range(n)], [abs(rng.gauss(0.02, 0.02)) for _ in range(n)]]
+
+
+def _controller():
+    return SterilizationController(
+        arm=QArmStub(), emg=StaticEMGSource(), thresholds=Thresholds(), waypoints=Waypoints(), speeds=Speeds()
+    )
+
+
+def test_rest_calibration_sets_baseline_and_thresholds():
+    profile = calibrate_rest("op-1", _rest(0.25))
+    assert abs(profile.baseline_mean[0] - 0.25) < 0.01
+    th = profile.thresholds
+    assert 0.5 < th.emg_on < 0.65 and th.emg_off == pytest.approx(th.emg_on / 2)
+
+    ctl = _controller()
+    assert ctl.switch_operator(profile)
+    with virtual_time(VirtualClock(0.0)) as clock:
+        intents = []
+        for sample in [(0.27, 0.02)] * 50 + [(0.25 + th.emg_on + 0.1, 0.02)] * 20:
+            ctl.decoder.update(*sample)
+            intents.append(ctl.decoder.intent())
+            clock.sleep(0.02)
+    assert Intent.START not in intents[:50] and Intent.START in intents[50:]
+
+
+def test_store_round_trip_and_lru(tmp_path):
+    store = ProfileStore(tmp_path, capacity=2)
+    for i in range(3):
+        store.put(calibrate_rest(f"op-{i}", _rest(0.1, n=200, seed=i)))
+    assert store.ids() == ["op-0", "op-1", "op-2"]
+    assert list(store._cache) == ["op-1", "op-2"]
+    assert store.get("op-2") is store.get("op-2") and store.hits == 2
+    fresh = ProfileStore(tmp_path)
+    assert fresh.get("op-0") == store.get("op-0") and fresh.misses == 1
+    with pytest.raises(KeyError):
+        store.get("nobody")
+    with pytest.raises(ValueError):
+        store.get("../etc/passwd")
+
+
+def test_switch_is_fast_and_refused_mid_cycle(tmp_path):
+    store = ProfileStore(tmp_path)
+    store.put(calibrate_rest("day", _rest(0.05)))
+    store.put(calibrate_rest("night", _rest(0.3)))
+    ctl = _controller()
+    ctl.state = State.TRANSIT
+    assert switch_operator(ctl, store, "night") is None and ctl.operator_id == ""
+
+    ctl.state = State.IDLE
+    t0 = perf_counter()
+    profile = switch_operator(ctl, store, "night")
+    assert perf_counter() - t0 < 0.1
+    assert ctl.operator_id == "night" and ctl.decoder.offsets == profile.baseline_mean
+    assert ctl.thresholds is profile.thresholds
+
+
+def test_calibrate_from_rest_capture(tmp_path):
+    path = tmp_path / "rest.mmcap"
+    with CaptureWriter(path, 1000.0, chunk_samples=512) as writer:
+        writer.append_block(_rest(0.15, n=1000))
+    with CaptureReader(path) as reader:
+        profile = calibrate_from_capture("op-cap", reader)
+    assert profile.rest_samples == 1000 and abs(profile.baseline_mean[0] - 0.15) < 0.01
@@ -0,0 +1,94 @@
+import gc
+
+import pytest
+
+from control.cli import main
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.realtime import RealtimeMode
+from control.runner import run_controller
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from sim import VirtualClock, scripted_cycle, virtual_time
+
+
+def _controller(emg):
+    return SterilizationController(
+        arm=QArmStub(), emg=emg, thresholds=Thresholds(), waypoints=Waypoints(), speeds=Speeds()
+    )
+
+
+def test_realtime_mode_disables_gc_and_restores_it():
+    assert gc.isenabled()
+    ctl = _controller(StaticEMGSource())
+    with RealtimeMode(ctl) as rt:
+        assert not gc.isenabled()
+        assert ctl.reuse_event
+        assert rt.stats.frozen > 0
+    assert gc.isenabled() and gc.get_freeze_count() == 0
+
+
+def test_idle_ticks_are_allocation_free():
+    with virtual_time(VirtualClock(0.0)):
+        ctl = _controller(StaticEMGSource())
+        with RealtimeMode(ctl, track_allocations=True) as rt:
+            for _ in range(50):  # warm up caches and the reused event
+                ctl.tick()
+            rt.stats.alloc_ticks = 0
+            for _ in range(500):
+                rt.begin_tick()
+                ctl.tick()
+                rt.end_tick()
+    # Allocator free-list growth can show up as a stray block; steady state is zero.
+    assert rt.stats.alloc_blocks_mean < 0.01
+
+
+def _cyclic_garbage(n):
+    for _ in range(n):
+        a = []
+        a.append(a)
+
+
+def test_collections_only_happen_between_cycles():
+    ctl = _controller(StaticEMGSource())
+    with RealtimeMode(ctl, idle_gen0=100, force_gen0=100_000) as rt:
+        ctl.state = State.TRANSIT
+        _cyclic_garbage(500)
+        rt.end_tick()
+        assert rt.stats.idle_collections == 0 and gc.get_count()[0] >= 500
+
+        ctl.state = State.IDLE
+        rt.end_tick()
+        assert rt.stats.idle_collections == 1 and rt.stats.collected >= 500
+        assert gc.get_count()[0] < 100
+
+
+def test_runner_reports_ticks_to_realtime_mode():
+    with virtual_time(VirtualClock(0.0)):
+        ctl = _controller(scripted_cycle())
+        with RealtimeMode(ctl, track_allocations=True) as rt:
+            loop = run_controller(ctl, Sampling(loop_hz=50, runtime_s=10), realtime=rt)
+    assert rt.stats.ticks == loop.ticks > 0
+    assert rt.stats.forced_collections == 0
+
+
+def test_promoted_garbage_gets_a_full_collection_in_idle():
+    ctl = _controller(StaticEMGSource())
+    with RealtimeMode(ctl, idle_gen0=0, full_after=3) as rt:
+        ctl.state = State.IDLE
+        for _ in range(3):
+            _cyclic_garbage(10)
+            rt.end_tick()
+        assert rt.stats.idle_collections == 3 and rt.stats.full_collections == 0
+        rt.end_tick()
+        assert rt.stats.full_collections == 1
+        assert gc.get_count()[2] == 0
+
+
+def test_cli_rejects_realtime_with_async(capsys):
+    with pytest.raises(SystemExit):
+        main(["--async", "--runtime", "0", "--realtime", "--pin-cpus", "0"])
+    assert "--realtime, --pin-cpus not supported with --async" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["--runtime", "0", "--pin-cpus", "0"])
+    assert "--pin-cpus requires --realtime" in capsys.readouterr().err
@@ -0,0 +1,72 @@
+from dataclasses import replace
+
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import GestureDecoder
+from control.state_machine import SterilizationController
+from hardware.arm import QArmStub
+from safety.interlocks import InterlockInputs, SafetySupervisor
+from sim import VirtualClock, scripted_cycle, virtual_time
+from sim.replay import RecordingEMGReader, SessionRecorder, load_session, replay_session
+
+
+def _build(emg):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=emg,
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=SafetySupervisor(),
+    )
+
+
+def test_replay_reproduces_event_stream(tmp_path):
+    path = tmp_path / "session.mmrec"
+    recorder = SessionRecorder(path)
+    clock = VirtualClock(1000.0)
+    live = []
+    with virtual_time(clock):
+        ctl = _build(scripted_cycle())
+        ctl.emg = RecordingEMGReader(ctl.emg, recorder, ctl.safety, clock=clock.time)
+        broken_at = None
+        for n in range(400):
+            if broken_at is None and ctl.state.name == "SELECT_BIN":
+                broken_at = n
+                ctl.safety.inputs = InterlockInputs(light_curtain_clear=False)
+            elif broken_at is not None and n == broken_at + 3:
+                ctl.safety.inputs = InterlockInputs()
+            live.append(ctl.tick())
+            clock.sleep(0.02)
+    recorder.close()
+
+    records = load_session(path)
+    assert sum(1 for kind, _, _ in records if kind == 1) == 3
+    replayed = replay_session(path, _build)
+    assert replayed == live
+    assert len({e.state for e in live}) > 3
+
+
+def test_recorded_tuning_replays_and_truncated_tail_loads(tmp_path):
+    path = tmp_path / "tuned.mmrec"
+    recorder = SessionRecorder(path)
+    clock = VirtualClock(1000.0)
+    live = []
+    with virtual_time(clock):
+        ctl = _build(scripted_cycle())
+        ctl._decoder = GestureDecoder(ctl.thresholds, (0.0, 0.0), (0.5, 0.5))  # 0.45 peaks: below emg_on
+        ctl.emg = RecordingEMGReader(ctl.emg, recorder, ctl.safety, clock=clock.time, controller=ctl)
+        for n in range(600):
+            if n == 100:
+                assert ctl.apply_config(replace(ctl.thresholds, emg_on=0.4, emg_off=0.2), Speeds(grip_time_s=0.0))
+            live.append(ctl.tick())
+            clock.sleep(0.02)
+    recorder.close()
+
+    records = load_session(path)
+    assert [kind for kind, _, _ in records].count(2) == 2 and records[0][0] == 2
+    assert len({e.state for e in live[100:]}) > 3 and {e.state.name for e in live[:100]} == {"IDLE"}
+    assert replay_session(path, _build) == live
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-5])
+    assert len(load_session(path)) == len(records) - 1
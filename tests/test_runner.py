@@ -0,0 +1,56 @@
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.gesture import GestureDecoder
+from control.runner import run_controller
+from control.state_machine import State, SterilizationController
+from hardware.arm import QArmStub
+from safety.interlocks import SafetySupervisor
+from sim import ScriptedEMGSource, VirtualClock, virtual_time
+
+
+def _run(segments, sampling, safety=None, offsets=(0.0, 0.0), gains=(1.0, 1.0)):
+    with virtual_time(VirtualClock(0.0)):
+        ctl = SterilizationController(
+            arm=QArmStub(),
+            emg=ScriptedEMGSource(segments, repeat=False),
+            thresholds=Thresholds(),
+            waypoints=Waypoints(),
+            speeds=Speeds(),
+            safety=safety,
+        )
+        ctl._decoder = GestureDecoder(ctl.thresholds, offsets, gains)
+        return ctl, run_controller(ctl, sampling)
+
+
+def test_idle_rate_skips_ticks_and_wakes_on_activity():
+    segments = [((0.0, 0.0), 10.0), ((0.9, 0.0), 0.5), ((0.0, 0.0), 9.5)]
+    ctl, stats = _run(segments, Sampling(loop_hz=50, runtime_s=20, idle_hz=2))
+    assert ctl.state is State.SELECT_BIN
+    assert stats.wakes >= 1
+    assert stats.worst_wake_latency_s <= 0.5 + 1e-6
+    # ~20 idle ticks over the first 10 s, then full rate in SELECT_BIN.
+    assert 15 <= stats.idle_ticks <= 25
+    assert stats.tick_savings > 0.4
+
+
+def test_full_rate_without_idle_hz_and_in_active_states():
+    segments = [((0.0, 0.0), 20.0)]
+    _, stats = _run(segments, Sampling(loop_hz=50, runtime_s=4))
+    assert stats.idle_ticks == 0 and abs(stats.ticks - 200) <= 1
+
+    segments = [((0.0, 0.0), 0.5), ((0.9, 0.0), 0.5), ((0.0, 0.0), 20.0)]
+    ctl, stats = _run(segments, Sampling(loop_hz=50, runtime_s=4, idle_hz=2), SafetySupervisor())
+    assert ctl.state is State.SELECT_BIN
+    # After the wake the controller stays in SELECT_BIN, so the loop never slows again.
+    assert stats.idle_ticks <= 2
+
+
+def test_idle_decision_uses_the_operator_profile_scaling():
+    # Rest sits at 0.5 raw: above emg_off unscaled, zero after the profile's offset.
+    segments = [((0.5, 0.5), 10.0)]
+    _, stats = _run(segments, Sampling(loop_hz=50, runtime_s=10, idle_hz=2), offsets=(0.5, 0.5))
+    assert stats.idle_ticks >= 15
+
+    # A weak operator's press (0.3 raw, x3 gain) must wake the loop.
+    segments = [((0.0, 0.0), 5.0), ((0.3, 0.0), 0.5), ((0.0, 0.0), 4.5)]
+    ctl, stats = _run(segments, Sampling(loop_hz=50, runtime_s=10, idle_hz=2), gains=(3.0, 3.0))
+    assert ctl.state is State.SELECT_BIN and stats.wakes >= 1
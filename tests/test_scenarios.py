@@ -0,0 +1,30 @@
+from sim.scenarios import Scenario, build_matrix, run_matrix, run_scenario
+
+
+def test_matrix_runs_across_processes_without_violations():
+    scenarios = build_matrix(
+        ["scripted_cycle", "operator"], ["default"], ["bench", "integration"], ["none", "estop"], duration_s=60.0
+    )
+    assert len(scenarios) == 8
+    report = run_matrix(scenarios, workers=2, slowest=3)
+    assert report.ok, [(r.name, r.violations, r.error) for r in report.failed]
+    assert report.total == 8
+    assert len(report.slowest) == 3
+    assert report.cycles_completed > 0
+
+
+def test_scenario_is_deterministic_and_reports_crashes():
+    sc = Scenario("operator", "sensitive", "bench", "light_curtain", seed=2, duration_s=60.0)
+    a, b = run_scenario(sc), run_scenario(sc)
+    assert (a.ticks, a.cycles_completed, a.fault_at_s) == (b.ticks, b.cycles_completed, b.fault_at_s)
+
+    broken = run_scenario(Scenario("operator", "default", "no-such-adapter"))
+    assert not broken.ok and "no-such-adapter" in broken.error
+
+
+def test_stuck_state_fails_the_liveness_invariant():
+    # Tremor rarely produces the two-channel OPEN_DOOR the autoclave step waits for.
+    result = run_scenario(Scenario("tremor", "default", "bench", duration_s=60.0))
+    assert not result.ok and result.violation_counts.get("liveness")
+    relaxed = run_scenario(Scenario("tremor", "default", "bench", duration_s=60.0, max_state_dwell_s=600.0))
+    assert "liveness" not in relaxed.violation_counts
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from hardware.workspace import WorkspaceGrid
+from sequences import MANUFACTURING_VALIDATION, STERILIZATION_AUTOMATION
+from sequences.registry import SequenceRegistry, default_registry, dump_sequence, sequence_from_dict, sequence_to_dict
+
+
+def test_packaged_library_matches_python_sequences():
+    registry = default_registry()
+    assert registry.get("sterilization_automation") == STERILIZATION_AUTOMATION
+    assert registry.get("manufacturing_validation@1.0.0") == MANUFACTURING_VALIDATION
+
+
+def test_lazy_versions_and_hash_cache(tmp_path):
+    v1 = sequence_from_dict(sequence_to_dict(MANUFACTURING_VALIDATION))
+    dump_sequence(v1, tmp_path)
+    v1.version = "1.10.0"
+    path = dump_sequence(v1, tmp_path)
+    (tmp_path / "broken@0.1.json").write_text("{not json")
+    registry = SequenceRegistry(tmp_path)
+    assert registry.versions("manufacturing_validation") == ["1.0.0", "1.10.0"]
+    assert registry.misses == 0  # indexing reads file names only
+    assert registry.get("manufacturing_validation").version == "1.10.0"
+    registry.get("manufacturing_validation@1.10.0")
+    assert (registry.hits, registry.misses) == (1, 1)
+
+    doc = json.loads(path.read_text())
+    doc["steps"][1]["speed"] = 0.3
+    path.write_text(json.dumps(doc))
+    assert registry.get("manufacturing_validation@1.10.0").steps[1].speed == 0.3
+    assert registry.misses == 2
+    with pytest.raises(KeyError):
+        registry.get("manufacturing_validation@2.0.0")
+    with pytest.raises(ValueError):
+        registry.get("broken")
+
+
+def test_prerelease_sorts_below_its_release(tmp_path):
+    seq = sequence_from_dict(sequence_to_dict(MANUFACTURING_VALIDATION))
+    for version in ("1.0.0-rc1", "1.0.0", "1.0.0-rc.2", "0.9.0", "1.0.0-alpha"):
+        seq.version = version
+        dump_sequence(seq, tmp_path)
+    registry = SequenceRegistry(tmp_path)
+    ordered = ["0.9.0", "1.0.0-alpha", "1.0.0-rc.2", "1.0.0-rc1", "1.0.0"]
+    assert registry.versions("manufacturing_validation") == ordered
+    assert registry.get("manufacturing_validation").version == "1.0.0"
+
+
+def test_cache_hits_still_check_name_and_version(tmp_path):
+    path = dump_sequence(sequence_from_dict(sequence_to_dict(MANUFACTURING_VALIDATION)), tmp_path)
+    (tmp_path / "manufacturing_validation@9.9.9.json").write_bytes(path.read_bytes())
+    (tmp_path / "other@1.0.0.json").write_bytes(path.read_bytes())
+    registry = SequenceRegistry(tmp_path)
+    assert registry.get("manufacturing_validation@1.0.0").version == "1.0.0"
+    with pytest.raises(ValueError, match="not other@1.0.0"):
+        registry.get("other@1.0.0")
+    with pytest.raises(ValueError, match="not manufacturing_validation@9.9.9"):
+        registry.get("manufacturing_validation")  # newest file name, older contents
+    assert registry.hits == 2
+
+
+def test_validation_rejects_bad_files(tmp_path):
+    base = sequence_to_dict(STERILIZATION_AUTOMATION)
+    for mutate in (
+        lambda d: d["steps"][1].update(kind="TELEPORT"),
+        lambda d: d["steps"][1].update(pose=[0.3, 0.1]),
+        lambda d: d["steps"][1].update(speed=2.0),
+        lambda d: d["steps"][0].update(pose=[0.3, 0.1, 0.1]),
+        lambda d: d.update(name="other"),
+    ):
+        doc = json.loads(json.dumps(base))
+        mutate(doc)
+        (tmp_path / "sterilization_automation@9.json").write_text(json.dumps(doc))
+        with pytest.raises(ValueError):
+            SequenceRegistry(tmp_path).get("sterilization_automation@9")
+
+
+def test_workspace_checked_at_load(tmp_path):
+    doc = sequence_to_dict(STERILIZATION_AUTOMATION)
+    doc["version"], doc["steps"][1]["pose"] = "2.0.0", [0.6, -0.1, 0.2]
+    (tmp_path / "sterilization_automation@2.0.0.json").write_text(json.dumps(doc))
+    registry = SequenceRegistry(tmp_path, workspace=WorkspaceGrid.build())
+    with pytest.raises(ValueError, match="autoclave_body"):
+        registry.get("sterilization_automation")
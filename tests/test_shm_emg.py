@@ -0,0 +1,64 @@
+import time
+
+from hardware.shm_emg import EMGProducer, SharedMemoryEMGReader, ShmRing, SyntheticRawEMG, block_features
+from safety.interlocks import SafetySupervisor
+
+
+def test_ring_publishes_blocks_and_features_zero_copy():
+    ring = ShmRing.create(block_samples=8, slots=4)
+    try:
+        reader = SharedMemoryEMGReader(ShmRing.attach(ring.name))
+        assert reader.latest_block(0) is None  # nothing read yet
+        for i in range(6):
+            columns = [[0.1 * i] * 8, [0.05] * 8]
+            ring.write_block(columns, block_features(columns), t=i * 0.008)
+        ch1, ch2 = reader.read()
+        assert abs(ch1 - 0.5) < 1e-6 and abs(ch2 - 0.05) < 1e-6
+        idx, view = reader.latest_block(0)
+        assert idx == 5 and len(view) == 8 and abs(view[0] - 0.5) < 1e-6
+        assert ring.block_valid(idx)
+        view.release()
+        reader.ring.close()
+    finally:
+        ring.close()
+
+
+def test_stale_producer_trips_safety_once():
+    ring = ShmRing.create(block_samples=4)
+    now = [100.0]
+    safety = SafetySupervisor()
+    try:
+        reader = SharedMemoryEMGReader(ring, safety=safety, stale_s=0.2, clock=lambda: now[0])
+        ring.write_block([[0.9] * 4, [0.0] * 4], [0.9, 0.9, 0.0, 0.0], t=0.0)
+        ring.heartbeat(now=100.0)
+        assert reader.read() == (0.8999999761581421, 0.0)
+        now[0] = 100.5
+        assert reader.read() == (0.0, 0.0)
+        assert reader.read() == (0.0, 0.0)
+        assert reader.trips == 1
+        assert safety.fault_counts == {"emg_stale": 1} and not safety.motion_allowed()
+    finally:
+        ring.close()
+
+
+def test_producer_process_feeds_reader_and_death_is_detected():
+    source = SyntheticRawEMG(pattern=[((0.8, 0.1), 1.0)], noise=0.0)
+    producer = EMGProducer(source, block_samples=16, sample_rate=1600.0).start()
+    safety = SafetySupervisor()
+    reader = SharedMemoryEMGReader(producer.ring, safety=safety, stale_s=0.3)
+    try:
+        deadline = time.monotonic() + 5.0
+        while reader.last_index < 3 and time.monotonic() < deadline:
+            reader.read()
+            time.sleep(0.01)
+        ch1, ch2 = reader.read()
+        assert abs(ch1 - 0.8) < 1e-3 and abs(ch2 - 0.1) < 1e-3
+        assert safety.motion_allowed()
+
+        producer.process.kill()
+        producer.process.join()
+        time.sleep(0.4)
+        assert reader.read() == (0.0, 0.0)
+        assert not safety.motion_allowed()
+    finally:
+        producer.stop()
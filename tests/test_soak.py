@@ -0,0 +1,51 @@
+from control.config import Speeds, Thresholds, Waypoints
+from control.state_machine import SterilizationController
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import DutyCyclePolicy, SafetySupervisor
+from sim.soak import InvariantMonitor, SoakConfig, run_soak
+
+
+def test_short_soak_completes_cycles_without_violations():
+    report = run_soak(SoakConfig(hours=0.25, seed=3, faults_per_hour=40.0, track_memory=False))
+    assert report.ok, report.violations
+    assert report.cycles_completed > 5
+    assert sum(report.faults_injected.values()) > 0
+    assert report.virtual_s >= 0.25 * 3600
+
+
+def test_soak_reports_runtime_ceiling():
+    duty = DutyCyclePolicy(max_continuous_runtime_s=300.0)
+    config = SoakConfig(hours=0.2, seed=1, faults_per_hour=0.0, duty=duty, session_breaks=False, track_memory=False)
+    report = run_soak(config)
+    assert report.refusals.get("duty cycle: max_continuous_runtime exceeded", 0) > 0
+    assert any("max_continuous_runtime" in f for f in report.findings)
+    assert report.ok
+
+
+def test_operator_breaks_keep_the_cell_cycling_every_hour():
+    duty = DutyCyclePolicy(max_continuous_runtime_s=1800.0)
+    report = run_soak(SoakConfig(hours=3.0, seed=2, faults_per_hour=0.0, duty=duty, track_memory=False))
+    assert report.ok, report.violations
+    assert report.session_breaks >= 3
+    assert all(n > 0 for n in report.cycles_per_hour), report.cycles_per_hour
+    assert "duty cycle: max_continuous_runtime exceeded" not in report.refusals
+    assert report.findings == []
+
+
+def test_monitor_flags_motion_while_blocked():
+    safety = SafetySupervisor()
+    ctl = SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=safety,
+    )
+    monitor = InvariantMonitor(ctl, safety)
+    arm = monitor.probe(QArmStub())
+    safety.latch_estop()
+    arm.home()
+    arm.move_pose(0.1, 0.1, 0.1)
+    assert monitor.counts["motion_gating"] == 1
@@ -0,0 +1,50 @@
+from control.config import Speeds, Thresholds, Waypoints
+from control.gesture import Intent
+from control.state_machine import TRANSITIONS, State, SterilizationController, validate_transitions
+from control.transitions import Transition, validate_table
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+
+
+def _controller(**kwargs):
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        **kwargs,
+    )
+
+
+def test_transition_table_is_sound():
+    assert validate_transitions() == []
+
+
+def test_validator_flags_unreachable_and_missing_abort():
+    rows = [t for t in TRANSITIONS if State.CLOSE_AUTOCLAVE not in (t.source, t.target)]
+    rows.append(Transition(State.PLACE, Intent.GRIP, State.HOME))
+    problems = validate_table(rows, State, initial=State.IDLE, abort_intent=Intent.ABORT)
+    assert "CLOSE_AUTOCLAVE: unreachable from IDLE" in problems
+    assert "CLOSE_AUTOCLAVE: missing ABORT transition" in problems
+
+
+def test_abort_intent_homes_from_any_state(monkeypatch):
+    ctl = _controller()
+    ctl.state = State.TRANSIT
+    ctl.arm.pose = (1, 1, 1, 0, 0, 0)
+    monkeypatch.setattr(ctl.decoder, "intent", lambda: Intent.ABORT)
+    event = ctl.tick()
+    assert event.state == State.IDLE
+    assert ctl.arm.pose == (0, 0, 0, 0, 0, 0)
+
+
+def test_emit_on_change_reuses_event(monkeypatch):
+    ctl = _controller(emit_on_change=True, reuse_event=True)
+    first = ctl.tick()
+    assert first is not None
+    assert ctl.tick() is None
+    monkeypatch.setattr(ctl.decoder, "intent", lambda: Intent.START)
+    second = ctl.tick()
+    assert second is first
+    assert second.state == State.SELECT_BIN
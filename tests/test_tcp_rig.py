@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from hardware.adapters import TcpRigAdapter
+from hardware.adapters.tcp_rig import RigError
+from hardware.rig_server import EMG_HEADER, EMG_REQUEST, MAX_EMG_BATCH, OP_EMG, RigServer, RigState
+from hardware.shm_emg import SyntheticRawEMG
+from safety.interlocks import InterlockInputs, SafetyFault
+
+
+@pytest.fixture
+def rig():
+    server = RigServer(port=0, state=RigState(SyntheticRawEMG(pattern=[((0.7, 0.2), 1.0)], noise=0.0))).start()
+    adapter = TcpRigAdapter(*server.address)
+    adapter.set_bench_signoff("TEST-001")
+    adapter.connect()
+    yield server, adapter
+    adapter.close()
+    server.close()
+
+
+def test_arm_commands_round_trip(rig):
+    server, adapter = rig
+    arm = adapter.arm()
+    arm.move_pose(0.3, 0.1, 0.2, speed=0.4)
+    arm.close_gripper()
+    assert server.state.arm.gripper_closed
+    assert arm.read_pose()[:3] == pytest.approx((0.3, 0.1, 0.2))
+    arm.home()
+    assert server.state.arm.pose == (0, 0, 0, 0, 0, 0)
+
+
+def test_poll_batches_emg_and_inputs_in_one_round_trip(rig):
+    _, adapter = rig
+    conn = adapter.connection
+    time.sleep(0.05)
+    before = conn.round_trips, conn.requests
+    ch1, ch2 = adapter.emg().read()
+    assert (conn.round_trips - before[0], conn.requests - before[1]) == (1, 2)
+    assert (ch1, ch2) == pytest.approx((0.7, 0.2))
+    assert 20 <= len(adapter.last_block) <= adapter.emg_batch
+
+    inputs = adapter.safety().inputs
+    adapter.poll()
+    assert adapter.safety().inputs is inputs  # unchanged inputs keep their identity
+    adapter.set_inputs(InterlockInputs(light_curtain_clear=False))
+    adapter.poll()
+    assert not adapter.safety().inputs.light_curtain_clear
+    assert not adapter.safety().motion_allowed()
+
+
+def test_errors_and_link_loss(rig):
+    server, adapter = rig
+    with pytest.raises(RigError):
+        adapter.connection.call(99)
+    adapter.poll()  # the connection survives an error reply
+
+    server.close()
+    adapter.close()
+    reader = adapter.emg()
+    assert reader.read() == (0.0, 0.0)
+    assert adapter.link_down and adapter.safety().fault_counts == {"rig_link": 1}
+
+
+
+def test_connect_requires_bench_signoff():
+    server = RigServer(port=0).start()
+    try:
+        with pytest.raises(RuntimeError, match="sign-off"):
+            TcpRigAdapter(*server.address).connect()
+        with pytest.raises(ValueError):
+            TcpRigAdapter(*server.address, emg_batch=MAX_EMG_BATCH + 1)
+    finally:
+        server.close()
+
+
+def test_dead_link_during_a_move_latches_the_fault(rig):
+    server, adapter = rig
+    arm = adapter.arm()
+    server.close()
+    adapter.connection.close()
+    with pytest.raises(SafetyFault):
+        arm.move_pose(0.3, 0.1, 0.2)
+    with pytest.raises(SafetyFault):
+        arm.home()
+    assert adapter.link_down and adapter.safety().fault_counts == {"rig_link": 1}
+    assert not adapter.safety().motion_allowed()
+
+
+def test_server_clamps_oversized_emg_batches():
+    # Enough buffered samples that an unclamped reply would overflow the u16 length.
+    server = RigServer(port=0, state=RigState(emg_rate=1_000_000.0, emg_buffer=20_000)).start()
+    adapter = TcpRigAdapter(*server.address)
+    adapter.set_bench_signoff("TEST-001")
+    try:
+        adapter.connect()
+        time.sleep(0.03)
+        body = adapter.connection.call(OP_EMG, EMG_REQUEST.pack(0xFFFF))
+        assert EMG_HEADER.unpack_from(body, 0)[0] == MAX_EMG_BATCH
+        adapter.poll()  # the connection is still up
+    finally:
+        adapter.close()
+        server.close()
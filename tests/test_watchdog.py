@@ -0,0 +1,106 @@
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from control.config import Sampling, Speeds, Thresholds, Waypoints
+from control.runner import run_controller
+from control.state_machine import State, SterilizationController
+from control.watchdog import Escalation, Watchdog
+from hardware.arm import QArmStub
+from hardware.emg import StaticEMGSource
+from safety.interlocks import SafetyFault, SafetySupervisor
+from sim.soak import SyntheticOperator
+
+
+def _controller():
+    return SterilizationController(
+        arm=QArmStub(),
+        emg=StaticEMGSource(),
+        thresholds=Thresholds(),
+        waypoints=Waypoints(),
+        speeds=Speeds(),
+        safety=SafetySupervisor(),
+    )
+
+
+def test_escalates_in_order_and_recovers():
+    ctl = _controller()
+    dog = Watchdog(ctl, period_s=0.01)
+    dog.beat()
+    t0 = dog._last_beat
+    assert dog.check(t0 + 0.02) is Escalation.NONE
+    assert dog.check(t0 + 0.05) is Escalation.LOG
+    assert dog.check(t0 + 0.30) is Escalation.INHIBIT
+    assert dog.shedding
+    with pytest.raises(SafetyFault, match="inhibited"):
+        ctl.safety.require_cycle_start()
+    assert not ctl.safety._fault_latched
+
+    dog._last_beat -= 0.3  # the stalled iteration finally completes
+    dog.beat()
+    assert dog.check(dog._last_beat) is Escalation.NONE
+    assert not dog.shedding
+    ctl.safety.require_cycle_start()
+    assert dog.escalations == {"LOG": 1, "SHED": 1, "INHIBIT": 1, "FAULT": 0}
+    assert dog.overruns and dog.overruns[-1].state == "IDLE"
+
+
+def test_fault_latches_and_loop_thread_homes():
+    ctl = _controller()
+    ctl.state = State.TRANSIT
+    ctl.arm.pose = (0.4, 0.1, 0.2, 0, 0, 0)
+    dog = Watchdog(ctl, period_s=0.001, poll_s=0.001).start()
+    try:
+        time.sleep(0.3)  # no beats: the loop is "hung"
+    finally:
+        dog.stop()
+    assert dog.escalations["FAULT"] == 1
+    assert ctl.safety._fault_latched and "watchdog" in ctl.safety._last_fault
+    assert ctl.arm.pose == (0.4, 0.1, 0.2, 0, 0, 0)  # the watchdog thread never drives the arm
+    ctl.tick()  # the loop comes back: abort and home on its own thread
+    assert ctl.state is State.IDLE and ctl.arm.pose == (0, 0, 0, 0, 0, 0)
+
+
+class _WallClockReader:
+    """Drives a SyntheticOperator on the wall clock."""
+
+    def __init__(self, operator):
+        self.operator = operator
+
+    def read(self):
+        self.operator.clock.now = time.monotonic()
+        return self.operator.read()
+
+
+def test_full_cycle_blocking_steps_do_not_escalate():
+    ctl = _controller()
+    operator = SyntheticOperator(
+        SimpleNamespace(now=0.0),
+        random.Random(0),
+        ctl.thresholds,
+        think_s=(0.05, 0.05),
+        idle_gap_s=(0.05, 0.05),
+        abort_prob=0.0,
+    )
+    operator.controller = ctl
+    ctl.emg = _WallClockReader(operator)
+    sampling = Sampling(loop_hz=250.0, runtime_s=4.0)
+    dog = Watchdog(ctl, 1.0 / sampling.loop_hz).start()
+    states = []
+    try:
+        run_controller(
+            ctl, sampling, event_sink=SimpleNamespace(append=lambda ev: states.append(ev.state)), watchdog=dog
+        )
+    finally:
+        dog.stop()
+    assert State.CLOSE_AUTOCLAVE in states and State.IDLE in states[states.index(State.CLOSE_AUTOCLAVE) :]
+    assert dog.escalations == {"LOG": 0, "SHED": 0, "INHIBIT": 0, "FAULT": 0}
+    assert ctl.block_hook is None
+
+
+def test_announced_idle_sleep_is_not_a_stall():
+    dog = Watchdog(_controller(), period_s=0.01)
+    dog.beat(next_sleep_s=0.5)
+    assert dog.check(dog._last_beat + 0.45) is Escalation.NONE
@@ -0,0 +1,80 @@
+import pytest
+
+from control.cli import build_controller, build_parser
+from control.config import Speeds, Thresholds, Waypoints, cycle_points
+from control.live_config import parse_config
+from hardware.arm import QArmStub
+from hardware.safeguarded_arm import SafeguardedArm
+from hardware.workspace import CellGeometry, KeepOut, WorkspaceGrid, WorkspaceViolation
+from safety.interlocks import SafetySupervisor
+from sequences import MANUFACTURING_VALIDATION, STERILIZATION_AUTOMATION, run_sequence_on_arm, validate_sequence
+from sequences.motion_sequences import MotionSequence, MotionStep, StepKind
+
+PILLAR = CellGeometry(keep_out=(KeepOut("pillar", (0.30, -0.02, 0.0), (0.34, 0.02, 0.5)),))
+
+
+@pytest.fixture(scope="module")
+def grid():
+    return WorkspaceGrid.build()
+
+
+def test_default_cell_covers_existing_waypoints_and_sequences(grid):
+    assert grid.check_path(*cycle_points(Waypoints())) == []
+    assert validate_sequence(STERILIZATION_AUTOMATION, grid) == []
+    assert validate_sequence(MANUFACTURING_VALIDATION, grid) == []
+
+
+def test_point_and_segment_checks():
+    grid = WorkspaceGrid.build(PILLAR)
+    assert grid.contains(0.32, -0.15, 0.2)
+    assert grid.why(0.32, 0.0, 0.2) == "keep-out zone 'pillar'"
+    assert grid.why(0.0, 0.0, 0.05) == "outside reach"
+    assert grid.why(5.0, 0.0, 0.1) == "outside reach"
+    assert grid.check_segment((0.32, -0.15, 0.2), (0.32, -0.08, 0.2)) is None
+    assert "pillar" in grid.check_segment((0.32, -0.15, 0.2), (0.32, 0.15, 0.2))
+
+
+def test_grid_is_cached_and_memory_mapped(tmp_path):
+    built = WorkspaceGrid.load_or_build(PILLAR, cache_dir=tmp_path)
+    loaded = WorkspaceGrid.load_or_build(PILLAR, cache_dir=tmp_path)
+    assert loaded.path == built.path and loaded._mm is not None
+    assert bytes(loaded.data) == bytes(built.data)
+    loaded.close()
+    other = WorkspaceGrid.load_or_build(CellGeometry(resolution_m=0.02), cache_dir=tmp_path)
+    assert other.path != built.path
+
+
+def test_safeguarded_arm_rejects_before_issuing():
+    inner = QArmStub()
+    arm = SafeguardedArm(inner, SafetySupervisor(), workspace=WorkspaceGrid.build(PILLAR))
+    arm.move_pose(0.32, -0.15, 0.2)
+    with pytest.raises(WorkspaceViolation, match="pillar"):
+        arm.move_pose(0.32, 0.15, 0.2)
+    assert inner.pose[:3] == (0.32, -0.15, 0.2) and len(arm.motion_log) == 1
+    arm.home()
+    with pytest.raises(WorkspaceViolation, match="outside reach"):
+        arm.move_pose(0.9, 0.0, 0.2)
+
+
+def test_invalid_sequence_never_moves(grid):
+    bad = MotionSequence(
+        "bad", "0.1", [MotionStep(StepKind.MOVE, (0.30, 0.18, 0.08)), MotionStep(StepKind.MOVE, (0.60, -0.10, 0.20))]
+    )
+    arm = QArmStub()
+    with pytest.raises(WorkspaceViolation, match="autoclave_body"):
+        run_sequence_on_arm(arm, bad, workspace=grid, step_delay_s=0.0)
+    assert arm.pose == (0, 0, 0, 0, 0, 0)
+
+
+def test_stub_run_and_live_waypoints_are_checked_against_the_grid(grid, monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSCLEMATE_CACHE", str(tmp_path))
+    controller = build_controller(build_parser().parse_args(["--demo", "--workspace"]), Thresholds())
+    assert isinstance(controller.arm, SafeguardedArm) and controller.arm.workspace is not None
+    with pytest.raises(WorkspaceViolation):
+        controller.arm.move_pose(0.0, 0.0, 0.05)
+
+    doc = {"waypoints": {"bins": [[0.0, 0.0, 0.05]]}}
+    assert parse_config(doc, Thresholds(), Speeds(), Waypoints()).waypoints.bins == ((0.0, 0.0, 0.05),)
+    with pytest.raises(ValueError, match="outside the workspace"):
+        parse_config(doc, Thresholds(), Speeds(), Waypoints(), workspace=grid)
+    assert parse_config({"thresholds": {"emg_on": 0.7}}, Thresholds(), Speeds(), Waypoints(), workspace=grid)